@@ -0,0 +1,143 @@
+"""
+JSON Serialization Benchmark
+응답 직렬화 경로별 처리량(bytes/sec) 비교
+- default: response_model 재검증 + json.dumps (FastAPI 기본 경로)
+- orjson: 재검증 유지, FastJSONResponse로 인코딩 (FAST_JSON=true의 기본 응답 클래스)
+- trusted: 재검증 없이 pydantic-core로 바로 직렬화 (trusted_response)
+
+대상: 섹션을 부풀린 대용량 보고서 1건, 아이디어 100건 목록
+
+사용법 (backend 디렉터리에서):
+    python -m benchmarks.bench_json_serialization
+    python -m benchmarks.bench_json_serialization --repeat 500 --scale 50
+"""
+import argparse
+import json
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Callable
+
+from pydantic import BaseModel, TypeAdapter
+
+from src.api.v1.schemas import IdeaListResponse, ReportResponse
+from src.core.responses import FastJSONResponse, orjson
+from src.models import Analysis, AnalysisStatus, Idea, IdeaStatus, Report, ReportStatus, ReportType
+from src.services import IdeaService, ReportService
+
+
+def build_report(scale: int) -> ReportResponse:
+    """모든 섹션이 채워진 보고서 (목록형 섹션을 scale배로 늘림)"""
+    service = ReportService(None)
+    idea = Idea(id=uuid.uuid4(), title="대용량 보고서 아이디어")
+    analysis = Analysis(idea_id=idea.id, status=AnalysisStatus.COMPLETED, overall_score=72)
+    report = Report(
+        id=uuid.uuid4(),
+        idea_id=idea.id,
+        status=ReportStatus.COMPLETED,
+        report_type=ReportType.DETAILED,
+        created_at=datetime.utcnow(),
+        completed_at=datetime.utcnow()
+    )
+    for section in service.SECTIONS:
+        for column, value in getattr(service, f"_build_{section}")(analysis, idea).items():
+            setattr(report, column, value)
+
+    report.action_items = report.action_items * scale
+    report.key_insights = report.key_insights * scale
+    for key in ("direct_competitors", "indirect_competitors"):
+        if key in report.competition_analysis:
+            report.competition_analysis = {
+                **report.competition_analysis,
+                key: report.competition_analysis[key] * scale
+            }
+    return service._to_response(report)
+
+
+def build_idea_list(count: int) -> IdeaListResponse:
+    service = IdeaService(None)
+    now = datetime.utcnow()
+    ideas = [
+        service._to_response(Idea(
+            id=uuid.uuid4(),
+            user_id=uuid.uuid4(),
+            title=f"아이디어 {i}",
+            description="반려동물 보호자를 위한 AI 기반 건강 관리 서비스 " * 5,
+            problem="반려동물 건강 이상을 조기에 발견하기 어렵다 " * 3,
+            target_customer="20-40대 반려동물 보호자",
+            value_proposition="사진 한 장으로 건강 상태 점검",
+            status=IdeaStatus.CREATED,
+            created_at=now,
+            updated_at=now
+        ))
+        for i in range(count)
+    ]
+    return IdeaListResponse(ideas=ideas, total=count, page=1, page_size=count)
+
+
+def default_path(model: BaseModel) -> bytes:
+    """FastAPI 기본: 모델 → dict → response_model 검증 → JSON 모드 dict → json.dumps"""
+    adapter = TypeAdapter(type(model))
+    value = adapter.validate_python(model.model_dump(by_alias=True))
+    content = adapter.dump_python(value, mode="json", by_alias=True)
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+def orjson_path(model: BaseModel) -> bytes:
+    """재검증은 유지하고 FastJSONResponse로 인코딩"""
+    adapter = TypeAdapter(type(model))
+    value = adapter.validate_python(model.model_dump(by_alias=True))
+    return FastJSONResponse(adapter.dump_python(value, mode="json", by_alias=True)).body
+
+
+def trusted_path(model: BaseModel) -> bytes:
+    """재검증 없이 직렬화 (trusted_response와 같은 경로)"""
+    return FastJSONResponse(model).body
+
+
+def measure(fn: Callable[[BaseModel], bytes], model: BaseModel, repeat: int) -> float:
+    """초당 바이트"""
+    fn(model)
+    total = 0
+    started = time.perf_counter()
+    for _ in range(repeat):
+        total += len(fn(model))
+    return total / (time.perf_counter() - started)
+
+
+def same_json(a: bytes, b: bytes) -> bool:
+    return json.loads(a) == json.loads(b)
+
+
+def run(repeat: int, scale: int, ideas: int) -> None:
+    print(f"orjson: {'사용' if orjson is not None else '미설치 (pydantic-core로 인코딩)'}")
+    for name, model in (
+        (f"report (x{scale})", build_report(scale)),
+        (f"idea list ({ideas})", build_idea_list(ideas)),
+    ):
+        baseline = default_path(model)
+        for path in (orjson_path, trusted_path):
+            assert same_json(baseline, path(model)), f"{path.__name__} 결과가 기본 경로와 다릅니다"
+
+        rates: dict[str, Any] = {
+            path.__name__.removesuffix("_path"): measure(path, model, repeat)
+            for path in (default_path, orjson_path, trusted_path)
+        }
+        summary = ", ".join(
+            f"{label} {rate / 1024 / 1024:.1f}MB/s (x{rate / rates['default']:.2f})"
+            for label, rate in rates.items()
+        )
+        print(f"{name}: body {len(baseline) / 1024:.1f}KB | {summary}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--scale", type=int, default=20, help="보고서 목록형 섹션 배수")
+    parser.add_argument("--ideas", type=int, default=100)
+    args = parser.parse_args()
+    run(args.repeat, args.scale, args.ideas)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Password Hashing Benchmark
+동시 로그인 50건 처리 중 이벤트 루프 지연(p50/p99) 측정
+이벤트 루프가 막히면 같은 프로세스의 모든 요청(/health 포함)이 그만큼 늦어지므로,
+앱을 띄우지 않고 10ms 주기 프로브의 지연으로 측정한다.
+
+사용법 (backend 디렉터리에서):
+    python -m benchmarks.bench_password_hashing --logins 50
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from src.core.security import hash_password, verify_password, verify_password_async
+
+PROBE_INTERVAL = 0.01
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def login_inline(password: str, hashed: str) -> None:
+    """기존 방식: 이벤트 루프에서 bcrypt 실행"""
+    verify_password(password, hashed)
+
+
+async def login_executor(password: str, hashed: str) -> None:
+    """개선 방식: 전용 스레드 풀에서 bcrypt 실행"""
+    await verify_password_async(password, hashed)
+
+
+async def probe_loop(stop: asyncio.Event, latencies: list) -> None:
+    """PROBE_INTERVAL마다 깨어나 예정보다 늦어진 시간(ms)을 기록"""
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(PROBE_INTERVAL)
+        latencies.append((time.perf_counter() - started - PROBE_INTERVAL) * 1000)
+
+
+async def run(mode: str, logins: int) -> None:
+    password = "benchmark-password"
+    hashed = hash_password(password)
+    login = login_inline if mode == "inline" else login_executor
+
+    latencies: list = []
+    stop = asyncio.Event()
+
+    probe = asyncio.create_task(probe_loop(stop, latencies))
+    await asyncio.sleep(0.05)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(login(password, hashed) for _ in range(logins)))
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    await probe
+
+    print(f"[{mode}] logins={logins} elapsed={elapsed:.2f}s probe_samples={len(latencies)}")
+    print(
+        f"[{mode}] event loop lag p50={statistics.median(latencies):.1f}ms "
+        f"p99={percentile(latencies, 99):.1f}ms max={max(latencies):.1f}ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--logins", type=int, default=50)
+    parser.add_argument("--mode", choices=["inline", "executor", "both"], default="both")
+    args = parser.parse_args()
+
+    modes = ["inline", "executor"] if args.mode == "both" else [args.mode]
+    for mode in modes:
+        asyncio.run(run(mode, args.logins))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+"""
+Data Collector Check
+지연을 주입한 스텁 소스로 동시 수집기(DataCollector)와 수집 작업(IdeaService.collect_data) 확인
+
+1. 동시 수집: 전체 소요 시간이 소스 지연의 합이 아니라 가장 느린 소스에 가깝다
+2. 소스 타임아웃: 느린 소스만 timeout으로 실패하고 나머지는 성공
+3. 소스 오류: 예외를 낸 소스만 실패하고 나머지는 성공
+4. 전체 타임아웃: 끝나지 않은 소스는 취소되고 결과에 cancelled로 남는다
+5. 부분 실패 후 재시도: 성공한 소스는 저장되고, 재시도에서는 실패한 소스만 다시 수집한다
+
+사용법 (backend 디렉터리에서):
+    python -m benchmarks.check_data_collector
+    python -m benchmarks.check_data_collector --latency 0.5
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+from typing import Any, Dict, List, Tuple
+
+from benchmarks.tempdb import database_url
+
+# 소스별 지연 배수 (IdeaService.COLLECT_TASKS 순서, --latency를 곱함)
+LATENCY_STEPS = {
+    "market_data": 1.0,
+    "competitor_data": 0.8,
+    "customer_insights": 0.6,
+    "regulation_data": 0.4,
+    "technology_trend": 0.3,
+    "profitability_benchmark": 0.2,
+}
+
+
+def stub_source(name: str, delay: float, fail: bool = False):
+    """delay초 뒤 결과를 반환하는 스텁 소스 (fail이면 예외)"""
+    async def source(context: Dict[str, Any]) -> Dict[str, Any]:
+        await asyncio.sleep(delay)
+        if fail:
+            raise ConnectionError(f"{name} 연결 실패")
+        return {"source": name, "query": context.get("title"), "items": [{"delay": delay}]}
+    return source
+
+
+def stub_sources(latency: float, **overrides: Tuple[float, bool]) -> Dict[str, Any]:
+    """기본 지연의 스텁 소스 (overrides: 이름 → (지연, 실패 여부))"""
+    return {
+        name: stub_source(name, *overrides.get(name, (step * latency, False)))
+        for name, step in LATENCY_STEPS.items()
+    }
+
+
+def run(latency: float) -> int:
+    from src.services.data_collector import DataCollector
+
+    steps: List[Tuple[str, bool, str]] = []
+    context = {"title": "스텁 수집 점검"}
+    slowest = max(LATENCY_STEPS.values()) * latency
+    total = sum(LATENCY_STEPS.values()) * latency
+    margin = 0.25 * latency
+
+    # 1. 동시 수집
+    collector = DataCollector(stub_sources(latency), source_timeout=slowest * 2)
+    order: List[str] = []
+    started = time.perf_counter()
+    results = asyncio.run(collector.collect(context, on_result=lambda result: order.append(result.name)))
+    elapsed = time.perf_counter() - started
+    steps.append((
+        "동시 수집",
+        all(result.ok for result in results) and elapsed < slowest + margin,
+        f"{elapsed:.2f}s (가장 느린 소스 {slowest:.2f}s, 합계 {total:.2f}s)"
+    ))
+    expected_order = sorted(LATENCY_STEPS, key=LATENCY_STEPS.get)
+    steps.append(("완료 순서대로 전달", order == expected_order, " → ".join(order)))
+
+    # 2. 소스 타임아웃
+    source_timeout = 0.5 * latency
+    collector = DataCollector(stub_sources(latency), source_timeout=source_timeout)
+    started = time.perf_counter()
+    results = {result.name: result for result in asyncio.run(collector.collect(context))}
+    elapsed = time.perf_counter() - started
+    timed_out = sorted(name for name, result in results.items() if result.error == "timeout")
+    expected = sorted(name for name, step in LATENCY_STEPS.items() if step * latency > source_timeout)
+    steps.append((
+        "소스 타임아웃",
+        timed_out == expected and elapsed < source_timeout + margin
+        and all(result.ok for name, result in results.items() if name not in expected),
+        f"timeout {timed_out}, {elapsed:.2f}s (source_timeout {source_timeout:.2f}s)"
+    ))
+
+    # 3. 소스 오류
+    collector = DataCollector(
+        stub_sources(latency, regulation_data=(0.1 * latency, True)),
+        source_timeout=slowest * 2
+    )
+    results = {result.name: result for result in asyncio.run(collector.collect(context))}
+    failed = {name: result.error for name, result in results.items() if not result.ok}
+    steps.append((
+        "소스 오류 격리",
+        list(failed) == ["regulation_data"] and len(results) == len(LATENCY_STEPS),
+        str(failed)
+    ))
+
+    # 4. 전체 타임아웃
+    total_timeout = 0.5 * latency
+    collector = DataCollector(stub_sources(latency), source_timeout=slowest * 2, total_timeout=total_timeout)
+    started = time.perf_counter()
+    results = {result.name: result for result in asyncio.run(collector.collect(context))}
+    elapsed = time.perf_counter() - started
+    cancelled = sorted(name for name, result in results.items() if result.error == "cancelled: total timeout")
+    steps.append((
+        "전체 타임아웃",
+        cancelled == expected and len(results) == len(LATENCY_STEPS) and elapsed < total_timeout + margin,
+        f"cancelled {cancelled}, {elapsed:.2f}s (total_timeout {total_timeout:.2f}s)"
+    ))
+
+    steps.extend(check_collect_job(latency, slowest))
+
+    failed_any = False
+    for name, ok, detail in steps:
+        failed_any |= not ok
+        print(f"{'✅' if ok else '❌'} {name}: {detail}")
+    return 1 if failed_any else 0
+
+
+def check_collect_job(latency: float, slowest: float) -> List[Tuple[str, bool, str]]:
+    """IdeaService.collect_data: 부분 실패 저장 후 재시도에서 실패한 소스만 다시 수집"""
+    from sqlalchemy.orm import undefer
+
+    from src.db.session import Base, SessionLocal, engine
+    from src.models import Idea, IdeaStatus, User
+    from src.services.data_collector import DataCollector
+    from src.services.idea_service import CollectionIncompleteError, IdeaService
+
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    with SessionLocal() as db:
+        user = User(email="collector@example.com", password="not-used", name="collector")
+        db.add(user)
+        db.flush()
+        idea = Idea(
+            user_id=user.id,
+            title="스텁 수집 점검",
+            description="설명",
+            problem="문제",
+            target_customer="고객",
+            status=IdeaStatus.COLLECTING
+        )
+        db.add(idea)
+        db.commit()
+        idea_id = idea.id
+
+    def load(db) -> Idea:
+        return db.query(Idea).filter(Idea.id == idea_id).options(undefer(Idea.collected_data)).one()
+
+    steps = []
+    calls: List[str] = []
+
+    def counted(sources: Dict[str, Any]) -> Dict[str, Any]:
+        def wrap(name, source):
+            async def run_source(context):
+                calls.append(name)
+                return await source(context)
+            return run_source
+        return {name: wrap(name, source) for name, source in sources.items()}
+
+    progress: List[Dict[str, Any]] = []
+    with SessionLocal() as db:
+        collector = DataCollector(
+            counted(stub_sources(latency, competitor_data=(0.1 * latency, True))),
+            source_timeout=slowest * 2
+        )
+        try:
+            IdeaService(db).collect_data(idea_id, on_progress=progress.append, collector=collector)
+            raised = None
+        except CollectionIncompleteError as exc:
+            raised = exc.failed_tasks
+    with SessionLocal() as db:
+        idea = load(db)
+        saved = sorted(idea.collected_data or {})
+        steps.append((
+            "부분 실패 저장",
+            raised == ["competitor_data"] and len(saved) == len(LATENCY_STEPS) - 1
+            and idea.status == IdeaStatus.COLLECTING,
+            f"실패 {raised}, 저장 {len(saved)}개, 진행 알림 {len(progress)}회"
+        ))
+
+    calls.clear()
+    with SessionLocal() as db:
+        collector = DataCollector(counted(stub_sources(latency)), source_timeout=slowest * 2)
+        IdeaService(db).collect_data(idea_id, collector=collector)
+    with SessionLocal() as db:
+        idea = load(db)
+        steps.append((
+            "재시도는 실패한 소스만",
+            calls == ["competitor_data"] and idea.status == IdeaStatus.COLLECTED
+            and len(idea.collected_data) == len(LATENCY_STEPS),
+            f"재수집 {calls}, 상태 {idea.status.value}"
+        ))
+    return steps
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--database-url", default=None, help="기본값: 임시 디렉터리의 SQLite 파일")
+    parser.add_argument("--latency", type=float, default=0.4, help="가장 느린 스텁 소스의 지연 (초)")
+    args = parser.parse_args()
+
+    with database_url(args.database_url, "check_data_collector") as url:
+        # 설정은 import 시점에 고정되므로 먼저 지정
+        os.environ["DATABASE_URL"] = url
+        os.environ["DB_ASYNC_MODE"] = "false"
+        os.environ["DEBUG"] = "false"
+        code = run(args.latency)
+    sys.exit(code)
+
+
+if __name__ == "__main__":
+    main()
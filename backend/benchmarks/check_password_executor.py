@@ -0,0 +1,104 @@
+"""
+Password Executor Check
+비밀번호 전용 스레드 풀(PasswordExecutor)의 대기열 슬롯 관리 확인
+
+1. 대기열 제한: 실행 중 max_workers개 + 대기 max_queue개를 넘으면 503
+2. 대기 중 취소: 취소된 요청의 슬롯이 바로 반납되고, 취소된 작업은 실행되지 않는다
+3. 실행 중 취소: 슬롯은 스레드의 작업이 실제로 끝난 뒤 반납된다
+4. 완료 후: 대기 / 실행 수가 모두 0으로 돌아온다
+
+사용법 (backend 디렉터리에서):
+    python -m benchmarks.check_password_executor
+"""
+import asyncio
+import sys
+import threading
+from typing import List, Tuple
+
+from src.core.exceptions import ServiceUnavailableException
+from src.core.security import PasswordExecutor
+
+WAIT_TIMEOUT = 5.0
+
+
+async def wait_until(predicate, timeout: float = WAIT_TIMEOUT) -> bool:
+    """predicate가 참이 될 때까지 대기 (스레드 풀 쪽 상태 변화 확인용)"""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not predicate():
+        if loop.time() > deadline:
+            return False
+        await asyncio.sleep(0.01)
+    return True
+
+
+async def run() -> int:
+    steps: List[Tuple[str, bool, str]] = []
+    executor = PasswordExecutor(max_workers=1, max_queue=3)
+    gate = threading.Event()
+    ran: List[int] = []
+
+    def blocking(index: int) -> int:
+        gate.wait(WAIT_TIMEOUT)
+        ran.append(index)
+        return index
+
+    def state() -> str:
+        return f"대기 {executor.queue_depth}, 실행 {executor._active}"
+
+    # 1. 대기열 제한 (실행 1 + 대기 3)
+    running = asyncio.create_task(executor.run(blocking, 0))
+    await wait_until(lambda: executor._active == 1)
+    waiting = [asyncio.create_task(executor.run(blocking, index)) for index in (1, 2, 3)]
+    await asyncio.sleep(0)
+    try:
+        await executor.run(blocking, 4)
+        rejected = False
+    except ServiceUnavailableException:
+        rejected = True
+    steps.append(("대기열 제한", rejected and executor.queue_depth == 3, state()))
+
+    # 2. 대기 중인 요청 3개 중 2개 취소
+    for task in waiting[:2]:
+        task.cancel()
+    await asyncio.gather(*waiting[:2], return_exceptions=True)
+    released = await wait_until(lambda: executor.queue_depth == 1)
+    steps.append(("대기 중 취소 시 슬롯 반납", released and executor._active == 1, state()))
+
+    admitted = [asyncio.create_task(executor.run(blocking, index)) for index in (5, 6)]
+    await asyncio.sleep(0)
+    try:
+        await executor.run(blocking, 7)
+        rejected = False
+    except ServiceUnavailableException:
+        rejected = True
+    steps.append(("반납된 슬롯 재사용", rejected and executor.queue_depth == 3, state()))
+
+    # 3. 실행 중인 요청 취소: 스레드 작업이 끝날 때까지 실행 수와 슬롯 유지
+    running.cancel()
+    await asyncio.gather(running, return_exceptions=True)
+    steps.append(("실행 중 취소", executor._active == 1 and executor._pending == 4, state()))
+
+    # 4. 모두 완료
+    gate.set()
+    results = await asyncio.gather(waiting[2], *admitted)
+    drained = await wait_until(lambda: executor._pending == 0 and executor._active == 0)
+    steps.append((
+        "완료 후 카운터 0",
+        drained and results == [3, 5, 6] and sorted(ran) == [0, 3, 5, 6],
+        f"{state()}, 실행된 작업 {sorted(ran)}"
+    ))
+
+    failed_any = False
+    for name, ok, detail in steps:
+        failed_any |= not ok
+        print(f"{'✅' if ok else '❌'} {name}: {detail}")
+    return 1 if failed_any else 0
+
+
+def main() -> None:
+    sys.exit(asyncio.run(run()))
+
+
+if __name__ == "__main__":
+    main()
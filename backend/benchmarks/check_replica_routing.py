@@ -0,0 +1,101 @@
+"""
+Replica Routing Check
+SQLite 파일 두 개(primary / replica)로 읽기 복제본 라우팅과 read-your-writes 고정 구간 확인
+
+1. 아이디어 생성 직후 조회 → 고정 구간이므로 primary에서 조회 (200)
+2. 고정 구간이 지난 뒤 조회 → 복제본에는 아직 없으므로 404 (복제 지연 재현)
+3. primary 파일을 복제본으로 복사(복제 완료) 후 조회 → 200
+
+사용법 (backend 디렉터리에서):
+    python -m benchmarks.check_replica_routing
+"""
+import argparse
+import os
+import shutil
+import sys
+import time
+
+from benchmarks.tempdb import temp_workdir
+
+
+def run(primary: str, replica: str, sticky_seconds: float) -> int:
+    from fastapi.testclient import TestClient
+
+    from src.core.jwt import create_access_token
+    from src.core.metrics import metrics
+    from src.db.session import Base, SessionLocal, engine, replica_engine
+    from src.main import app
+    from src.models import User
+
+    for bind in (engine, replica_engine):
+        Base.metadata.drop_all(bind=bind)
+        Base.metadata.create_all(bind=bind)
+
+    with SessionLocal() as db:
+        user = User(email="replica@example.com", password="not-used", name="replica")
+        db.add(user)
+        db.commit()
+        user_id = str(user.id)
+    # 사용자 행은 이미 복제된 상태로 시작
+    replica_engine.dispose()
+    shutil.copyfile(primary, replica)
+
+    client = TestClient(app)
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': user_id})}"}
+
+    created = client.post("/api/v1/ideas", headers=headers, json={
+        "title": "복제본 라우팅 점검",
+        "description": "읽기 복제본 라우팅을 확인하기 위한 아이디어입니다.",
+        "problem": "복제 지연",
+        "target_customer": "운영자"
+    })
+    created.raise_for_status()
+    idea_id = created.json()["idea_id"]
+
+    def fetch() -> int:
+        return client.get(f"/api/v1/ideas/{idea_id}", headers=headers).status_code
+
+    steps = []
+    steps.append(("쓰기 직후 (primary 고정)", fetch(), 200))
+
+    time.sleep(sticky_seconds + 0.5)
+    steps.append(("고정 구간 이후, 복제 전 (replica)", fetch(), 404))
+
+    replica_engine.dispose()
+    shutil.copyfile(primary, replica)
+    steps.append(("복제 후 (replica)", fetch(), 200))
+
+    failed = False
+    for name, actual, expected in steps:
+        ok = actual == expected
+        failed |= not ok
+        print(f"{'✅' if ok else '❌'} {name}: {actual} (expected {expected})")
+
+    counters = metrics.snapshot().get("counters", {})
+    print("reads:", {k: v for k, v in counters.items() if k.startswith("db.reads.")})
+    return 1 if failed else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--primary", default=None, help="primary SQLite 파일 (기본값: 임시 디렉터리)")
+    parser.add_argument("--replica", default=None, help="복제본 SQLite 파일 (기본값: 임시 디렉터리)")
+    parser.add_argument("--sticky-seconds", type=float, default=1.0)
+    args = parser.parse_args()
+
+    with temp_workdir("check_replica_routing") as workdir:
+        primary = args.primary or os.path.join(workdir, "primary.sqlite3")
+        replica = args.replica or os.path.join(workdir, "replica.sqlite3")
+
+        # 설정은 import 시점에 고정되므로 먼저 지정
+        os.environ["DATABASE_URL"] = f"sqlite:///{primary}"
+        os.environ["REPLICA_DATABASE_URL"] = f"sqlite:///{replica}"
+        os.environ["REPLICA_STICKY_SECONDS"] = str(args.sticky_seconds)
+        os.environ["DB_ASYNC_MODE"] = "false"
+        os.environ["DEBUG"] = "false"
+        code = run(primary, replica, args.sticky_seconds)
+    sys.exit(code)
+
+
+if __name__ == "__main__":
+    main()
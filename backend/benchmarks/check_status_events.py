@@ -0,0 +1,191 @@
+"""
+Status Events Check
+상태 변경이 커밋 후 이벤트 버스를 거쳐 상태 스트림 구독자에게 전달되는지 확인
+
+1. 커밋: 다른 스레드(작업 워커와 같은 조건)에서 커밋한 아이디어 상태 변경이 구독자에게 전달된다
+2. 롤백: 롤백된 변경은 전달되지 않는다
+3. 작업 워커: 수집 작업(COLLECT_DATA)의 상태 변경과 진행 상황이 순서대로 전달된다
+4. Redis 버스 발행: Redis가 응답하지 않아도 publish()는 호출자(이벤트 루프)를 막지 않고,
+   발행 스레드가 실패하면 로컬 구독자에게 대신 전달한다
+5. 설정 경고: memory 버스 + JOBS_EMBEDDED_WORKERS=0 이면 경고를 남긴다
+
+사용법 (backend 디렉터리에서):
+    python -m benchmarks.check_status_events
+"""
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import time
+from typing import Any, Dict, List, Tuple
+
+from benchmarks.tempdb import database_url
+
+# 응답하지 않는 주소 (연결 시도는 socket_connect_timeout까지 걸린다)
+UNREACHABLE_REDIS_URL = "redis://10.255.255.1:6379/0"
+EVENT_TIMEOUT = 5.0
+
+
+async def receive(subscription, count: int, timeout: float = EVENT_TIMEOUT) -> List[Dict[str, Any]]:
+    """이벤트 count개 수신 (timeout 안에 오지 않으면 받은 만큼 반환)"""
+    events = []
+    deadline = time.monotonic() + timeout
+    while len(events) < count:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        event = await subscription.get(timeout=remaining)
+        if event is not None:
+            events.append(event)
+    return events
+
+
+async def run() -> int:
+    from src.core.events import InMemoryEventBus, RedisEventBus, set_event_bus
+    from src.db.session import Base, SessionLocal, engine
+    from src.jobs.queue import JobQueue
+    from src.jobs.worker import Worker
+    from src.models import Idea, IdeaStatus, JobKind, User
+    from src.models.status_events import idea_channel
+
+    steps: List[Tuple[str, bool, str]] = []
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    with SessionLocal() as db:
+        user = User(email="events@example.com", password="not-used", name="events")
+        db.add(user)
+        db.flush()
+        idea = Idea(
+            user_id=user.id,
+            title="상태 이벤트 점검",
+            description="설명",
+            problem="문제",
+            target_customer="고객"
+        )
+        db.add(idea)
+        db.commit()
+        idea_id = idea.id
+
+    def set_status(status: IdeaStatus, commit: bool) -> None:
+        with SessionLocal() as db:
+            db.get(Idea, idea_id).status = status
+            db.flush()
+            if commit:
+                db.commit()
+            else:
+                db.rollback()
+
+    bus = InMemoryEventBus()
+    set_event_bus(bus)
+    subscription = bus.subscribe(idea_channel(idea_id))
+
+    # 1. 다른 스레드에서 커밋
+    await asyncio.to_thread(set_status, IdeaStatus.COLLECTING, True)
+    events = await receive(subscription, 1)
+    steps.append((
+        "커밋된 상태 변경 전달",
+        [(event["type"], event["status"]) for event in events] == [("idea.status", "collecting")],
+        str([(event["type"], event["status"]) for event in events])
+    ))
+
+    # 2. 롤백
+    await asyncio.to_thread(set_status, IdeaStatus.FAILED, False)
+    events = await receive(subscription, 1, timeout=0.3)
+    steps.append(("롤백된 변경은 전달 안 함", events == [], f"{len(events)}건"))
+
+    # 3. 작업 워커의 수집 작업
+    with SessionLocal() as db:
+        JobQueue(db).enqueue(JobKind.COLLECT_DATA.value, idea_id=idea_id)
+        db.commit()
+    processed = await asyncio.to_thread(Worker().run_once)
+    events = await receive(subscription, 1, timeout=1.0)
+    while True:
+        more = await receive(subscription, 1, timeout=0.3)
+        if not more:
+            break
+        events.extend(more)
+    kinds = [event["type"] for event in events]
+    last_idea_status = [event["status"] for event in events if event["type"] == "idea.status"][-1:]
+    steps.append((
+        "작업 워커 상태 변경 전달",
+        processed and "collection.progress" in kinds and last_idea_status == ["collected"],
+        f"{len(events)}건, 종류 {sorted(set(kinds))}, 최종 아이디어 상태 {last_idea_status}"
+    ))
+    subscription.close()
+
+    # 4. Redis 버스: publish()는 Redis 호출을 기다리지 않는다
+    redis_bus = RedisEventBus()
+    set_event_bus(redis_bus)
+    local = InMemoryEventBus.subscribe(redis_bus, idea_channel(idea_id))
+    await asyncio.to_thread(set_status, IdeaStatus.ANALYZING, True)
+    started = time.perf_counter()
+    redis_bus.publish(idea_channel(idea_id), {"type": "probe", "status": "probe"})
+    publish_ms = (time.perf_counter() - started) * 1000
+    loop_started = time.perf_counter()
+    await asyncio.sleep(0.01)
+    loop_lag_ms = (time.perf_counter() - loop_started) * 1000 - 10
+    events = await receive(local, 2)
+    steps.append((
+        "Redis 발행이 이벤트 루프를 막지 않음",
+        publish_ms < 50 and loop_lag_ms < 100 and [event["type"] for event in events] == ["idea.status", "probe"],
+        f"publish() {publish_ms:.1f}ms, 루프 지연 {loop_lag_ms:.1f}ms, 로컬 대체 전달 {[event['type'] for event in events]}"
+    ))
+    local.close()
+    redis_bus.close()
+
+    # 5. 설정 경고
+    steps.append(check_memory_warning())
+
+    failed_any = False
+    for name, ok, detail in steps:
+        failed_any |= not ok
+        print(f"{'✅' if ok else '❌'} {name}: {detail}")
+    return 1 if failed_any else 0
+
+
+def check_memory_warning() -> Tuple[str, bool, str]:
+    from src.core import events
+    from src.core.config import settings
+
+    records: List[logging.LogRecord] = []
+    handler = logging.Handler()
+    handler.emit = records.append
+    events.logger.addHandler(handler)
+    backend, embedded = settings.EVENT_BUS_BACKEND, settings.JOBS_EMBEDDED_WORKERS
+    try:
+        settings.EVENT_BUS_BACKEND = "memory"
+        settings.JOBS_EMBEDDED_WORKERS = 0
+        events._create_event_bus()
+        warned = len(records)
+        settings.JOBS_EMBEDDED_WORKERS = 1
+        events._create_event_bus()
+        warned_embedded = len(records) - warned
+    finally:
+        settings.EVENT_BUS_BACKEND, settings.JOBS_EMBEDDED_WORKERS = backend, embedded
+        events.logger.removeHandler(handler)
+    return (
+        "memory 버스 + 내장 워커 없음 경고",
+        warned == 1 and warned_embedded == 0,
+        f"JOBS_EMBEDDED_WORKERS=0: {warned}건, =1: {warned_embedded}건"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--database-url", default=None, help="기본값: 임시 디렉터리의 SQLite 파일")
+    args = parser.parse_args()
+
+    with database_url(args.database_url, "check_status_events") as url:
+        # 설정은 import 시점에 고정되므로 먼저 지정
+        os.environ["DATABASE_URL"] = url
+        os.environ["DB_ASYNC_MODE"] = "false"
+        os.environ["DEBUG"] = "false"
+        os.environ["REDIS_URL"] = UNREACHABLE_REDIS_URL
+        code = asyncio.run(run())
+    sys.exit(code)
+
+
+if __name__ == "__main__":
+    main()
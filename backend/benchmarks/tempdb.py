@@ -0,0 +1,35 @@
+"""
+Temporary Database
+벤치마크/점검 스크립트의 기본 DB: 임시 디렉터리의 SQLite 파일 (끝나면 디렉터리째 삭제)
+"""
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+
+@contextmanager
+def temp_workdir(name: str) -> Iterator[str]:
+    """블록이 끝나면 삭제되는 임시 디렉터리"""
+    workdir = tempfile.mkdtemp(prefix=f"{name}-")
+    try:
+        yield workdir
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def sqlite_url(workdir: str, filename: str) -> str:
+    """workdir 안의 SQLite 파일 URL"""
+    return f"sqlite:///{os.path.join(workdir, filename)}.sqlite3"
+
+
+@contextmanager
+def database_url(url: Optional[str], name: str) -> Iterator[str]:
+    """url이 지정되면 그대로, 없으면 임시 디렉터리의 SQLite 파일 URL"""
+    if url is not None:
+        yield url
+        return
+
+    with temp_workdir(name) as workdir:
+        yield sqlite_url(workdir, name)
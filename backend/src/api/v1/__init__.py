@@ -1,8 +1,2 @@
-from .routers import auth_router, ideas_router, reports_router, search_router
-
-__all__ = [
-    "auth_router",
-    "ideas_router",
-    "reports_router",
-    "search_router"
-]
+# 라우터는 src.api.v1.routers에서 직접 가져온다 (src.main 참고).
+# 패키지 초기화에서 라우터를 가져오면 서비스 → 스키마 import가 라우터 → 서비스로 되돌아와 순환 import가 생긴다.
@@ -1,11 +1,17 @@
 from .auth_dependency import (
     get_current_user,
     get_current_user_optional,
+    get_current_user_for_stream,
     require_verified_user
 )
+from .db_dependency import get_read_db_session, get_read_session_factory, user_id_from_token
 
 __all__ = [
     "get_current_user",
     "get_current_user_optional",
-    "require_verified_user"
+    "get_current_user_for_stream",
+    "require_verified_user",
+    "get_read_db_session",
+    "get_read_session_factory",
+    "user_id_from_token"
 ]
@@ -2,14 +2,16 @@
 Auth Dependencies
 인증 관련 의존성 (FastAPI Depends)
 """
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Query, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
-from typing import Optional
+from typing import Optional, Dict, Any
 from uuid import UUID
+from datetime import datetime
 
-from src.db.session import get_db
+from src.db.session import DBSession, get_db_session, run_db
 from src.core.jwt import verify_access_token
+from src.core.principal_cache import principal_cache
 from src.core.exceptions import UnauthorizedException
 from src.models.user_model import User
 
@@ -18,7 +20,7 @@ security = HTTPBearer()
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
+    db: DBSession = Depends(get_db_session)
 ) -> User:
     """
     현재 인증된 사용자 반환
@@ -26,6 +28,11 @@ async def get_current_user(
     """
     token = credentials.credentials
     
+    # 캐시된 사용자 확인 (토큰 디코딩 및 사용자 조회 생략)
+    principal = await principal_cache.get(token)
+    if principal is not None:
+        return _from_principal(principal)
+    
     # 토큰 검증
     payload = verify_access_token(token)
     if payload is None:
@@ -38,10 +45,7 @@ async def get_current_user(
     
     # 사용자 조회
     try:
-        user = db.query(User).filter(
-            User.id == UUID(user_id),
-            User.deleted_at.is_(None)
-        ).first()
+        user = await run_db(db, _find_active_user, UUID(user_id))
     except Exception:
         raise UnauthorizedException("사용자를 찾을 수 없습니다.")
     
@@ -51,12 +55,14 @@ async def get_current_user(
     if not user.is_active:
         raise UnauthorizedException("비활성화된 계정입니다.")
     
+    await principal_cache.set(token, _to_principal(user), payload["exp"])
+    
     return user
 
 
 async def get_current_user_optional(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(HTTPBearer(auto_error=False)),
-    db: Session = Depends(get_db)
+    db: DBSession = Depends(get_db_session)
 ) -> Optional[User]:
     """
     현재 인증된 사용자 반환 (선택적)
@@ -71,6 +77,23 @@ async def get_current_user_optional(
         return None
 
 
+async def get_current_user_for_stream(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(HTTPBearer(auto_error=False)),
+    access_token: Optional[str] = Query(None, description="Authorization 헤더를 보낼 수 없는 EventSource용 토큰"),
+    db: DBSession = Depends(get_db_session)
+) -> User:
+    """
+    스트리밍(SSE) 엔드포인트용 인증
+    브라우저 EventSource는 헤더를 지정할 수 없으므로 쿼리 파라미터 토큰도 허용한다.
+    """
+    if credentials is None:
+        if not access_token:
+            raise UnauthorizedException("인증 토큰이 필요합니다.")
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=access_token)
+    
+    return await get_current_user(credentials, db)
+
+
 def require_verified_user(
     current_user: User = Depends(get_current_user)
 ) -> User:
@@ -83,3 +106,34 @@ def require_verified_user(
             detail="이메일 인증이 필요합니다."
         )
     return current_user
+
+
+def _find_active_user(db: Session, user_id: UUID) -> Optional[User]:
+    return db.query(User).filter(
+        User.id == user_id,
+        User.deleted_at.is_(None)
+    ).first()
+
+
+def _to_principal(user: User) -> Dict[str, Any]:
+    """User 모델을 캐시 가능한 스냅샷으로 변환"""
+    return {
+        "id": str(user.id),
+        "email": user.email,
+        "name": user.name,
+        "is_active": user.is_active,
+        "is_verified": user.is_verified,
+        "created_at": user.created_at.isoformat() if user.created_at else None
+    }
+
+
+def _from_principal(principal: Dict[str, Any]) -> User:
+    """캐시된 스냅샷으로 (세션에 연결되지 않은) User 객체 생성"""
+    return User(
+        id=UUID(principal["id"]),
+        email=principal["email"],
+        name=principal["name"],
+        is_active=principal["is_active"],
+        is_verified=principal["is_verified"],
+        created_at=datetime.fromisoformat(principal["created_at"]) if principal["created_at"] else None
+    )
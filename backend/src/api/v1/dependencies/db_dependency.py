@@ -0,0 +1,67 @@
+"""
+DB Dependencies
+조회 전용 세션 의존성 (읽기 복제본 라우팅)
+"""
+from fastapi import Depends
+from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from fastapi.concurrency import run_in_threadpool
+from typing import AsyncGenerator, Callable, Optional
+
+from src.core.config import settings
+from src.core.jwt import verify_access_token
+from src.core.metrics import metrics
+from src.core.principal_cache import principal_cache
+from src.core.sticky_primary import sticky_primary
+from src.db.session import DBSession, has_replica, read_session_factory
+
+
+def user_id_from_token(token: Optional[str]) -> Optional[str]:
+    """토큰의 사용자 ID (1차 인증 캐시 우선, DB/Redis 조회 없음, 유효하지 않으면 None)"""
+    if not token:
+        return None
+
+    principal = principal_cache.get_local(token)
+    if principal is not None:
+        return principal["id"]
+
+    payload = verify_access_token(token)
+    return payload.get("sub") if payload else None
+
+
+def _use_replica(credentials: Optional[HTTPAuthorizationCredentials]) -> bool:
+    """복제본이 설정되어 있으면 복제본을 사용하되, 최근에 쓰기를 한 사용자는 primary를 사용한다."""
+    if not has_replica():
+        return False
+
+    user_id = user_id_from_token(credentials.credentials if credentials else None)
+    use_replica = user_id is None or not sticky_primary.is_sticky(user_id)
+    metrics.inc("db.reads.replica" if use_replica else "db.reads.sticky_primary")
+    return use_replica
+
+
+async def get_read_db_session(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(HTTPBearer(auto_error=False))
+) -> AsyncGenerator[DBSession, None]:
+    """조회 전용 엔드포인트의 세션 의존성 (읽기 복제본 라우팅)"""
+    factory = read_session_factory(_use_replica(credentials))
+    if settings.DB_ASYNC_MODE:
+        async with factory() as db:
+            yield db
+        return
+
+    db = factory()
+    try:
+        yield db
+    finally:
+        # 커넥션 반납(롤백)도 블로킹 호출이므로 스레드 풀에서 실행
+        await run_in_threadpool(db.close)
+
+
+async def get_read_session_factory(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(HTTPBearer(auto_error=False))
+) -> Callable[[], DBSession]:
+    """
+    조회용 세션 팩토리 의존성 (읽기 복제본 라우팅은 get_read_db_session과 같음)
+    스트리밍 응답처럼 의존성 정리 이후에도 세션을 써야 하는 엔드포인트가 직접 세션을 연다.
+    """
+    return read_session_factory(_use_replica(credentials))
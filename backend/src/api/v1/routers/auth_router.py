@@ -3,9 +3,8 @@ Auth Router
 인증 관련 API 엔드포인트
 """
 from fastapi import APIRouter, Depends, status
-from sqlalchemy.orm import Session
 
-from src.db.session import get_db
+from src.db.session import DBSession, get_db_session
 from src.services.auth_service import get_auth_service
 from src.api.v1.schemas import (
     RegisterRequest,
@@ -30,11 +29,11 @@ router = APIRouter()
 )
 async def register(
     request: RegisterRequest,
-    db: Session = Depends(get_db)
+    db: DBSession = Depends(get_db_session)
 ):
     """회원가입"""
     auth_service = get_auth_service(db)
-    return auth_service.register(request)
+    return await auth_service.register(request)
 
 
 @router.post(
@@ -45,11 +44,11 @@ async def register(
 )
 async def login(
     request: LoginRequest,
-    db: Session = Depends(get_db)
+    db: DBSession = Depends(get_db_session)
 ):
     """로그인"""
     auth_service = get_auth_service(db)
-    return auth_service.login(request)
+    return await auth_service.login(request)
 
 
 @router.post(
@@ -60,11 +59,11 @@ async def login(
 )
 async def refresh_token(
     request: RefreshTokenRequest,
-    db: Session = Depends(get_db)
+    db: DBSession = Depends(get_db_session)
 ):
     """토큰 갱신"""
     auth_service = get_auth_service(db)
-    return auth_service.refresh_token(request.refresh_token)
+    return await auth_service.refresh_token(request.refresh_token)
 
 
 @router.get(
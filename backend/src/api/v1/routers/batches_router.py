@@ -0,0 +1,52 @@
+"""
+Batches Router
+여러 아이디어 일괄 분석/보고서 API 엔드포인트
+"""
+from fastapi import APIRouter, Depends, status
+from uuid import UUID
+
+from src.db.session import DBSession, get_db_session
+from src.services.batch_service import get_async_batch_service
+from src.api.v1.schemas import CreateBatchRequest, BatchResponse
+from src.api.v1.dependencies import get_current_user, get_read_db_session
+from src.models.user_model import User
+
+router = APIRouter()
+
+
+@router.post(
+    "",
+    response_model=BatchResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="일괄 분석/보고서 시작",
+    description="""여러 아이디어를 한 번에 분석하고 보고서를 생성합니다.
+    
+    - `operations`: `analyze`, `report` (기본값: 둘 다, 분석 → 보고서 순서로 실행)
+    - 아이디어는 `max_parallel`개씩 동시에 처리됩니다.
+    - 응답의 `batch_id`로 진행 상황을 조회합니다.
+    """
+)
+async def create_batch(
+    request: CreateBatchRequest,
+    db: DBSession = Depends(get_db_session),
+    current_user: User = Depends(get_current_user)
+):
+    """일괄 작업 시작"""
+    batch_service = get_async_batch_service(db)
+    return await batch_service.create_batch(request, current_user)
+
+
+@router.get(
+    "/{batch_id}",
+    response_model=BatchResponse,
+    summary="일괄 작업 진행 상황 조회",
+    description="일괄 작업의 전체 진행 상황(대기/진행/성공/실패 건수)을 조회합니다."
+)
+async def get_batch(
+    batch_id: UUID,
+    db: DBSession = Depends(get_read_db_session),
+    current_user: User = Depends(get_current_user)
+):
+    """일괄 작업 진행 상황 조회"""
+    batch_service = get_async_batch_service(db)
+    return await batch_service.get_batch(batch_id, current_user)
@@ -0,0 +1,50 @@
+"""
+Exports Router
+사용자 데이터 내보내기 (NDJSON / CSV 스트리밍) API 엔드포인트
+"""
+from datetime import datetime
+from typing import Callable
+
+from fastapi import APIRouter, BackgroundTasks, Depends, Query
+from fastapi.responses import StreamingResponse
+
+from src.core.config import settings
+from src.db.session import DBSession
+from src.services.export_service import EXPORT_MEDIA_TYPES, ExportService
+from src.api.v1.dependencies import get_current_user, get_read_session_factory
+from src.models.user_model import User
+
+router = APIRouter()
+
+
+@router.get(
+    "/{resource}",
+    summary="데이터 내보내기",
+    description=f"""내 아이디어(`ideas`), 분석(`analyses`), 보고서(`reports`)를 파일로 내려받습니다.
+
+    - `format`: `ndjson`(한 줄에 JSON 하나, 기본값) 또는 `csv`(첫 행은 헤더, 중첩 값은 JSON 문자열)
+    - 서버 측 커서로 읽으면서 바로 전송하므로 데이터 양과 관계없이 응답이 곧바로 시작됩니다.
+    - 동시에 진행할 수 있는 내보내기는 서버 프로세스당 {settings.EXPORT_MAX_CONCURRENT}개이며, 초과하면 `503`과 `Retry-After`를 반환합니다.
+    """,
+    response_class=StreamingResponse
+)
+async def export_resource(
+    resource: str,
+    background_tasks: BackgroundTasks,
+    format: str = Query("ndjson", description="출력 형식 (ndjson, csv)"),
+    session_factory: Callable[[], DBSession] = Depends(get_read_session_factory),
+    current_user: User = Depends(get_current_user)
+):
+    """데이터 내보내기"""
+    stream, release = ExportService(session_factory).stream(resource, format, current_user)
+    # 전송이 시작되기 전에 연결이 끊겨 스트림이 실행되지 않은 경우에도 슬롯 반납
+    background_tasks.add_task(release)
+    filename = f"{resource}-{datetime.utcnow():%Y%m%d}.{format}"
+    return StreamingResponse(
+        stream,
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "Cache-Control": "no-store"
+        }
+    )
@@ -2,29 +2,44 @@
 Ideas Router
 아이디어 관련 API 엔드포인트
 """
-from fastapi import APIRouter, Depends, status, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Request, Response, status, Query
+from fastapi.responses import StreamingResponse
+from typing import Any, AsyncIterator, Dict, List, Optional
 from uuid import UUID
+import json
 
-from src.db.session import get_db
-from src.services.idea_service import get_idea_service
-from src.services.analysis_service import get_analysis_service
-from src.services.report_service import get_report_service
+from src.core.config import settings
+from src.core.conditional import is_not_modified, not_modified_response, set_version_headers
+from src.core.fieldsets import parse_fields, sparse_response
+from src.core.responses import trusted_response
+from src.core.events import Subscription, get_event_bus
+from src.db.session import DBSession, get_db_session
+from src.models.status_events import idea_channel
+from src.services.idea_service import get_async_idea_service
+from src.services.idea_import import IMPORT_FORMATS, detect_import_format, import_idea_rows, iter_import_rows
+from src.services.analysis_service import get_async_analysis_service
+from src.services.report_service import get_async_report_service
 from src.api.v1.schemas import (
     CreateIdeaRequest,
     UpdateIdeaRequest,
     IdeaResponse,
     IdeaCreateResponse,
     IdeaListResponse,
+    IdeaBatchResponse,
+    IdeaImportResponse,
     CollectDataResponse,
     CollectStatusResponse,
     AnalyzeResponse,
     AnalysisResultResponse,
+    AnalysisBatchResponse,
     CreateReportRequest,
     ReportGenerateResponse,
+    ReportListResponse,
+    ReportSummaryResponse,
     SuccessResponse
 )
-from src.api.v1.dependencies import get_current_user
+from src.api.v1.dependencies import get_current_user, get_current_user_for_stream, get_read_db_session
+from src.core.exceptions import ValidationException
 from src.models.user_model import User
 
 router = APIRouter()
@@ -41,51 +56,174 @@ router = APIRouter()
 )
 async def create_idea(
     request: CreateIdeaRequest,
-    db: Session = Depends(get_db),
+    db: DBSession = Depends(get_db_session),
     current_user: User = Depends(get_current_user)
 ):
     """아이디어 생성"""
-    idea_service = get_idea_service(db)
-    return idea_service.create_idea(request, current_user)
+    idea_service = get_async_idea_service(db)
+    return await idea_service.create_idea(request, current_user)
 
 
 @router.get(
     "",
     response_model=IdeaListResponse,
     summary="아이디어 목록 조회",
-    description="사용자의 아이디어 목록을 조회합니다."
+    description="""사용자의 아이디어 목록을 조회합니다.
+    
+    - 페이지 번호 방식: `page`, `page_size`
+    - 커서 방식: `cursor` 파라미터 사용 (첫 페이지는 빈 값 `cursor=`), 응답의 `next_cursor`로 다음 페이지 조회
+    - 필드 선택: `fields=id,title,status` (지정한 컬럼만 조회·응답)
+    """
 )
 async def get_ideas(
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (커서 방식)"),
+    include_total: bool = Query(False, description="커서 방식에서 전체 개수 포함 여부"),
+    fields: Optional[str] = Query(None, description="응답에 포함할 필드 (쉼표 구분, 예: id,title,status)"),
+    db: DBSession = Depends(get_read_db_session),
     current_user: User = Depends(get_current_user)
 ):
     """아이디어 목록 조회"""
-    idea_service = get_idea_service(db)
-    ideas, total = idea_service.get_ideas(current_user, page, page_size)
-    return IdeaListResponse(
+    idea_service = get_async_idea_service(db)
+    selected = parse_fields(fields, IdeaResponse)
+    
+    if cursor is not None:
+        ideas, total, next_cursor = await idea_service.get_ideas_by_cursor(
+            current_user, cursor, page_size, include_total, selected
+        )
+        if selected:
+            return sparse_response({
+                "ideas": ideas,
+                "total": total,
+                "page": None,
+                "page_size": page_size,
+                "next_cursor": next_cursor
+            })
+        return trusted_response(IdeaListResponse(
+            ideas=ideas,
+            total=total,
+            page=None,
+            page_size=page_size,
+            next_cursor=next_cursor
+        ))
+    
+    ideas, total = await idea_service.get_ideas(current_user, page, page_size, selected)
+    if selected:
+        return sparse_response({
+            "ideas": ideas,
+            "total": total,
+            "page": page,
+            "page_size": page_size,
+            "next_cursor": None
+        })
+    return trusted_response(IdeaListResponse(
         ideas=ideas,
         total=total,
         page=page,
         page_size=page_size
-    )
+    ))
+
+
+@router.post(
+    "/import",
+    response_model=IdeaImportResponse,
+    summary="아이디어 일괄 가져오기",
+    description="""여러 아이디어를 한 번에 등록합니다. 요청 본문은 스트림으로 읽으며 배치 단위로 저장합니다.
+    
+    - 형식: JSON 배열(`application/json`), NDJSON(`application/x-ndjson`), CSV(`text/csv`, 첫 행은 헤더)
+    - Content-Type 대신 `format` 파라미터로 지정할 수 있습니다.
+    - 각 행은 아이디어 생성 요청과 같은 규칙으로 검증하며, 오류가 있는 행만 건너뛰고 `errors`에 행 번호와 사유를 담습니다.
+    - `collect=true`면 가져온 아이디어마다 데이터 수집을 시작합니다.
+    """
+)
+async def import_ideas(
+    request: Request,
+    format: Optional[str] = Query(None, description="입력 형식 (json, ndjson, csv)"),
+    collect: bool = Query(False, description="가져온 아이디어의 데이터 수집 시작"),
+    db: DBSession = Depends(get_db_session),
+    current_user: User = Depends(get_current_user)
+):
+    """아이디어 일괄 가져오기"""
+    fmt = format or detect_import_format(request.headers.get("content-type"))
+    if fmt not in IMPORT_FORMATS:
+        raise ValidationException(
+            "지원하지 않는 입력 형식입니다.",
+            {"format": fmt, "supported": list(IMPORT_FORMATS)}
+        )
+    
+    idea_service = get_async_idea_service(db)
+    rows = iter_import_rows(request.stream(), fmt)
+    return await import_idea_rows(rows, idea_service, current_user, collect)
+
+
+# 일괄 조회 경로는 /{idea_id}보다 먼저 등록해야 한다
+
+@router.get(
+    "/batch",
+    response_model=IdeaBatchResponse,
+    summary="아이디어 일괄 조회",
+    description=f"""여러 아이디어를 한 번에 조회합니다 (`ids`를 반복 지정, 최대 {settings.BATCH_GET_MAX_IDS}개).
+    
+    찾을 수 없거나 다른 사용자의 아이디어는 `errors`에 `NOT_FOUND`로 표시됩니다.
+    """
+)
+async def get_ideas_batch(
+    ids: List[UUID] = Query(..., description="아이디어 ID (예: ?ids=...&ids=...)"),
+    db: DBSession = Depends(get_read_db_session),
+    current_user: User = Depends(get_current_user)
+):
+    """아이디어 일괄 조회"""
+    idea_service = get_async_idea_service(db)
+    return trusted_response(await idea_service.get_ideas_by_ids(ids, current_user))
+
+
+@router.get(
+    "/batch/analysis",
+    response_model=AnalysisBatchResponse,
+    summary="분석 결과 일괄 조회",
+    description=f"""여러 아이디어의 분석 결과를 한 번에 조회합니다 (`ids`를 반복 지정, 최대 {settings.BATCH_GET_MAX_IDS}개).
+    
+    아이디어를 찾을 수 없으면 `resource=idea`, 분석 결과가 없으면 `resource=analysis`로 `errors`에 표시됩니다.
+    """
+)
+async def get_analyses_batch(
+    ids: List[UUID] = Query(..., description="아이디어 ID (예: ?ids=...&ids=...)"),
+    db: DBSession = Depends(get_read_db_session),
+    current_user: User = Depends(get_current_user)
+):
+    """분석 결과 일괄 조회"""
+    analysis_service = get_async_analysis_service(db)
+    return trusted_response(await analysis_service.get_analyses_by_idea_ids(ids, current_user))
 
 
 @router.get(
     "/{idea_id}",
     response_model=IdeaResponse,
     summary="아이디어 상세 조회",
-    description="특정 아이디어의 상세 정보를 조회합니다."
+    description="특정 아이디어의 상세 정보를 조회합니다. If-None-Match / If-Modified-Since가 일치하면 304를 반환합니다. `fields=`로 응답 필드를 선택할 수 있습니다."
 )
 async def get_idea(
     idea_id: UUID,
-    db: Session = Depends(get_db),
+    request: Request,
+    response: Response,
+    fields: Optional[str] = Query(None, description="응답에 포함할 필드 (쉼표 구분, 예: id,title,status)"),
+    db: DBSession = Depends(get_read_db_session),
     current_user: User = Depends(get_current_user)
 ):
-    """아이디어 상세 조회"""
-    idea_service = get_idea_service(db)
-    return idea_service.get_idea(idea_id, current_user)
+    """아이디어 상세 조회 (조건부 조회 지원)"""
+    idea_service = get_async_idea_service(db)
+    selected = parse_fields(fields, IdeaResponse)
+    version = await idea_service.get_idea_version(idea_id, current_user)
+    if selected:
+        version = version.variant("fields", *selected)
+    if is_not_modified(request, version):
+        return not_modified_response(version, "idea", request)
+    
+    set_version_headers(response, version, "idea")
+    if selected:
+        return sparse_response(await idea_service.get_idea(idea_id, current_user, selected), response)
+    return trusted_response(await idea_service.get_idea(idea_id, current_user), response)
 
 
 @router.patch(
@@ -97,12 +235,12 @@ async def get_idea(
 async def update_idea(
     idea_id: UUID,
     request: UpdateIdeaRequest,
-    db: Session = Depends(get_db),
+    db: DBSession = Depends(get_db_session),
     current_user: User = Depends(get_current_user)
 ):
     """아이디어 수정"""
-    idea_service = get_idea_service(db)
-    return idea_service.update_idea(idea_id, request, current_user)
+    idea_service = get_async_idea_service(db)
+    return await idea_service.update_idea(idea_id, request, current_user)
 
 
 @router.delete(
@@ -113,12 +251,12 @@ async def update_idea(
 )
 async def delete_idea(
     idea_id: UUID,
-    db: Session = Depends(get_db),
+    db: DBSession = Depends(get_db_session),
     current_user: User = Depends(get_current_user)
 ):
     """아이디어 삭제"""
-    idea_service = get_idea_service(db)
-    idea_service.delete_idea(idea_id, current_user)
+    idea_service = get_async_idea_service(db)
+    await idea_service.delete_idea(idea_id, current_user)
     return SuccessResponse(message="아이디어가 삭제되었습니다.")
 
 
@@ -132,12 +270,12 @@ async def delete_idea(
 )
 async def start_collection(
     idea_id: UUID,
-    db: Session = Depends(get_db),
+    db: DBSession = Depends(get_db_session),
     current_user: User = Depends(get_current_user)
 ):
     """데이터 수집 시작"""
-    idea_service = get_idea_service(db)
-    return idea_service.start_collection(idea_id, current_user)
+    idea_service = get_async_idea_service(db)
+    return await idea_service.start_collection(idea_id, current_user)
 
 
 @router.get(
@@ -148,12 +286,72 @@ async def start_collection(
 )
 async def get_collection_status(
     idea_id: UUID,
-    db: Session = Depends(get_db),
+    db: DBSession = Depends(get_read_db_session),
     current_user: User = Depends(get_current_user)
 ):
     """데이터 수집 상태 조회"""
-    idea_service = get_idea_service(db)
-    return idea_service.get_collection_status(idea_id, current_user)
+    idea_service = get_async_idea_service(db)
+    return await idea_service.get_collection_status(idea_id, current_user)
+
+
+# ============== 상태 스트림 ==============
+
+@router.get(
+    "/{idea_id}/events",
+    summary="상태 변경 스트림 (SSE)",
+    description="""아이디어·분석·보고서 상태 변경과 데이터 수집 진행 상황을 Server-Sent Events로 전송합니다.
+    
+    - 연결 직후 현재 상태를 먼저 전송합니다.
+    - 이벤트 종류: `idea.status`, `analysis.status`, `report.status`, `collection.progress`
+    - EventSource처럼 헤더를 보낼 수 없는 클라이언트는 `access_token` 쿼리 파라미터를 사용합니다.
+    """,
+    response_class=StreamingResponse
+)
+async def stream_status_events(
+    idea_id: UUID,
+    request: Request,
+    db: DBSession = Depends(get_db_session),
+    current_user: User = Depends(get_current_user_for_stream)
+):
+    """상태 변경 스트림"""
+    # 스냅샷 조회 전에 구독해야 그 사이의 변경을 놓치지 않는다
+    subscription = get_event_bus().subscribe(idea_channel(idea_id))
+    try:
+        idea_service = get_async_idea_service(db)
+        snapshot = await idea_service.get_status_snapshot(idea_id, current_user)
+    except Exception:
+        subscription.close()
+        raise
+    
+    return StreamingResponse(
+        _stream_events(request, subscription, snapshot),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+async def _stream_events(
+    request: Request,
+    subscription: Subscription,
+    snapshot: List[Dict[str, Any]]
+) -> AsyncIterator[str]:
+    """SSE 형식으로 이벤트 전송 (연결이 끊길 때까지)"""
+    try:
+        for event in snapshot:
+            yield _format_sse(event)
+        
+        while not await request.is_disconnected():
+            event = await subscription.get(timeout=settings.EVENT_KEEPALIVE_SECONDS)
+            if event is None:
+                yield ": keepalive\n\n"
+            else:
+                yield _format_sse(event)
+    finally:
+        subscription.close()
+
+
+def _format_sse(event: Dict[str, Any]) -> str:
+    return f"event: {event['type']}\ndata: {json.dumps(event, ensure_ascii=False)}\n\n"
 
 
 # ============== 분석 ==============
@@ -162,32 +360,40 @@ async def get_collection_status(
     "/{idea_id}/analyze",
     response_model=AnalyzeResponse,
     summary="분석 시작",
-    description="수집된 데이터를 기반으로 AI 분석을 시작합니다."
+    description="수집된 데이터를 기반으로 AI 분석을 시작합니다. 입력이 이전 분석과 같으면 기존 결과를 재사용합니다(`force=true`로 재분석)."
 )
 async def start_analysis(
     idea_id: UUID,
-    db: Session = Depends(get_db),
+    force: bool = Query(False, description="입력이 같아도 다시 분석"),
+    db: DBSession = Depends(get_db_session),
     current_user: User = Depends(get_current_user)
 ):
     """분석 시작"""
-    analysis_service = get_analysis_service(db)
-    return analysis_service.start_analysis(idea_id, current_user)
+    analysis_service = get_async_analysis_service(db)
+    return await analysis_service.start_analysis(idea_id, current_user, force)
 
 
 @router.get(
     "/{idea_id}/analysis",
     response_model=AnalysisResultResponse,
     summary="분석 결과 조회",
-    description="분석 결과를 조회합니다."
+    description="분석 결과를 조회합니다. If-None-Match / If-Modified-Since가 일치하면 304를 반환합니다."
 )
 async def get_analysis(
     idea_id: UUID,
-    db: Session = Depends(get_db),
+    request: Request,
+    response: Response,
+    db: DBSession = Depends(get_read_db_session),
     current_user: User = Depends(get_current_user)
 ):
-    """분석 결과 조회"""
-    analysis_service = get_analysis_service(db)
-    return analysis_service.get_analysis(idea_id, current_user)
+    """분석 결과 조회 (조건부 조회 지원)"""
+    analysis_service = get_async_analysis_service(db)
+    version = await analysis_service.get_analysis_version(idea_id, current_user)
+    if is_not_modified(request, version):
+        return not_modified_response(version, "analysis", request)
+    
+    set_version_headers(response, version, "analysis")
+    return trusted_response(await analysis_service.get_analysis(idea_id, current_user), response)
 
 
 # ============== 보고서 ==============
@@ -196,14 +402,35 @@ async def get_analysis(
     "/{idea_id}/report",
     response_model=ReportGenerateResponse,
     summary="보고서 생성",
-    description="분석 결과를 바탕으로 보고서를 생성합니다."
+    description="분석 결과를 바탕으로 보고서 생성을 시작합니다. 내용은 작업 큐에서 생성하며, 입력이 이전 보고서와 같으면 기존 보고서를 재사용합니다."
 )
 async def create_report(
     idea_id: UUID,
     request: CreateReportRequest = None,
-    db: Session = Depends(get_db),
+    db: DBSession = Depends(get_db_session),
     current_user: User = Depends(get_current_user)
 ):
     """보고서 생성"""
-    report_service = get_report_service(db)
-    return report_service.create_report(idea_id, current_user, request)
+    report_service = get_async_report_service(db)
+    return await report_service.create_report(idea_id, current_user, request)
+
+
+@router.get(
+    "/{idea_id}/reports",
+    response_model=ReportListResponse,
+    summary="보고서 목록 조회",
+    description="아이디어의 보고서 목록(요약)을 최신순으로 조회합니다. 섹션 본문은 보고서 상세 조회에서 제공합니다. `fields=`로 응답 필드를 선택할 수 있습니다."
+)
+async def get_reports(
+    idea_id: UUID,
+    fields: Optional[str] = Query(None, description="응답에 포함할 필드 (쉼표 구분, 예: report_id,status,recommendation)"),
+    db: DBSession = Depends(get_read_db_session),
+    current_user: User = Depends(get_current_user)
+):
+    """보고서 목록 조회"""
+    report_service = get_async_report_service(db)
+    selected = parse_fields(fields, ReportSummaryResponse)
+    reports, total = await report_service.get_reports_by_idea(idea_id, current_user, selected)
+    if selected:
+        return sparse_response({"reports": reports, "total": total})
+    return trusted_response(ReportListResponse(reports=reports, total=total))
@@ -2,30 +2,74 @@
 Reports Router
 보고서 관련 API 엔드포인트
 """
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Query, Request, Response
+from typing import List, Optional
 from uuid import UUID
 
-from src.db.session import get_db
-from src.services.report_service import get_report_service
-from src.api.v1.schemas import ReportResponse
-from src.api.v1.dependencies import get_current_user
+from src.core.config import settings
+from src.core.compression import negotiate, precompressed_response
+from src.core.conditional import is_not_modified, not_modified_response, set_version_headers
+from src.core.fieldsets import parse_fields, sparse_response
+from src.core.responses import trusted_response
+from src.db.session import DBSession
+from src.services.report_service import get_async_report_service
+from src.api.v1.schemas import ReportBatchResponse, ReportResponse
+from src.api.v1.dependencies import get_current_user, get_read_db_session
 from src.models.user_model import User
 
 router = APIRouter()
 
 
+@router.get(
+    "/batch",
+    response_model=ReportBatchResponse,
+    summary="보고서 일괄 조회",
+    description=f"""여러 보고서를 한 번에 조회합니다 (`ids`를 반복 지정, 최대 {settings.BATCH_GET_MAX_IDS}개).
+    
+    찾을 수 없거나 다른 사용자의 보고서는 `errors`에 `NOT_FOUND`로 표시됩니다.
+    """
+)
+async def get_reports_batch(
+    ids: List[UUID] = Query(..., description="보고서 ID (예: ?ids=...&ids=...)"),
+    db: DBSession = Depends(get_read_db_session),
+    current_user: User = Depends(get_current_user)
+):
+    """보고서 일괄 조회"""
+    report_service = get_async_report_service(db)
+    return trusted_response(await report_service.get_reports_by_ids(ids, current_user))
+
+
 @router.get(
     "/{report_id}",
     response_model=ReportResponse,
     summary="보고서 조회",
-    description="특정 보고서의 상세 내용을 조회합니다."
+    description="특정 보고서의 상세 내용을 조회합니다. If-None-Match / If-Modified-Since가 일치하면 304를 반환하며, 완료된 보고서는 저장된 gzip 본문을 그대로 전송합니다. `fields=`로 응답 필드를 선택할 수 있습니다."
 )
 async def get_report(
     report_id: UUID,
-    db: Session = Depends(get_db),
+    request: Request,
+    response: Response,
+    fields: Optional[str] = Query(None, description="응답에 포함할 필드 (쉼표 구분, 예: report_id,status,recommendation)"),
+    db: DBSession = Depends(get_read_db_session),
     current_user: User = Depends(get_current_user)
 ):
-    """보고서 조회"""
-    report_service = get_report_service(db)
-    return report_service.get_report(report_id, current_user)
+    """보고서 조회 (조건부 조회 지원)"""
+    report_service = get_async_report_service(db)
+    selected = parse_fields(fields, ReportResponse)
+    version = await report_service.get_report_version(report_id, current_user)
+    if selected:
+        version = version.variant("fields", *selected)
+    if is_not_modified(request, version):
+        return not_modified_response(version, "report", request)
+    
+    set_version_headers(response, version, "report")
+    if selected:
+        return sparse_response(await report_service.get_report(report_id, current_user, selected), response)
+    if settings.COMPRESSION_ENABLED and settings.REPORT_PRECOMPRESS and negotiate(
+        request.headers.get("accept-encoding"), ("gzip",)
+    ):
+        body = await report_service.get_report_gzip(report_id, current_user)
+        if body is not None:
+            return precompressed_response(body, "gzip", response)
+    
+    return trusted_response(await report_service.get_report(report_id, current_user), response)
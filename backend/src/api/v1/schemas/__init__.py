@@ -12,6 +12,9 @@ from .idea_schema import (
     IdeaResponse,
     IdeaCreateResponse,
     IdeaListResponse,
+    IdeaBatchResponse,
+    IdeaImportRowError,
+    IdeaImportResponse,
     CollectDataResponse,
     CollectStatusResponse,
     AnalyzeResponse,
@@ -19,6 +22,7 @@ from .idea_schema import (
     SWOTAnalysis,
     MarketAnalysis,
     AnalysisResultResponse,
+    AnalysisBatchResponse,
     IndustryType,
     RevenueModelType,
     IdeaStatus
@@ -27,7 +31,9 @@ from .report_schema import (
     CreateReportRequest,
     ReportGenerateResponse,
     ReportResponse,
+    ReportSummaryResponse,
     ReportListResponse,
+    ReportBatchResponse,
     ActionItem,
     SWOTSection,
     MarketAnalysisSection,
@@ -37,6 +43,11 @@ from .report_schema import (
     ReportType,
     ReportStatus
 )
+from .batch_schema import (
+    BatchOperation,
+    CreateBatchRequest,
+    BatchResponse
+)
 from .search_schema import (
     SearchQuery,
     SearchResponse,
@@ -50,6 +61,7 @@ from .search_schema import (
 from .common_schema import (
     SuccessResponse,
     ErrorResponse,
+    BatchGetError,
     PaginationParams,
     PaginatedResponse,
     HealthCheckResponse
@@ -69,6 +81,9 @@ __all__ = [
     "IdeaResponse",
     "IdeaCreateResponse",
     "IdeaListResponse",
+    "IdeaBatchResponse",
+    "IdeaImportRowError",
+    "IdeaImportResponse",
     "CollectDataResponse",
     "CollectStatusResponse",
     "AnalyzeResponse",
@@ -76,6 +91,7 @@ __all__ = [
     "SWOTAnalysis",
     "MarketAnalysis",
     "AnalysisResultResponse",
+    "AnalysisBatchResponse",
     "IndustryType",
     "RevenueModelType",
     "IdeaStatus",
@@ -83,7 +99,9 @@ __all__ = [
     "CreateReportRequest",
     "ReportGenerateResponse",
     "ReportResponse",
+    "ReportSummaryResponse",
     "ReportListResponse",
+    "ReportBatchResponse",
     "ActionItem",
     "SWOTSection",
     "MarketAnalysisSection",
@@ -92,6 +110,10 @@ __all__ = [
     "RiskAssessmentSection",
     "ReportType",
     "ReportStatus",
+    # Batch
+    "BatchOperation",
+    "CreateBatchRequest",
+    "BatchResponse",
     # Search
     "SearchQuery",
     "SearchResponse",
@@ -104,6 +126,7 @@ __all__ = [
     # Common
     "SuccessResponse",
     "ErrorResponse",
+    "BatchGetError",
     "PaginationParams",
     "PaginatedResponse",
     "HealthCheckResponse"
@@ -0,0 +1,43 @@
+"""
+Batch Schemas
+일괄 분석/보고서 관련 요청/응답 스키마
+"""
+from pydantic import BaseModel, Field
+from typing import Optional, List
+from enum import Enum
+from uuid import UUID
+
+from .report_schema import ReportType
+
+
+class BatchOperation(str, Enum):
+    ANALYZE = "analyze"
+    REPORT = "report"
+
+
+class CreateBatchRequest(BaseModel):
+    """일괄 작업 생성 요청"""
+    idea_ids: List[UUID] = Field(..., min_length=1)
+    operations: List[BatchOperation] = Field(
+        default_factory=lambda: [BatchOperation.ANALYZE, BatchOperation.REPORT],
+        min_length=1
+    )
+    force: bool = False  # 입력이 같아도 다시 분석
+    report_type: ReportType = ReportType.BASIC
+    max_parallel: Optional[int] = Field(None, ge=1)  # 미지정 또는 상한 초과 시 BATCH_MAX_PARALLEL
+
+
+class BatchResponse(BaseModel):
+    """일괄 작업 상태 응답"""
+    batch_id: str
+    status: str
+    operations: List[str]
+    max_parallel: int
+    total: int
+    pending: int  # 아직 작업이 등록되지 않은 아이디어 수
+    running: int  # 작업이 등록되어 대기/실행 중인 아이디어 수
+    succeeded: int
+    failed: int
+    progress: int  # 완료(성공+실패) 비율 (0-100)
+    created_at: Optional[str]
+    finished_at: Optional[str]
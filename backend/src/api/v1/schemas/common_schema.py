@@ -24,6 +24,12 @@ class ErrorResponse(BaseModel):
     details: Optional[dict] = None
 
 
+class BatchGetError(BaseModel):
+    """일괄 조회에서 찾지 못한 항목 (없거나 다른 사용자의 리소스)"""
+    error_code: str = "NOT_FOUND"
+    resource: str  # idea / analysis / report
+
+
 class PaginationParams(BaseModel):
     """페이지네이션 파라미터"""
     page: int = 1
@@ -7,6 +7,8 @@ from typing import Optional, List, Dict, Any
 from enum import Enum
 from datetime import datetime
 
+from .common_schema import BatchGetError
+
 
 class IndustryType(str, Enum):
     TECH = "tech"
@@ -99,9 +101,30 @@ class IdeaCreateResponse(BaseModel):
 class IdeaListResponse(BaseModel):
     """아이디어 목록 응답"""
     ideas: List[IdeaResponse]
-    total: int
-    page: int
+    total: Optional[int]  # 커서 방식에서 include_total=false 이면 None
+    page: Optional[int]  # 커서 방식에서는 None
     page_size: int
+    next_cursor: Optional[str] = None  # 다음 페이지 커서 (마지막 페이지면 None)
+
+
+class IdeaBatchResponse(BaseModel):
+    """아이디어 일괄 조회 응답 (요청 ID → 결과)"""
+    ideas: Dict[str, IdeaResponse]
+    errors: Dict[str, BatchGetError]  # 찾지 못한 ID
+
+
+class IdeaImportRowError(BaseModel):
+    """가져오기 행 오류"""
+    row: int  # 1부터 시작하는 데이터 행 번호 (CSV 헤더 제외)
+    errors: List[Dict[str, Any]]  # [{"field": 필드명 또는 None, "message": 사유}]
+
+
+class IdeaImportResponse(BaseModel):
+    """아이디어 일괄 가져오기 응답"""
+    imported: int
+    failed: int
+    errors: List[IdeaImportRowError]  # 최대 IDEA_IMPORT_MAX_ERRORS건
+    collection_started: bool = False
 
 
 # ============== 데이터 수집 관련 ==============
@@ -126,9 +149,10 @@ class CollectStatusResponse(BaseModel):
 # ============== 분석 관련 ==============
 
 class AnalyzeResponse(BaseModel):
-    """분석 시작 응답"""
+    """분석 시작 응답 (status: analysis_started / analysis_in_progress / analysis_cached)"""
     idea_id: str
     status: str
+    job_id: Optional[str] = None  # 실행 중인 분석 작업
 
 
 class AnalysisScores(BaseModel):
@@ -171,3 +195,9 @@ class AnalysisResultResponse(BaseModel):
     recommendation: Optional[str]
     created_at: Optional[str]
     completed_at: Optional[str]
+
+
+class AnalysisBatchResponse(BaseModel):
+    """분석 결과 일괄 조회 응답 (아이디어 ID → 결과)"""
+    analyses: Dict[str, AnalysisResultResponse]
+    errors: Dict[str, BatchGetError]  # 아이디어 또는 분석 결과를 찾지 못한 ID
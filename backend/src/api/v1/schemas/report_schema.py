@@ -6,6 +6,8 @@ from pydantic import BaseModel, Field
 from typing import Optional, List, Dict, Any
 from enum import Enum
 
+from .common_schema import BatchGetError
+
 
 class ReportType(str, Enum):
     BASIC = "basic"
@@ -25,10 +27,11 @@ class CreateReportRequest(BaseModel):
 
 
 class ReportGenerateResponse(BaseModel):
-    """보고서 생성 시작 응답"""
+    """보고서 생성 시작 응답 (status: generating / cached)"""
     report_id: str
     idea_id: str
     status: str
+    job_id: Optional[str] = None  # 생성 중인 보고서 작업
 
 
 class ActionItem(BaseModel):
@@ -105,7 +108,24 @@ class ReportResponse(BaseModel):
         from_attributes = True
 
 
+class ReportSummaryResponse(BaseModel):
+    """보고서 요약 응답 (목록용, 섹션 본문 제외)"""
+    report_id: str
+    idea_id: str
+    status: str
+    report_type: str
+    recommendation: Optional[str]
+    created_at: Optional[str]
+    completed_at: Optional[str]
+
+
 class ReportListResponse(BaseModel):
     """보고서 목록 응답"""
-    reports: List[ReportResponse]
+    reports: List[ReportSummaryResponse]
     total: int
+
+
+class ReportBatchResponse(BaseModel):
+    """보고서 일괄 조회 응답 (요청 ID → 결과)"""
+    reports: Dict[str, ReportResponse]
+    errors: Dict[str, BatchGetError]  # 찾지 못한 ID
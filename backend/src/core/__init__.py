@@ -1,5 +1,10 @@
 from .config import settings
-from .security import hash_password, verify_password
+from .security import (
+    hash_password,
+    verify_password,
+    hash_password_async,
+    verify_password_async
+)
 from .jwt import (
     create_access_token,
     create_refresh_token,
@@ -22,6 +27,8 @@ __all__ = [
     "settings",
     "hash_password",
     "verify_password",
+    "hash_password_async",
+    "verify_password_async",
     "create_access_token",
     "create_refresh_token",
     "decode_token",
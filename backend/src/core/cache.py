@@ -0,0 +1,74 @@
+"""
+In-Process Cache
+크기 제한이 있는 LRU + TTL 캐시
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+from .metrics import metrics
+
+
+class TTLCache:
+    """LRU 방식으로 축출되고 항목별 만료 시간을 갖는 캐시 (스레드 안전)"""
+
+    def __init__(self, name: str, maxsize: int, ttl: float):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+        metrics.register_gauge(f"cache.{name}.size", lambda: len(self._data))
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """캐시 조회 (만료되었거나 없으면 None)"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > now:
+                    self._data.move_to_end(key)
+                    metrics.inc(f"cache.{self.name}.hits")
+                    return value
+                del self._data[key]
+                metrics.inc(f"cache.{self.name}.expired")
+
+        metrics.inc(f"cache.{self.name}.misses")
+        return None
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """캐시 저장 (ttl 미지정 시 기본 TTL 사용)"""
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        if ttl <= 0:
+            return
+
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                metrics.inc(f"cache.{self.name}.evictions")
+
+    def delete(self, key: Hashable) -> None:
+        """단일 항목 삭제"""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def delete_where(self, predicate: Callable[[Any], bool]) -> int:
+        """조건에 맞는 값을 가진 항목 모두 삭제"""
+        with self._lock:
+            keys = [key for key, (_, value) in self._data.items() if predicate(value)]
+            for key in keys:
+                del self._data[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        """전체 삭제"""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -0,0 +1,162 @@
+"""
+Response Compression
+Accept-Encoding 협상에 따른 응답 압축 (zstd / br / gzip)
+
+- COMPRESSION_MIN_BYTES보다 작은 응답, 이미 인코딩된 응답, 길이를 모르는 스트리밍 응답(SSE 등)은
+  압축하지 않는다.
+- 압축 수준은 인코딩별 기본값(COMPRESSION_LEVELS)에 경로 접두사별 설정(COMPRESSION_ROUTE_LEVELS)을
+  덮어써서 정한다 (가장 긴 접두사 우선).
+- brotli / zstandard 패키지는 선택 사항이며, 설치되지 않은 인코딩은 협상에서 제외된다.
+- 압축된 응답은 인코딩마다 다른 표현이므로 ETag에 인코딩 접미사를 붙인 강한 검증자를 사용한다
+  ("<tag>" → "<tag>-gzip"). 조건부 조회는 클라이언트가 받을 수 있는 인코딩의 ETag도 함께 비교한다.
+"""
+import asyncio
+import gzip
+from typing import Dict, Optional, Tuple
+
+from fastapi import Response
+
+from .config import settings
+from .metrics import metrics
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli 미설치 환경
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - zstandard 미설치 환경
+    zstandard = None
+
+# 압축 대상 Content-Type (접두사)
+COMPRESSIBLE_TYPES = ("application/json", "application/x-ndjson", "text/plain", "text/csv", "text/html")
+
+# 이 크기 이상은 이벤트 루프를 막지 않도록 스레드에서 압축
+_OFFLOAD_BYTES = 256 * 1024
+
+
+def _installed(encoding: str) -> bool:
+    if encoding == "br":
+        return brotli is not None
+    if encoding == "zstd":
+        return zstandard is not None
+    return encoding == "gzip"
+
+
+def available_encodings() -> Tuple[str, ...]:
+    """서버 선호 순서의 사용 가능한 인코딩"""
+    return tuple(encoding for encoding in settings.COMPRESSION_ENCODINGS if _installed(encoding))
+
+
+def negotiate(accept_encoding: Optional[str], encodings: Optional[Tuple[str, ...]] = None) -> Optional[str]:
+    """
+    Accept-Encoding에서 사용할 인코딩 선택 (없으면 None)
+    q 값이 가장 높은 인코딩 중 서버 선호 순서가 앞선 것을 고른다.
+    """
+    if not accept_encoding:
+        return None
+
+    weights: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        weight = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                weight = 0.0
+        weights[name] = weight
+
+    best, best_weight = None, 0.0
+    for encoding in encodings or available_encodings():
+        weight = weights.get(encoding, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = encoding, weight
+    return best
+
+
+def level_for(path: str, encoding: str) -> int:
+    """경로별 압축 수준 (가장 긴 접두사 설정 우선, 없으면 인코딩 기본값)"""
+    level = settings.COMPRESSION_LEVELS.get(encoding)
+    matched = ""
+    for prefix, levels in settings.COMPRESSION_ROUTE_LEVELS.items():
+        if path.startswith(prefix) and len(prefix) > len(matched) and encoding in levels:
+            matched, level = prefix, levels[encoding]
+    return level
+
+
+def compress(body: bytes, encoding: str, level: Optional[int] = None) -> bytes:
+    """본문 압축"""
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=9 if level is None else level, mtime=0)
+    if encoding == "br":
+        return brotli.compress(body, quality=11 if level is None else level)
+    if encoding == "zstd":
+        return zstandard.ZstdCompressor(level=3 if level is None else level).compress(body)
+    raise ValueError(f"지원하지 않는 인코딩: {encoding}")
+
+
+async def compress_async(body: bytes, encoding: str, level: Optional[int] = None) -> bytes:
+    """큰 본문은 스레드에서 압축"""
+    if len(body) >= _OFFLOAD_BYTES:
+        return await asyncio.to_thread(compress, body, encoding, level)
+    return compress(body, encoding, level)
+
+
+def is_compressible(content_type: Optional[str]) -> bool:
+    if not content_type:
+        return False
+    return content_type.split(";")[0].strip().lower().startswith(COMPRESSIBLE_TYPES)
+
+
+def add_vary(headers, value: str = "Accept-Encoding") -> None:
+    """Vary 헤더에 값 추가 (중복 방지)"""
+    current = headers.get("vary")
+    if not current:
+        headers["Vary"] = value
+    elif value.lower() not in {item.strip().lower() for item in current.split(",")}:
+        headers["Vary"] = f"{current}, {value}"
+
+
+def encoded_etag(etag: str, encoding: str) -> str:
+    """인코딩된 표현의 ETag ("<tag>" → "<tag>-<encoding>", W/ 여부는 유지)"""
+    prefix = "W/" if etag.startswith("W/") else ""
+    opaque = etag.removeprefix("W/")
+    if len(opaque) < 2 or not (opaque.startswith('"') and opaque.endswith('"')):
+        return etag
+    return f'{prefix}{opaque[:-1]}-{encoding}"'
+
+
+def set_encoded_etag(headers, encoding: str) -> None:
+    """압축된 응답의 ETag를 인코딩별 ETag로 변경"""
+    etag = headers.get("etag")
+    if etag:
+        headers["ETag"] = encoded_etag(etag, encoding)
+
+
+def precompressed_response(body: bytes, encoding: str, response: Optional[Response] = None) -> Response:
+    """
+    저장해 둔 압축 본문을 그대로 전송 (압축 미들웨어는 Content-Encoding이 있으면 건너뜀)
+    - response: 라우터에 주입된 Response (설정된 ETag 등 헤더를 옮김)
+    """
+    result = Response(content=body, media_type="application/json")
+    if response is not None:
+        for name, value in response.headers.items():
+            if name not in ("content-length", "content-type"):
+                result.headers[name] = value
+    result.headers["Content-Encoding"] = encoding
+    add_vary(result.headers)
+    set_encoded_etag(result.headers, encoding)
+    metrics.inc(f"compression.{encoding}.precompressed")
+    return result
+
+
+def record(encoding: str, before: int, after: int) -> None:
+    metrics.inc(f"compression.{encoding}.responses")
+    metrics.inc("compression.bytes_in", before)
+    metrics.inc("compression.bytes_out", after)
@@ -0,0 +1,115 @@
+"""
+Conditional GET
+ETag / Last-Modified 기반 조건부 조회 (변경되지 않았으면 304)
+
+ETag는 행의 버전 컬럼(id, status, updated_at 등)과 APP_VERSION으로 만든 강한 검증자다.
+updated_at은 ORM/Core UPDATE 모두에서 onupdate로 갱신되므로 응답 내용이 바뀌면 ETag도 바뀐다.
+라우터는 버전 컬럼만 조회하는 좁은 쿼리로 먼저 비교하고, 일치하면 JSONB 컬럼 로드와
+응답 변환 없이 바로 304를 반환한다.
+"""
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, NamedTuple, Optional
+
+from fastapi import Request, Response
+
+from .compression import available_encodings, encoded_etag, negotiate
+from .config import settings
+from .metrics import metrics
+
+
+class ResourceVersion(NamedTuple):
+    """조건부 조회에 사용하는 리소스 버전"""
+    etag: str
+    last_modified: Optional[datetime]
+
+    @property
+    def headers(self) -> dict:
+        headers = {"ETag": self.etag, "Cache-Control": "private, no-cache"}
+        if self.last_modified is not None:
+            headers["Last-Modified"] = http_date(self.last_modified)
+        return headers
+
+    def variant(self, *parts: Any) -> "ResourceVersion":
+        """같은 리소스의 다른 표현(fields= 선택 등)에 대한 ETag"""
+        if not parts:
+            return self
+        return make_version(self.etag, *parts, last_modified=self.last_modified)
+
+
+def make_version(kind: str, *parts: Any, last_modified: Optional[datetime] = None) -> ResourceVersion:
+    """버전 컬럼 값으로 강한 ETag 생성"""
+    raw = "|".join([settings.APP_VERSION, kind, *(str(part) for part in parts)])
+    etag = '"' + hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32] + '"'
+    return ResourceVersion(etag, last_modified)
+
+
+def http_date(value: datetime) -> str:
+    """UTC naive datetime → HTTP-date (초 단위)"""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc).replace(microsecond=0), usegmt=True)
+
+
+def matching_etag(request: Request, version: ResourceVersion) -> Optional[str]:
+    """
+    If-None-Match와 일치하는 ETag (약한 비교, 없으면 None)
+    압축된 응답의 ETag("<tag>-gzip" 등)는 클라이언트가 그 인코딩을 받을 수 있을 때만 일치로 본다.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is None:
+        return None
+    if if_none_match.strip() == "*":
+        return version.etag
+
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    if version.etag in candidates:
+        return version.etag
+
+    accept_encoding = request.headers.get("accept-encoding")
+    for encoding in available_encodings():
+        etag = encoded_etag(version.etag, encoding)
+        if etag in candidates and negotiate(accept_encoding, (encoding,)) is not None:
+            return etag
+    return None
+
+
+def is_not_modified(request: Request, version: ResourceVersion) -> bool:
+    """
+    If-None-Match가 있으면 ETag로만 비교하고 (RFC 9110 13.2.2),
+    없을 때만 If-Modified-Since를 Last-Modified와 비교
+    """
+    if request.headers.get("if-none-match") is not None:
+        return matching_etag(request, version) is not None
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or version.last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+
+    last_modified = version.last_modified
+    if last_modified.tzinfo is None:
+        last_modified = last_modified.replace(tzinfo=timezone.utc)
+    return last_modified.replace(microsecond=0) <= since
+
+
+def not_modified_response(version: ResourceVersion, name: str, request: Optional[Request] = None) -> Response:
+    """본문 없는 304 응답 (request가 있으면 일치한 표현의 ETag를 돌려준다)"""
+    metrics.inc(f"conditional.{name}.not_modified")
+    headers = version.headers
+    etag = matching_etag(request, version) if request is not None else None
+    if etag is not None:
+        headers["ETag"] = etag
+    return Response(status_code=304, headers=headers)
+
+
+def set_version_headers(response: Response, version: ResourceVersion, name: str) -> None:
+    """200 응답에 ETag / Last-Modified 설정"""
+    metrics.inc(f"conditional.{name}.full")
+    response.headers.update(version.headers)
@@ -0,0 +1,249 @@
+"""
+Event Bus
+상태 변경 이벤트 발행/구독 (SSE 상태 스트림용)
+
+- InMemoryEventBus: 프로세스 내 전달 (개발/테스트, 내장 워커)
+- RedisEventBus: Redis pub/sub으로 여러 uvicorn 워커·작업 워커 프로세스에 전달
+"""
+import asyncio
+import json
+import logging
+import queue
+import threading
+from typing import Any, Dict, Optional, Set, Tuple
+
+from .config import settings
+from .metrics import metrics
+from .redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+
+class Subscription:
+    """채널 구독 (비동기 이터레이터)"""
+
+    def __init__(self, bus: "InMemoryEventBus", channel: str, maxsize: int):
+        self.bus = bus
+        self.channel = channel
+        self.loop = asyncio.get_running_loop()
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+
+    def deliver(self, event: Dict[str, Any]) -> None:
+        """이벤트 전달 (어느 스레드에서든 호출 가능)"""
+        self.loop.call_soon_threadsafe(self._put, event)
+
+    def _put(self, event: Dict[str, Any]) -> None:
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # 느린 구독자는 이벤트를 버린다 (상태는 다음 이벤트/재연결 시 스냅샷으로 복구)
+            metrics.inc("events.dropped")
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """다음 이벤트 (timeout 내 없으면 None)"""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def close(self) -> None:
+        self.bus.unsubscribe(self)
+
+
+class InMemoryEventBus:
+    """프로세스 내 이벤트 버스"""
+
+    def __init__(self, queue_size: int = 100):
+        self.queue_size = queue_size
+        self._lock = threading.Lock()
+        self._subscribers: Dict[str, Set[Subscription]] = {}
+
+        metrics.register_gauge("events.subscribers", self.subscriber_count)
+
+    def publish(self, channel: str, event: Dict[str, Any]) -> None:
+        """이벤트 발행"""
+        metrics.inc("events.published")
+        self._dispatch(channel, event)
+
+    def subscribe(self, channel: str) -> Subscription:
+        """채널 구독 (이벤트 루프 안에서 호출)"""
+        subscription = Subscription(self, channel, self.queue_size)
+        with self._lock:
+            self._subscribers.setdefault(channel, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.channel)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[subscription.channel]
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return sum(len(subscribers) for subscribers in self._subscribers.values())
+
+    def close(self) -> None:
+        pass
+
+    def _dispatch(self, channel: str, event: Dict[str, Any]) -> None:
+        """이 프로세스의 구독자에게 전달"""
+        with self._lock:
+            subscribers = list(self._subscribers.get(channel, ()))
+        for subscription in subscribers:
+            subscription.deliver(event)
+
+
+class RedisEventBus(InMemoryEventBus):
+    """
+    Redis pub/sub 이벤트 버스
+    발행은 Redis로만 하고, 프로세스당 하나의 리스너 스레드가
+    `events:*` 패턴을 구독해 로컬 구독자에게 전달한다.
+    Redis를 사용할 수 없으면 프로세스 내 전달로 대체한다.
+
+    publish()는 커밋 직후(after_commit) 이벤트 루프에서도 호출되므로 Redis를 직접 호출하지 않고
+    발행 스레드의 대기열에 넣기만 한다 (프로세스 안에서 발행 순서 유지).
+    """
+
+    CHANNEL_PREFIX = "events:"
+    CLOSE_TIMEOUT_SECONDS = 5.0
+
+    def __init__(self, queue_size: int = 100, publish_queue_size: int = 1000):
+        super().__init__(queue_size)
+        self._listener: Optional[threading.Thread] = None
+        self._publisher: Optional[threading.Thread] = None
+        self._outbox: queue.Queue = queue.Queue(maxsize=publish_queue_size)
+        self._stop = threading.Event()
+
+        metrics.register_gauge("events.publish_queue_depth", self._outbox.qsize)
+
+    def publish(self, channel: str, event: Dict[str, Any]) -> None:
+        """이벤트 발행 (대기열이 가득 차면 버림)"""
+        self._ensure_publisher()
+        try:
+            self._outbox.put_nowait((channel, event))
+        except queue.Full:
+            metrics.inc("events.dropped")
+
+    def subscribe(self, channel: str) -> Subscription:
+        self._ensure_listener()
+        return super().subscribe(channel)
+
+    def close(self) -> None:
+        """리스너 중지, 대기 중인 이벤트는 CLOSE_TIMEOUT_SECONDS 안에서 발행 후 종료"""
+        self._stop.set()
+        publisher = self._publisher
+        if publisher is None or not publisher.is_alive():
+            return
+        try:
+            self._outbox.put(None, timeout=self.CLOSE_TIMEOUT_SECONDS)
+        except queue.Full:
+            return
+        publisher.join(timeout=self.CLOSE_TIMEOUT_SECONDS)
+
+    def _ensure_publisher(self) -> None:
+        with self._lock:
+            if self._publisher is not None and self._publisher.is_alive():
+                return
+            self._publisher = threading.Thread(target=self._publish_loop, name="event-publisher", daemon=True)
+            self._publisher.start()
+
+    def _publish_loop(self) -> None:
+        """대기열의 이벤트를 순서대로 발행 (None을 받으면 종료)"""
+        while True:
+            item = self._outbox.get()
+            if item is None:
+                return
+            self._publish_now(*item)
+
+    def _publish_now(self, channel: str, event: Dict[str, Any]) -> None:
+        client = get_redis()
+        if client is None:
+            super().publish(channel, event)
+            return
+
+        metrics.inc("events.published")
+        try:
+            client.publish(self.CHANNEL_PREFIX + channel, json.dumps(event, default=str))
+        except Exception as exc:
+            logger.warning("이벤트 발행 실패 (로컬 전달로 대체): %s", exc)
+            metrics.inc("events.publish_errors")
+            self._dispatch(channel, event)
+
+    def _ensure_listener(self) -> None:
+        with self._lock:
+            if self._listener is not None and self._listener.is_alive():
+                return
+            if get_redis() is None:
+                return
+            self._stop.clear()
+            self._listener = threading.Thread(target=self._listen, name="event-bus", daemon=True)
+            self._listener.start()
+
+    def _listen(self) -> None:
+        """Redis 메시지를 로컬 구독자에게 전달 (연결이 끊기면 재연결)"""
+        while not self._stop.is_set():
+            pubsub = None
+            try:
+                pubsub = get_redis().pubsub(ignore_subscribe_messages=True)
+                pubsub.psubscribe(self.CHANNEL_PREFIX + "*")
+                while not self._stop.is_set():
+                    message = pubsub.get_message(timeout=1.0)
+                    if message is None:
+                        continue
+                    channel, event = self._decode(message)
+                    if channel is not None:
+                        self._dispatch(channel, event)
+            except Exception as exc:
+                logger.warning("이벤트 리스너 오류, 재연결: %s", exc)
+                self._stop.wait(1.0)
+            finally:
+                if pubsub is not None:
+                    try:
+                        pubsub.close()
+                    except Exception:
+                        pass
+
+    def _decode(self, message: Dict[str, Any]) -> Tuple[Optional[str], Dict[str, Any]]:
+        channel = message.get("channel")
+        if isinstance(channel, bytes):
+            channel = channel.decode("utf-8")
+        if not channel or not channel.startswith(self.CHANNEL_PREFIX):
+            return None, {}
+        try:
+            return channel[len(self.CHANNEL_PREFIX):], json.loads(message["data"])
+        except (TypeError, ValueError):
+            return None, {}
+
+
+def _create_event_bus() -> InMemoryEventBus:
+    if settings.EVENT_BUS_BACKEND == "redis":
+        return RedisEventBus(settings.EVENT_QUEUE_SIZE, settings.EVENT_PUBLISH_QUEUE_SIZE)
+
+    if settings.JOBS_EMBEDDED_WORKERS <= 0:
+        # 작업은 별도 워커 프로세스가 처리하므로 수집/분석 상태 변경이 이 프로세스의 구독자에게 오지 않는다
+        logger.warning(
+            "EVENT_BUS_BACKEND=memory는 같은 프로세스 안에서만 이벤트를 전달합니다. "
+            "JOBS_EMBEDDED_WORKERS=0이면 작업 워커(python -m src.jobs)의 상태 변경이 상태 스트림(/events)에 "
+            "전달되지 않으므로 EVENT_BUS_BACKEND=redis로 설정하세요."
+        )
+        metrics.inc("events.memory_without_embedded_workers")
+    return InMemoryEventBus(settings.EVENT_QUEUE_SIZE)
+
+
+_event_bus: Optional[InMemoryEventBus] = None
+
+
+def get_event_bus() -> InMemoryEventBus:
+    """현재 이벤트 버스 반환"""
+    global _event_bus
+    if _event_bus is None:
+        _event_bus = _create_event_bus()
+    return _event_bus
+
+
+def set_event_bus(bus: InMemoryEventBus) -> None:
+    """이벤트 버스 교체 (테스트에서 프로세스 내 버스로 대체할 때 사용)"""
+    global _event_bus
+    _event_bus = bus
@@ -12,12 +12,14 @@ class BaseAPIException(Exception):
         message: str, 
         error_code: str, 
         status_code: int = 400,
-        details: Optional[Dict[str, Any]] = None
+        details: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None
     ):
         self.message = message
         self.error_code = error_code
         self.status_code = status_code
         self.details = details or {}
+        self.headers = headers
         super().__init__(self.message)
 
 
@@ -85,9 +87,10 @@ class InternalServerException(BaseAPIException):
 
 class ServiceUnavailableException(BaseAPIException):
     """서비스 불가 예외"""
-    def __init__(self, message: str = "서비스를 일시적으로 사용할 수 없습니다."):
+    def __init__(self, message: str = "서비스를 일시적으로 사용할 수 없습니다.", retry_after: Optional[int] = None):
         super().__init__(
             message=message,
             error_code="SERVICE_UNAVAILABLE",
-            status_code=503
+            status_code=503,
+            headers={"Retry-After": str(retry_after)} if retry_after is not None else None
         )
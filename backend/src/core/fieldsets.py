@@ -0,0 +1,66 @@
+"""
+Sparse Fieldsets
+fields= 쿼리 파라미터로 응답 필드 선택
+
+허용되는 필드 이름은 응답 스키마의 필드이며, 선택된 필드에 해당하는 컬럼만 SQL로 조회한다.
+선택 응답은 스키마의 일부만 담으므로 response_model 검증 없이 JSONResponse로 반환한다.
+"""
+import enum
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple, Type
+from uuid import UUID
+
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from .config import settings
+from .exceptions import ValidationException
+from .metrics import metrics
+from .responses import FastJSONResponse
+
+
+def parse_fields(raw: Optional[str], schema: Type[BaseModel]) -> Optional[Tuple[str, ...]]:
+    """
+    fields= 값 검증 (없으면 None = 전체 필드)
+    스키마에 없는 이름이 있으면 400, 반환 순서는 스키마 필드 순서
+    """
+    if raw is None:
+        return None
+
+    requested = {name.strip() for name in raw.split(",") if name.strip()}
+    if not requested:
+        raise ValidationException("fields에는 하나 이상의 필드 이름을 지정해야 합니다.")
+
+    allowed = tuple(schema.model_fields)
+    unknown = sorted(requested.difference(allowed))
+    if unknown:
+        raise ValidationException(
+            "선택할 수 없는 필드가 포함되어 있습니다.",
+            {"fields": unknown, "allowed": list(allowed)}
+        )
+
+    metrics.inc("fieldsets.requests")
+    return tuple(name for name in allowed if name in requested)
+
+
+def to_json_value(value: Any) -> Any:
+    """컬럼 값을 응답 값으로 변환 (응답 스키마 변환과 같은 규칙)"""
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+def sparse_response(content: Dict[str, Any], response: Optional[Response] = None) -> JSONResponse:
+    """선택 필드 응답 (라우터에 주입된 Response의 헤더를 옮김)"""
+    response_class = FastJSONResponse if settings.FAST_JSON else JSONResponse
+    result = response_class(content)
+    if response is not None:
+        for name, value in response.headers.items():
+            if name not in ("content-length", "content-type"):
+                result.headers[name] = value
+    return result
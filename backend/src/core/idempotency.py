@@ -0,0 +1,109 @@
+"""
+Idempotency Store
+Idempotency-Key 헤더가 있는 POST 요청의 응답 저장 (재시도 시 원래 응답 재전송)
+
+키는 (사용자, 경로, Idempotency-Key) 단위이며, 처리가 시작되면 "처리 중" 표시를 먼저
+저장해 같은 키의 동시 요청이 두 번 실행되지 않게 한다.
+- 1차: 프로세스 내 TTL 캐시
+- 2차: Redis (IDEMPOTENCY_REDIS=True 인 경우, SET NX로 프로세스 간 선점)
+"""
+import json
+import logging
+import threading
+from typing import Any, Dict, Optional
+
+from .cache import TTLCache
+from .config import settings
+from .metrics import metrics
+from .redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+# 처리 중 표시 (status가 없는 항목)
+IN_PROGRESS: Dict[str, Any] = {"in_progress": True}
+
+
+class IdempotencyStore:
+    """Idempotency-Key → 저장된 응답"""
+
+    KEY_PREFIX = "idempotency:"
+
+    def __init__(self, maxsize: int, ttl: int, lock_ttl: int, use_redis: bool = False):
+        self.ttl = ttl
+        self.lock_ttl = lock_ttl
+        self.use_redis = use_redis
+        self._local = TTLCache("idempotency", maxsize, ttl)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(user_id: Any, path: str, idempotency_key: str) -> str:
+        return f"{user_id}:{path}:{idempotency_key}"
+
+    def reserve(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        키 선점: 처음 보는 키면 처리 중으로 표시하고 None 반환,
+        이미 있으면 저장된 항목(처리 중 표시 또는 응답) 반환
+        """
+        with self._lock:
+            entry = self._local.get(key)
+            if entry is not None:
+                return entry
+            self._local.set(key, IN_PROGRESS, ttl=self.lock_ttl)
+
+        client = self._redis()
+        if client is None:
+            return None
+
+        try:
+            if client.set(self.KEY_PREFIX + key, json.dumps(IN_PROGRESS), nx=True, ex=self.lock_ttl):
+                return None
+            raw = client.get(self.KEY_PREFIX + key)
+        except Exception as exc:
+            logger.warning("idempotency(Redis) 선점 실패: %s", exc)
+            return None
+
+        if raw is None:
+            return None
+        entry = json.loads(raw)
+        if entry.get("status") is not None:
+            self._local.set(key, entry)
+        else:
+            self._local.delete(key)
+        return entry
+
+    def complete(self, key: str, status: int, body: bytes, media_type: Optional[str]) -> None:
+        """응답 저장"""
+        entry = {"status": status, "body": body.decode("utf-8"), "media_type": media_type}
+        self._local.set(key, entry)
+
+        client = self._redis()
+        if client is None:
+            return
+        try:
+            client.setex(self.KEY_PREFIX + key, self.ttl, json.dumps(entry, ensure_ascii=False))
+        except Exception as exc:
+            logger.warning("idempotency(Redis) 저장 실패: %s", exc)
+
+    def release(self, key: str) -> None:
+        """처리 실패 시 선점 해제 (같은 키로 다시 시도 가능)"""
+        self._local.delete(key)
+        metrics.inc("idempotency.released")
+
+        client = self._redis()
+        if client is None:
+            return
+        try:
+            client.delete(self.KEY_PREFIX + key)
+        except Exception as exc:
+            logger.warning("idempotency(Redis) 삭제 실패: %s", exc)
+
+    def _redis(self):
+        return get_redis() if self.use_redis else None
+
+
+idempotency_store = IdempotencyStore(
+    maxsize=settings.IDEMPOTENCY_MAX_SIZE,
+    ttl=settings.IDEMPOTENCY_TTL_SECONDS,
+    lock_ttl=settings.IDEMPOTENCY_LOCK_SECONDS,
+    use_redis=settings.IDEMPOTENCY_REDIS
+)
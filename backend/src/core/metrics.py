@@ -0,0 +1,95 @@
+"""
+Metrics
+프로세스 내 운영 지표 (카운터/게이지/히스토그램) 수집
+"""
+import bisect
+import threading
+from typing import Any, Callable, Dict, Sequence, Tuple
+
+# 기본 히스토그램 구간 상한 (초)
+DEFAULT_BUCKETS: Tuple[float, ...] = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Histogram:
+    """누적 구간 히스토그램 (마지막 구간은 +Inf)"""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def snapshot(self) -> Dict[str, Any]:
+        cumulative = 0
+        buckets = {}
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            cumulative += count
+            buckets["+Inf" if bound == float("inf") else str(bound)] = cumulative
+        return {"count": self.count, "sum": round(self.sum, 6), "max": round(self.max, 6), "buckets": buckets}
+
+
+class Metrics:
+    """스레드 안전한 인메모리 지표 레지스트리"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[str, float] = {}
+        self._gauges: Dict[str, float] = {}
+        self._gauge_callbacks: Dict[str, Callable[[], Any]] = {}
+        self._histograms: Dict[str, Histogram] = {}
+
+    def inc(self, name: str, value: float = 1) -> None:
+        """카운터 증가"""
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def set_gauge(self, name: str, value: float) -> None:
+        """게이지 값 설정"""
+        with self._lock:
+            self._gauges[name] = value
+
+    def register_gauge(self, name: str, callback: Callable[[], Any]) -> None:
+        """조회 시점에 계산되는 게이지 등록"""
+        with self._lock:
+            self._gauge_callbacks[name] = callback
+
+    def observe(self, name: str, value: float, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        """히스토그램에 관측값 추가 (구간은 처음 관측 시 고정)"""
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = Histogram(buckets)
+            histogram.observe(value)
+
+    def get(self, name: str) -> float:
+        """카운터 또는 게이지 값 조회"""
+        with self._lock:
+            if name in self._counters:
+                return self._counters[name]
+            return self._gauges.get(name, 0)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """전체 지표 스냅샷"""
+        with self._lock:
+            counters = dict(self._counters)
+            gauges = dict(self._gauges)
+            callbacks = dict(self._gauge_callbacks)
+            histograms = {name: histogram.snapshot() for name, histogram in self._histograms.items()}
+
+        for name, callback in callbacks.items():
+            try:
+                gauges[name] = callback()
+            except Exception:
+                gauges[name] = None
+
+        return {"counters": counters, "gauges": gauges, "histograms": histograms}
+
+
+metrics = Metrics()
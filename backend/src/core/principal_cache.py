@@ -0,0 +1,213 @@
+"""
+Principal Cache
+검증된 인증 사용자(principal) 캐시
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional
+
+from .cache import TTLCache
+from .config import settings
+from .metrics import metrics
+from .redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+
+class PrincipalCache:
+    """
+    액세스 토큰 → 사용자 스냅샷 캐시
+    - 1차: 프로세스 내 LRU + TTL 캐시
+    - 2차: Redis (PRINCIPAL_CACHE_REDIS=True 인 경우)
+    항목의 TTL은 토큰 만료 시각을 넘지 않는다.
+
+    Redis를 사용하면 사용자 무효화를 pub/sub으로 모든 프로세스의 1차 캐시에 전달하고,
+    Redis 호출은 이벤트 루프를 막지 않도록 스레드에서 실행한다.
+    Redis를 사용하지 않으면 다른 프로세스의 1차 캐시는 최대 TTL 동안 남는다.
+    """
+
+    KEY_PREFIX = "principal:"
+    USER_KEY_PREFIX = "principal:user:"
+    INVALIDATION_CHANNEL = "principal:invalidate"
+
+    def __init__(self, enabled: bool, maxsize: int, ttl: int, use_redis: bool = False):
+        self.enabled = enabled
+        self.ttl = ttl
+        self.use_redis = use_redis
+        self._local = TTLCache("principal", maxsize, ttl)
+        self._lock = threading.Lock()
+        self._listener: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._background: Optional[ThreadPoolExecutor] = None
+
+    @staticmethod
+    def _key(token: str) -> str:
+        """원본 토큰 대신 해시를 키로 사용"""
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+    def _redis(self):
+        return get_redis() if self.use_redis else None
+
+    def get_local(self, token: str) -> Optional[Dict[str, Any]]:
+        """1차 캐시만 조회 (Redis 조회 없음)"""
+        if not self.enabled:
+            return None
+        return self._local.get(self._key(token))
+
+    async def get(self, token: str) -> Optional[Dict[str, Any]]:
+        """토큰에 해당하는 principal 조회"""
+        principal = self.get_local(token)
+        if principal is not None or not self.enabled or not self.use_redis:
+            return principal
+
+        self._ensure_listener()
+        key = self._key(token)
+        principal = await asyncio.to_thread(self._redis_get, key)
+        if principal is not None:
+            # Redis에 남은 시간만큼만 1차 캐시에 둔다 (TTL이 두 번 이어지지 않도록)
+            now = time.time()
+            self._local.set(key, principal, min(self.ttl, principal["cached_until"] - now, principal["exp"] - now))
+        return principal
+
+    async def set(self, token: str, principal: Dict[str, Any], expires_at: int) -> None:
+        """principal 저장 (expires_at: 토큰 만료 epoch 초)"""
+        if not self.enabled:
+            return
+
+        now = time.time()
+        ttl = min(self.ttl, expires_at - now)
+        if ttl <= 0:
+            return
+
+        key = self._key(token)
+        entry = dict(principal, exp=expires_at, cached_until=now + ttl)
+        self._local.set(key, entry, ttl)
+
+        if self.use_redis:
+            self._ensure_listener()
+            await asyncio.to_thread(self._redis_set, key, entry, ttl)
+
+    def invalidate_user(self, user_id: Any) -> None:
+        """사용자의 모든 캐시 항목 무효화 (비활성화/탈퇴 시)"""
+        user_id = str(user_id)
+        self._invalidate_local(user_id)
+
+        if self.use_redis:
+            # flush 중(이벤트 루프일 수 있음)에 호출되므로 Redis 정리와 전파는 백그라운드에서 처리
+            self._run_in_background(self._redis_invalidate, user_id)
+
+    def clear(self) -> None:
+        """1차 캐시 전체 삭제"""
+        self._local.clear()
+
+    def close(self) -> None:
+        """무효화 리스너 중지"""
+        self._stop.set()
+
+    def _invalidate_local(self, user_id: str) -> None:
+        removed = self._local.delete_where(lambda principal: principal["id"] == user_id)
+        metrics.inc("cache.principal.invalidations", removed)
+
+    def _run_in_background(self, fn, *args: Any) -> None:
+        with self._lock:
+            if self._background is None:
+                self._background = ThreadPoolExecutor(max_workers=1, thread_name_prefix="principal-cache")
+        self._background.submit(fn, *args)
+
+    def _redis_get(self, key: str) -> Optional[Dict[str, Any]]:
+        client = self._redis()
+        if client is None:
+            return None
+
+        try:
+            raw = client.get(self.KEY_PREFIX + key)
+        except Exception as exc:
+            logger.warning("principal 캐시(Redis) 조회 실패: %s", exc)
+            return None
+
+        if raw is None:
+            metrics.inc("cache.principal.redis_misses")
+            return None
+
+        metrics.inc("cache.principal.redis_hits")
+        return json.loads(raw)
+
+    def _redis_set(self, key: str, entry: Dict[str, Any], ttl: float) -> None:
+        client = self._redis()
+        if client is None:
+            return
+
+        user_key = self.USER_KEY_PREFIX + entry["id"]
+        try:
+            pipe = client.pipeline()
+            pipe.setex(self.KEY_PREFIX + key, max(1, int(ttl)), json.dumps(entry))
+            pipe.sadd(user_key, key)
+            pipe.expire(user_key, self.ttl)
+            pipe.execute()
+        except Exception as exc:
+            logger.warning("principal 캐시(Redis) 저장 실패: %s", exc)
+
+    def _redis_invalidate(self, user_id: str) -> None:
+        """Redis 항목 삭제 후 다른 프로세스에 무효화 전파"""
+        client = self._redis()
+        if client is None:
+            return
+
+        user_key = self.USER_KEY_PREFIX + user_id
+        try:
+            keys = [self.KEY_PREFIX + k.decode() for k in client.smembers(user_key)]
+            client.delete(user_key, *keys)
+            client.publish(self.INVALIDATION_CHANNEL, user_id)
+        except Exception as exc:
+            logger.warning("principal 캐시(Redis) 무효화 실패: %s", exc)
+
+    def _ensure_listener(self) -> None:
+        with self._lock:
+            if self._listener is not None and self._listener.is_alive():
+                return
+            if self._redis() is None:
+                return
+            self._stop.clear()
+            self._listener = threading.Thread(target=self._listen, name="principal-cache", daemon=True)
+            self._listener.start()
+
+    def _listen(self) -> None:
+        """다른 프로세스의 무효화를 1차 캐시에 반영 (연결이 끊기면 재연결)"""
+        while not self._stop.is_set():
+            pubsub = None
+            try:
+                pubsub = self._redis().pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(self.INVALIDATION_CHANNEL)
+                # 재연결 사이에 놓친 무효화가 있을 수 있으므로 1차 캐시를 비우고 시작
+                self._local.clear()
+                while not self._stop.is_set():
+                    message = pubsub.get_message(timeout=1.0)
+                    if message is None:
+                        continue
+                    user_id = message.get("data")
+                    if isinstance(user_id, bytes):
+                        user_id = user_id.decode("utf-8")
+                    if isinstance(user_id, str):
+                        self._invalidate_local(user_id)
+            except Exception as exc:
+                logger.warning("principal 캐시 무효화 리스너 오류, 재연결: %s", exc)
+                self._stop.wait(1.0)
+            finally:
+                if pubsub is not None:
+                    try:
+                        pubsub.close()
+                    except Exception:
+                        pass
+
+
+principal_cache = PrincipalCache(
+    enabled=settings.PRINCIPAL_CACHE_ENABLED,
+    maxsize=settings.PRINCIPAL_CACHE_MAX_SIZE,
+    ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+    use_redis=settings.PRINCIPAL_CACHE_REDIS
+)
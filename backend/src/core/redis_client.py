@@ -0,0 +1,38 @@
+"""
+Redis Client
+Redis 연결 관리 (선택 사항)
+"""
+import logging
+from typing import Optional
+
+from .config import settings
+
+try:
+    import redis
+except ImportError:  # pragma: no cover - redis 미설치 환경
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+_client = None
+
+
+def get_redis() -> Optional["redis.Redis"]:
+    """동기 Redis 클라이언트 반환 (사용 불가 시 None)"""
+    global _client
+
+    if redis is None:
+        return None
+
+    if _client is None:
+        try:
+            _client = redis.Redis.from_url(
+                settings.REDIS_URL,
+                socket_timeout=0.5,
+                socket_connect_timeout=0.5
+            )
+        except Exception as exc:
+            logger.warning("Redis 클라이언트 생성 실패: %s", exc)
+            return None
+
+    return _client
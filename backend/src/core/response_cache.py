@@ -0,0 +1,155 @@
+"""
+Response Cache
+외부 조회 결과 응답 캐시 (2단계 + 동시 요청 병합)
+"""
+import asyncio
+import json
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from .cache import TTLCache
+from .config import settings
+from .metrics import metrics
+from .redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """
+    (엔드포인트, 검색어, limit) → 응답 캐시
+    - 1차: 프로세스 내 LRU + TTL 캐시
+    - 2차: Redis (use_redis=True 인 경우, 프로세스 간 공유)
+    같은 키를 동시에 요청하면 한 번만 계산하고 나머지는 그 결과를 기다린다 (single-flight).
+    """
+
+    KEY_PREFIX = "response:"
+
+    def __init__(
+        self,
+        name: str,
+        enabled: bool,
+        maxsize: int,
+        ttl: int,
+        use_redis: bool = False,
+        redis_ttl: Optional[int] = None
+    ):
+        self.name = name
+        self.enabled = enabled
+        self.use_redis = use_redis
+        self.redis_ttl = redis_ttl or ttl
+        self._local = TTLCache(name, maxsize, ttl)
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+        metrics.register_gauge(f"cache.{name}.inflight", lambda: len(self._inflight))
+
+    def make_key(self, endpoint: str, q: str, limit: int) -> str:
+        # 응답 본문에 검색어가 그대로 들어가므로(query, 결과 문구) 검색어는 정규화하지 않는다
+        return f"{self.name}:{endpoint}:{limit}:{q}"
+
+    async def get_or_compute(
+        self,
+        endpoint: str,
+        q: str,
+        limit: int,
+        compute: Callable[[], Awaitable[Any]]
+    ) -> Dict[str, Any]:
+        """캐시된 응답 반환, 없으면 compute()로 계산해 저장"""
+        if not self.enabled:
+            return self._dump(await compute())
+
+        key = self.make_key(endpoint, q, limit)
+        value = self._local.get(key)
+        if value is not None:
+            return value
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._load(key, compute))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            metrics.inc(f"cache.{self.name}.coalesced")
+
+        # 요청이 취소되어도 계산은 끝까지 진행해 기다리는 다른 요청에 전달한다
+        return await asyncio.shield(task)
+
+    def invalidate(self, endpoint: str, q: str, limit: int) -> None:
+        """단일 항목 무효화"""
+        key = self.make_key(endpoint, q, limit)
+        self._local.delete(key)
+
+        client = self._redis()
+        if client is None:
+            return
+        try:
+            client.delete(self.KEY_PREFIX + key)
+        except Exception as exc:
+            logger.warning("%s 캐시(Redis) 삭제 실패: %s", self.name, exc)
+
+    def clear(self) -> None:
+        """1차 캐시 전체 삭제"""
+        self._local.clear()
+
+    async def _load(self, key: str, compute: Callable[[], Awaitable[Any]]) -> Dict[str, Any]:
+        # Redis 호출은 이벤트 루프를 막지 않도록 스레드에서 실행
+        value = await asyncio.to_thread(self._redis_get, key) if self.use_redis else None
+        if value is None:
+            value = self._dump(await compute())
+            if self.use_redis:
+                await asyncio.to_thread(self._redis_set, key, value)
+
+        self._local.set(key, value)
+        return value
+
+    def _forget(self, key: str, task: asyncio.Future) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+    def _redis(self):
+        return get_redis() if self.use_redis else None
+
+    def _redis_get(self, key: str) -> Optional[Dict[str, Any]]:
+        client = self._redis()
+        if client is None:
+            return None
+
+        try:
+            raw = client.get(self.KEY_PREFIX + key)
+        except Exception as exc:
+            logger.warning("%s 캐시(Redis) 조회 실패: %s", self.name, exc)
+            return None
+
+        if raw is None:
+            metrics.inc(f"cache.{self.name}.redis_misses")
+            return None
+
+        metrics.inc(f"cache.{self.name}.redis_hits")
+        return json.loads(raw)
+
+    def _redis_set(self, key: str, value: Dict[str, Any]) -> None:
+        client = self._redis()
+        if client is None:
+            return
+
+        try:
+            client.setex(self.KEY_PREFIX + key, self.redis_ttl, json.dumps(value, ensure_ascii=False))
+        except Exception as exc:
+            logger.warning("%s 캐시(Redis) 저장 실패: %s", self.name, exc)
+
+    @staticmethod
+    def _dump(value: Any) -> Dict[str, Any]:
+        """응답 모델을 JSON 호환 dict로 변환"""
+        if hasattr(value, "model_dump"):
+            return value.model_dump(mode="json")
+        return value
+
+
+search_cache = ResponseCache(
+    "search",
+    enabled=settings.SEARCH_CACHE_ENABLED,
+    maxsize=settings.SEARCH_CACHE_MAX_SIZE,
+    ttl=settings.SEARCH_CACHE_TTL_SECONDS,
+    use_redis=settings.SEARCH_CACHE_REDIS,
+    redis_ttl=settings.SEARCH_CACHE_REDIS_TTL_SECONDS
+)
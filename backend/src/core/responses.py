@@ -0,0 +1,65 @@
+"""
+Fast JSON Responses
+빠른 JSON 직렬화 경로 (FAST_JSON=True 인 경우에만 사용)
+
+기본 경로는 핸들러가 반환한 응답 모델을 response_model로 다시 검증한 뒤
+jsonable_encoder → json.dumps로 인코딩한다. 서비스가 이미 응답 스키마로 만든 객체는
+검증이 끝난 값이므로,
+- FastJSONResponse: orjson(미설치 시 pydantic-core)으로 인코딩하는 응답 클래스
+- trusted_response: 응답 모델을 재검증 없이 pydantic-core 직렬화기로 바로 바이트로 변환
+을 제공한다. FAST_JSON=False면 trusted_response는 모델을 그대로 반환해 기존 경로를 탄다.
+"""
+from typing import Any, Optional, Union
+
+import pydantic_core
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from .config import settings
+from .metrics import metrics
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson 미설치 환경
+    orjson = None
+
+
+class FastJSONResponse(JSONResponse):
+    """orjson 기반 JSON 응답 (미설치 시 pydantic-core)"""
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.__pydantic_serializer__.to_json(content, by_alias=True)
+        if orjson is not None:
+            return orjson.dumps(content, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS)
+        return pydantic_core.to_json(content)
+
+
+def _orjson_default(value: Any) -> Any:
+    # orjson이 직접 다루지 못하는 값 (Decimal, pydantic 모델 등)
+    return pydantic_core.to_jsonable_python(value)
+
+
+def trusted_response(model: BaseModel, response: Optional[Response] = None) -> Union[BaseModel, Response]:
+    """
+    서비스가 만든 응답 모델을 재검증 없이 직렬화
+    - response: 라우터에 주입된 Response (설정된 헤더를 그대로 옮김)
+    Response를 반환하면 FastAPI는 response_model 검증을 건너뛰므로, 반환 모델은
+    라우트의 response_model과 같은 스키마여야 한다.
+    """
+    if not settings.FAST_JSON:
+        return model
+
+    metrics.inc("responses.fast_json")
+    fast = FastJSONResponse(model)
+    if response is not None:
+        for name, value in response.headers.items():
+            if name not in ("content-length", "content-type"):
+                fast.headers[name] = value
+    return fast
+
+
+def default_response_class() -> type:
+    """앱 기본 응답 클래스 (재검증은 유지하고 인코딩만 교체)"""
+    return FastJSONResponse if settings.FAST_JSON else JSONResponse
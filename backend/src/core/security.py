@@ -2,8 +2,17 @@
 Security Utilities
 비밀번호 해싱 및 검증
 """
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable
+
 from passlib.context import CryptContext
 
+from .config import settings
+from .exceptions import ServiceUnavailableException
+from .metrics import metrics
+
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
@@ -15,3 +24,73 @@ def hash_password(password: str) -> str:
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """비밀번호 검증"""
     return pwd_context.verify(plain_password, hashed_password)
+
+
+class PasswordExecutor:
+    """
+    비밀번호 해싱 전용 스레드 풀
+    bcrypt 연산이 이벤트 루프를 막지 않도록 별도 스레드에서 실행하고,
+    동시 실행 수(max_workers)와 대기열 길이(max_queue)를 제한한다.
+    """
+
+    def __init__(self, max_workers: int, max_queue: int):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="password")
+        self._lock = threading.Lock()
+        self._pending = 0  # 대기 + 실행 중
+        self._active = 0
+
+        metrics.register_gauge("password.queue_depth", lambda: self.queue_depth)
+        metrics.register_gauge("password.active", lambda: self._active)
+
+    @property
+    def queue_depth(self) -> int:
+        """실행을 기다리는 작업 수"""
+        return self._pending - self._active
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """함수를 전용 스레드 풀에서 실행"""
+        with self._lock:
+            if self.max_queue and self.queue_depth >= self.max_queue:
+                metrics.inc("password.rejected")
+                raise ServiceUnavailableException("요청이 많아 잠시 후 다시 시도해주세요.")
+            self._pending += 1
+
+        # 슬롯은 스레드 풀 작업이 끝나거나 취소될 때 반납한다.
+        # (대기 중에 요청이 취소되면 _call은 실행되지 않는다)
+        future = self._executor.submit(self._call, fn, args)
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+
+    def _release(self, future: Future) -> None:
+        with self._lock:
+            self._pending -= 1
+        if future.cancelled():
+            metrics.inc("password.cancelled")
+
+    def _call(self, fn: Callable[..., Any], args: tuple) -> Any:
+        with self._lock:
+            self._active += 1
+        try:
+            return fn(*args)
+        finally:
+            with self._lock:
+                self._active -= 1
+            metrics.inc("password.completed")
+
+
+password_executor = PasswordExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_queue=settings.PASSWORD_HASH_MAX_QUEUE
+)
+
+
+async def hash_password_async(password: str) -> str:
+    """비밀번호 해시 (전용 스레드 풀에서 실행)"""
+    return await password_executor.run(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """비밀번호 검증 (전용 스레드 풀에서 실행)"""
+    return await password_executor.run(verify_password, plain_password, hashed_password)
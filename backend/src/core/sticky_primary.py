@@ -0,0 +1,78 @@
+"""
+Sticky Primary
+사용자별 primary 고정 구간 (read-your-writes)
+
+사용자가 쓰기 요청을 보낸 직후에는 복제본에 아직 반영되지 않았을 수 있으므로
+REPLICA_STICKY_SECONDS 동안 그 사용자의 조회도 primary로 보낸다.
+"""
+import logging
+import math
+from typing import Any
+
+from .cache import TTLCache
+from .config import settings
+from .metrics import metrics
+from .redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+
+class StickyPrimary:
+    """
+    최근 쓰기 사용자 목록
+    - 1차: 프로세스 내 TTL 캐시
+    - 2차: Redis (REPLICA_STICKY_REDIS=True 인 경우, 다른 워커의 쓰기도 반영)
+    """
+
+    KEY_PREFIX = "sticky_primary:"
+
+    def __init__(self, window: float, maxsize: int = 100000, use_redis: bool = False):
+        self.window = window
+        self.use_redis = use_redis
+        self._local = TTLCache("sticky_primary", maxsize, window)
+
+    def _redis(self):
+        return get_redis() if self.use_redis else None
+
+    def mark(self, user_id: Any) -> None:
+        """사용자의 쓰기 기록 (고정 구간 시작)"""
+        if self.window <= 0:
+            return
+
+        key = str(user_id)
+        self._local.set(key, True)
+
+        client = self._redis()
+        if client is None:
+            return
+
+        try:
+            client.setex(self.KEY_PREFIX + key, max(1, math.ceil(self.window)), 1)
+        except Exception as exc:
+            logger.warning("sticky primary(Redis) 저장 실패: %s", exc)
+
+    def is_sticky(self, user_id: Any) -> bool:
+        """고정 구간 안이면 True (Redis 오류 시에도 안전하게 True)"""
+        if self.window <= 0:
+            return False
+
+        key = str(user_id)
+        if self._local.get(key):
+            return True
+
+        client = self._redis()
+        if client is None:
+            return False
+
+        try:
+            return bool(client.exists(self.KEY_PREFIX + key))
+        except Exception as exc:
+            logger.warning("sticky primary(Redis) 조회 실패: %s", exc)
+            metrics.inc("db.replica.sticky_errors")
+            return True
+
+
+sticky_primary = StickyPrimary(
+    window=settings.REPLICA_STICKY_SECONDS,
+    use_redis=settings.REPLICA_STICKY_REDIS
+)
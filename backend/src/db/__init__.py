@@ -1,21 +1,43 @@
 from .session import (
     engine,
+    async_engine,
     SessionLocal,
+    AsyncSessionLocal,
     Base,
+    DBSession,
     get_db,
+    get_async_db,
+    get_db_session,
+    has_replica,
+    read_session_factory,
     get_db_context,
+    run_db,
     MongoDB,
     get_mongodb,
-    init_db
+    init_db,
+    close_db
 )
+from .query_counter import QueryCounter, count_queries, assert_max_queries
 
 __all__ = [
     "engine",
+    "async_engine",
     "SessionLocal",
+    "AsyncSessionLocal",
     "Base",
+    "DBSession",
     "get_db",
+    "get_async_db",
+    "get_db_session",
+    "has_replica",
+    "read_session_factory",
     "get_db_context",
+    "run_db",
     "MongoDB",
     "get_mongodb",
-    "init_db"
+    "init_db",
+    "close_db",
+    "QueryCounter",
+    "count_queries",
+    "assert_max_queries"
 ]
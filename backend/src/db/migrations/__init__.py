@@ -0,0 +1,17 @@
+from .runner import (
+    run_migrations,
+    get_applied_versions,
+    load_migrations,
+    add_column_if_missing,
+    create_index_if_missing
+)
+from .query_plans import check_query_plans
+
+__all__ = [
+    "run_migrations",
+    "get_applied_versions",
+    "load_migrations",
+    "add_column_if_missing",
+    "create_index_if_missing",
+    "check_query_plans"
+]
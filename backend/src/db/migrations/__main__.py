@@ -0,0 +1,53 @@
+"""
+Migration CLI
+
+사용법 (backend 디렉터리에서):
+    python -m src.db.migrations upgrade   # 미적용 마이그레이션 적용
+    python -m src.db.migrations status    # 적용 현황
+    python -m src.db.migrations check     # 핵심 쿼리 EXPLAIN + 중복 인덱스 점검 (실패 시 종료 코드 1)
+"""
+import argparse
+import sys
+
+from src.db.session import Base, engine, init_db
+from .runner import get_applied_versions, load_migrations
+from .query_plans import check_query_plans, find_redundant_indexes
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="BizAnalyzer DB migrations")
+    parser.add_argument("command", choices=["upgrade", "status", "check"])
+    args = parser.parse_args()
+
+    if args.command == "upgrade":
+        init_db()
+        return 0
+
+    if args.command == "status":
+        with engine.connect() as conn:
+            applied = get_applied_versions(conn)
+        for module in load_migrations():
+            mark = "x" if module.VERSION in applied else " "
+            print(f"[{mark}] {module.VERSION:04d} {module.DESCRIPTION}")
+        return 0
+
+    failures = check_query_plans(engine)
+    redundant = find_redundant_indexes(Base.metadata)
+    if not failures:
+        print("✅ All hot queries use an index")
+    if not redundant:
+        print("✅ No redundant indexes")
+    if not failures and not redundant:
+        return 0
+
+    for name, lines in failures.items():
+        print(f"❌ {name}: sequential scan")
+        for line in lines:
+            print(f"    {line}")
+    for name, covering in redundant.items():
+        print(f"❌ {name}: redundant (covered by {covering})")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+"""
+Query Plan Check
+자주 실행되는 쿼리가 인덱스를 사용하는지 EXPLAIN으로 확인
+
+- PostgreSQL: enable_seqscan=off 상태에서도 Seq Scan이 남으면 사용할 인덱스가 없는 것
+- SQLite: EXPLAIN QUERY PLAN 결과에 인덱스 없는 SCAN이 있으면 실패
+
+모델에 선언된 인덱스 중 다른 인덱스가 같은 조회를 처리하는 중복 인덱스도 점검한다.
+"""
+import uuid
+from datetime import datetime
+from typing import Dict, List, NamedTuple, Tuple
+
+from sqlalchemy import MetaData, PrimaryKeyConstraint, Table, UniqueConstraint, select
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.sql import Select
+
+from src.models import Analysis, Idea, Report, User
+
+_SAMPLE_ID = uuid.UUID("00000000-0000-0000-0000-000000000001")
+
+
+def hot_queries() -> Dict[str, Select]:
+    """점검 대상 쿼리 (서비스 계층의 실제 조회 형태)"""
+    return {
+        "ideas_by_user": (
+            select(Idea)
+            .where(Idea.user_id == _SAMPLE_ID, Idea.deleted_at.is_(None))
+            .order_by(Idea.created_at.desc(), Idea.id.desc())
+            .limit(20)
+        ),
+        "idea_by_id": select(Idea).where(Idea.id == _SAMPLE_ID, Idea.deleted_at.is_(None)),
+        "analysis_by_idea": select(Analysis).where(Analysis.idea_id == _SAMPLE_ID),
+        "owned_idea_with_analysis": (
+            select(Idea, Analysis)
+            .outerjoin(Analysis, Analysis.idea_id == Idea.id)
+            .where(Idea.id == _SAMPLE_ID, Idea.user_id == _SAMPLE_ID, Idea.deleted_at.is_(None))
+        ),
+        "reports_by_idea": (
+            select(Report)
+            .where(Report.idea_id == _SAMPLE_ID)
+            .order_by(Report.created_at.desc())
+        ),
+        "owned_report_by_id": (
+            select(Report)
+            .join(Idea, Idea.id == Report.idea_id)
+            .where(Report.id == _SAMPLE_ID, Idea.user_id == _SAMPLE_ID, Idea.deleted_at.is_(None))
+        ),
+        "purgeable_ideas": (
+            select(Idea.id)
+            .where(Idea.deleted_at.is_not(None), Idea.deleted_at < datetime(2000, 1, 1))
+            .order_by(Idea.deleted_at, Idea.id)
+            .limit(100)
+        ),
+        "user_by_email": select(User).where(User.email == "user@example.com", User.deleted_at.is_(None)),
+    }
+
+
+def explain(conn: Connection, statement: Select) -> List[str]:
+    """쿼리 플랜 라인 (PostgreSQL: EXPLAIN, SQLite: EXPLAIN QUERY PLAN의 detail)"""
+    sql = str(statement.compile(dialect=conn.dialect, compile_kwargs={"literal_binds": True}))
+
+    if conn.dialect.name == "postgresql":
+        return conn.exec_driver_sql(f"EXPLAIN {sql}").scalars().all()
+
+    if conn.dialect.name == "sqlite":
+        return [row[-1] for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}").all()]
+
+    return []
+
+
+def _explain(conn: Connection, statement: Select) -> List[str]:
+    """순차 스캔 플랜 라인"""
+    if conn.dialect.name == "postgresql":
+        return [line for line in explain(conn, statement) if "Seq Scan" in line]
+    return [line for line in explain(conn, statement) if line.startswith("SCAN") and "INDEX" not in line]
+
+
+def check_query_plans(engine: Engine) -> Dict[str, List[str]]:
+    """순차 스캔으로 실행되는 쿼리와 해당 플랜 라인 반환 (빈 dict면 통과)"""
+    failures = {}
+
+    with engine.connect() as conn:
+        if conn.dialect.name == "postgresql":
+            conn.exec_driver_sql("SET enable_seqscan = off")
+
+        for name, statement in hot_queries().items():
+            seq_scans = _explain(conn, statement)
+            if seq_scans:
+                failures[name] = seq_scans
+
+        conn.rollback()
+
+    return failures
+
+
+class _IndexDef(NamedTuple):
+    name: str
+    columns: Tuple[str, ...]
+    unique: bool
+    partial: bool
+    declared: bool  # Index로 선언됨 (기본 키/유일 제약이 아님)
+
+
+def _index_defs(table: Table) -> List[_IndexDef]:
+    """테이블의 인덱스 (기본 키, 유일 제약이 만드는 인덱스 포함)"""
+    defs = []
+    for constraint in table.constraints:
+        if isinstance(constraint, (PrimaryKeyConstraint, UniqueConstraint)) and constraint.columns:
+            columns = tuple(column.name for column in constraint.columns)
+            name = constraint.name or f"{table.name}_{'_'.join(columns)}_key"
+            defs.append(_IndexDef(name, columns, True, False, False))
+
+    for index in table.indexes:
+        partial = any(options.get("where") is not None for options in index.dialect_options.values())
+        columns = tuple(column.name for column in index.columns)
+        defs.append(_IndexDef(index.name, columns, bool(index.unique), partial, True))
+    return defs
+
+
+def find_redundant_indexes(metadata: MetaData) -> Dict[str, str]:
+    """
+    다른 인덱스로 대체되는 인덱스 → 대체하는 인덱스 반환 (빈 dict면 통과)
+    부분 인덱스가 아닌 인덱스의 앞쪽 컬럼과 컬럼이 같은 인덱스는 같은 조회를 처리하므로 중복이다.
+    유일 인덱스는 컬럼이 같은 유일 인덱스로만 대체된다.
+    """
+    redundant = {}
+    for table in metadata.sorted_tables:
+        defs = _index_defs(table)
+        for candidate in defs:
+            if not candidate.declared:
+                continue
+            for other in defs:
+                if other is candidate or other.partial:
+                    continue
+                if other.columns[:len(candidate.columns)] != candidate.columns:
+                    continue
+                if candidate.unique and not (other.unique and other.columns == candidate.columns):
+                    continue
+                redundant[f"{table.name}.{candidate.name}"] = other.name
+                break
+    return redundant
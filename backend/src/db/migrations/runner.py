@@ -0,0 +1,118 @@
+"""
+Migration Runner
+버전 관리되는 스키마 마이그레이션 실행기
+
+마이그레이션은 versions/ 아래의 vNNNN_*.py 모듈로 정의한다.
+    VERSION: int            - 버전 번호 (오름차순 적용)
+    DESCRIPTION: str        - 설명
+    TRANSACTIONAL: bool     - False면 AUTOCOMMIT 연결에서 실행 (CREATE INDEX CONCURRENTLY 등)
+    upgrade(conn)           - 적용 함수
+"""
+import importlib
+import pkgutil
+from datetime import datetime
+from types import ModuleType
+from typing import List, Set
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, inspect, select, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.schema import CreateIndex
+
+from . import versions
+
+# Postgres 여러 워커가 동시에 기동될 때 마이그레이션 중복 실행 방지용 advisory lock 키
+MIGRATION_LOCK_ID = 7_204_311
+
+migration_metadata = MetaData()
+
+schema_migrations = Table(
+    "schema_migrations",
+    migration_metadata,
+    Column("version", Integer, primary_key=True),
+    Column("description", String(255), nullable=False),
+    Column("applied_at", DateTime, nullable=False, default=datetime.utcnow),
+)
+
+
+def load_migrations() -> List[ModuleType]:
+    """versions 패키지의 마이그레이션 모듈을 버전 순으로 로드"""
+    modules = [
+        importlib.import_module(f"{versions.__name__}.{info.name}")
+        for info in pkgutil.iter_modules(versions.__path__)
+        if info.name.startswith("v")
+    ]
+    modules.sort(key=lambda module: module.VERSION)
+
+    seen = set()
+    for module in modules:
+        if module.VERSION in seen:
+            raise RuntimeError(f"중복된 마이그레이션 버전: {module.VERSION}")
+        seen.add(module.VERSION)
+
+    return modules
+
+
+def get_applied_versions(conn: Connection) -> Set[int]:
+    """적용된 마이그레이션 버전 목록"""
+    return set(conn.execute(select(schema_migrations.c.version)).scalars())
+
+
+def run_migrations(engine: Engine) -> List[int]:
+    """미적용 마이그레이션을 순서대로 적용하고 적용된 버전 목록 반환"""
+    migration_metadata.create_all(bind=engine)
+    is_postgres = engine.dialect.name == "postgresql"
+    applied_now = []
+
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as lock_conn:
+        if is_postgres:
+            lock_conn.execute(text("SELECT pg_advisory_lock(:id)"), {"id": MIGRATION_LOCK_ID})
+        try:
+            applied = get_applied_versions(lock_conn)
+
+            for module in load_migrations():
+                if module.VERSION in applied:
+                    continue
+
+                if getattr(module, "TRANSACTIONAL", True):
+                    with engine.begin() as conn:
+                        module.upgrade(conn)
+                        _record(conn, module)
+                else:
+                    module.upgrade(lock_conn)
+                    _record(lock_conn, module)
+
+                applied_now.append(module.VERSION)
+                print(f"✅ Migration {module.VERSION:04d} applied: {module.DESCRIPTION}")
+        finally:
+            if is_postgres:
+                lock_conn.execute(text("SELECT pg_advisory_unlock(:id)"), {"id": MIGRATION_LOCK_ID})
+
+    return applied_now
+
+
+def _record(conn: Connection, module: ModuleType) -> None:
+    conn.execute(schema_migrations.insert().values(
+        version=module.VERSION,
+        description=module.DESCRIPTION,
+        applied_at=datetime.utcnow()
+    ))
+
+
+def add_column_if_missing(conn: Connection, table: Table, column_name: str) -> None:
+    """
+    모델에 선언된 컬럼을 기존 테이블에 추가
+    (신규 DB는 create_all로 이미 생성되어 있으므로 건너뜀)
+    """
+    existing = {column["name"] for column in inspect(conn).get_columns(table.name)}
+    if column_name in existing:
+        return
+
+    column = table.c[column_name]
+    column_type = column.type.compile(dialect=conn.dialect)
+    conn.exec_driver_sql(f"ALTER TABLE {table.name} ADD COLUMN {column_name} {column_type}")
+
+
+def create_index_if_missing(conn: Connection, table: Table, index_name: str) -> None:
+    """모델에 선언된 인덱스를 기존 테이블에 생성"""
+    index = next(index for index in table.indexes if index.name == index_name)
+    conn.execute(CreateIndex(index, if_not_exists=True))
@@ -0,0 +1,37 @@
+"""
+0001 - 자주 사용되는 조회 패턴용 인덱스
+- ideas: user_id + created_at + id (deleted_at IS NULL 부분 인덱스)
+- reports: idea_id + created_at
+- users: email (deleted_at IS NULL 부분 인덱스, 0006에서 삭제)
+"""
+from sqlalchemy.engine import Connection
+from sqlalchemy.schema import CreateIndex
+
+from src.models import Idea, Report, User
+
+VERSION = 1
+DESCRIPTION = "hot query indexes for ideas, reports and users"
+
+# 운영 중 쓰기 잠금을 피하기 위해 Postgres에서는 CONCURRENTLY로 생성 (트랜잭션 밖에서 실행)
+TRANSACTIONAL = False
+
+INDEXES = [
+    (Idea.__table__, "ix_ideas_user_id_created_at_active"),
+    (Report.__table__, "ix_reports_idea_id_created_at"),
+    (User.__table__, "ix_users_email_active"),
+]
+
+
+def upgrade(conn: Connection) -> None:
+    for table, name in INDEXES:
+        index = next((index for index in table.indexes if index.name == name), None)
+        if index is None:
+            # 이후 버전에서 삭제되어 모델에 없는 인덱스
+            continue
+        ddl = CreateIndex(index, if_not_exists=True)
+
+        if conn.dialect.name == "postgresql":
+            sql = str(ddl.compile(dialect=conn.dialect))
+            conn.exec_driver_sql(sql.replace("CREATE INDEX", "CREATE INDEX CONCURRENTLY", 1))
+        else:
+            conn.execute(ddl)
@@ -0,0 +1,14 @@
+"""
+0002 - 분석 입력 지문(input_hash) 컬럼
+"""
+from sqlalchemy.engine import Connection
+
+from src.db.migrations.runner import add_column_if_missing
+from src.models import Analysis
+
+VERSION = 2
+DESCRIPTION = "analyses.input_hash for analysis memoization"
+
+
+def upgrade(conn: Connection) -> None:
+    add_column_if_missing(conn, Analysis.__table__, "input_hash")
@@ -0,0 +1,15 @@
+"""
+0003 - 삭제된 아이디어 보관/영구 삭제 대상 조회 인덱스
+- ideas: deleted_at + id (deleted_at IS NOT NULL 부분 인덱스)
+"""
+from sqlalchemy.engine import Connection
+
+from src.db.migrations.runner import create_index_if_missing
+from src.models import Idea
+
+VERSION = 3
+DESCRIPTION = "partial index on ideas.deleted_at for the retention job"
+
+
+def upgrade(conn: Connection) -> None:
+    create_index_if_missing(conn, Idea.__table__, "ix_ideas_deleted_at_purge")
@@ -0,0 +1,15 @@
+"""
+0004 - 보고서 입력 지문 컬럼 (입력이 같은 보고서 재사용, 섹션 단위 재생성)
+"""
+from sqlalchemy.engine import Connection
+
+from src.db.migrations.runner import add_column_if_missing
+from src.models import Report
+
+VERSION = 4
+DESCRIPTION = "reports.input_key and reports.section_hashes for report reuse"
+
+
+def upgrade(conn: Connection) -> None:
+    add_column_if_missing(conn, Report.__table__, "input_key")
+    add_column_if_missing(conn, Report.__table__, "section_hashes")
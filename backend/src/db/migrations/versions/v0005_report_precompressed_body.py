@@ -0,0 +1,15 @@
+"""
+0005 - 완료된 보고서의 압축 응답 본문 컬럼
+"""
+from sqlalchemy.engine import Connection
+
+from src.db.migrations.runner import add_column_if_missing
+from src.models import Report
+
+VERSION = 5
+DESCRIPTION = "reports.body_gzip and reports.body_version for precompressed report responses"
+
+
+def upgrade(conn: Connection) -> None:
+    add_column_if_missing(conn, Report.__table__, "body_gzip")
+    add_column_if_missing(conn, Report.__table__, "body_version")
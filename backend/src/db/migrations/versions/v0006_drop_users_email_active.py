@@ -0,0 +1,21 @@
+"""
+0006 - 중복 인덱스 삭제
+- users: ix_users_email_active (email 유일 인덱스 ix_users_email과 같은 조회를 처리하므로
+  쓰기 비용과 저장 공간만 늘린다)
+"""
+from sqlalchemy.engine import Connection
+
+VERSION = 6
+DESCRIPTION = "drop redundant users email partial index"
+
+# 운영 중 쓰기 잠금을 피하기 위해 Postgres에서는 CONCURRENTLY로 삭제 (트랜잭션 밖에서 실행)
+TRANSACTIONAL = False
+
+INDEX_NAME = "ix_users_email_active"
+
+
+def upgrade(conn: Connection) -> None:
+    if conn.dialect.name == "postgresql":
+        conn.exec_driver_sql(f"DROP INDEX CONCURRENTLY IF EXISTS {INDEX_NAME}")
+    else:
+        conn.exec_driver_sql(f"DROP INDEX IF EXISTS {INDEX_NAME}")
@@ -0,0 +1,137 @@
+"""
+Pool Monitor
+커넥션 풀 지표 수집과 포화 판단
+
+엔진마다 풀 클래스를 감싸 커넥션 대기 시간(풀이 가득 찼을 때 기다린 시간)과
+라우트별 커넥션 점유 시간을 히스토그램으로 기록하고, 현재 사용/오버플로/대기 수를
+게이지로 노출한다. 입장 제어 미들웨어는 is_saturated()로 요청을 조기 거절한다.
+"""
+import threading
+import time
+from contextvars import ContextVar, Token
+from typing import Any, Dict, Optional, Type
+
+from sqlalchemy import event
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+from src.core.metrics import metrics
+
+# 대기 시간 히스토그램 구간 (초)
+WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0)
+
+# 현재 요청의 ASGI scope (라우트별 점유 시간 집계용)
+_request_scope: ContextVar[Optional[Dict[str, Any]]] = ContextVar("pool_request_scope", default=None)
+
+_monitors: Dict[str, "PoolMonitor"] = {}
+
+
+def bind_request_scope(scope: Dict[str, Any]) -> Token:
+    """요청 처리 중 체크아웃된 커넥션을 이 요청의 라우트로 집계"""
+    return _request_scope.set(scope)
+
+
+def reset_request_scope(token: Token) -> None:
+    _request_scope.reset(token)
+
+
+def current_route() -> str:
+    """라우트 템플릿 (예: "GET /api/v1/ideas/{idea_id}"), 요청 밖이면 background"""
+    scope = _request_scope.get()
+    if scope is None:
+        return "background"
+    path = getattr(scope.get("route"), "path", None)
+    return f"{scope.get('method')} {path}" if path else "unmatched"
+
+
+class PoolMonitor:
+    """엔진 하나의 풀 상태"""
+
+    def __init__(self, name: str, alpha: float = 0.2):
+        self.name = name
+        self.alpha = alpha
+        self.pool: Optional[Pool] = None
+        self._lock = threading.Lock()
+        self._waiters: Dict[int, float] = {}
+        self._seq = 0
+        self.wait_ewma = 0.0
+
+        prefix = f"db.pool.{name}"
+        metrics.register_gauge(f"{prefix}.size", lambda: self._pool_stat("size"))
+        metrics.register_gauge(f"{prefix}.checked_out", lambda: self._pool_stat("checkedout"))
+        metrics.register_gauge(f"{prefix}.overflow", lambda: max(0, self._pool_stat("overflow")))
+        metrics.register_gauge(f"{prefix}.waiting", lambda: len(self._waiters))
+        metrics.register_gauge(f"{prefix}.wait_ewma_seconds", lambda: round(self.wait_ewma, 6))
+
+    def _pool_stat(self, name: str) -> int:
+        method = getattr(self.pool, name, None)
+        return method() if callable(method) else 0
+
+    def begin_wait(self) -> int:
+        with self._lock:
+            self._seq += 1
+            self._waiters[self._seq] = time.perf_counter()
+            return self._seq
+
+    def end_wait(self, ticket: int) -> None:
+        with self._lock:
+            elapsed = time.perf_counter() - self._waiters.pop(ticket)
+            self.wait_ewma = self.alpha * elapsed + (1 - self.alpha) * self.wait_ewma
+        metrics.observe(f"db.pool.{self.name}.wait_seconds", elapsed, WAIT_BUCKETS)
+
+    def oldest_wait(self) -> float:
+        """가장 오래 기다리고 있는 요청의 대기 시간 (대기 없으면 0)"""
+        with self._lock:
+            if not self._waiters:
+                return 0.0
+            return time.perf_counter() - min(self._waiters.values())
+
+    def is_saturated(self, max_wait: float) -> bool:
+        """
+        대기열이 있고, 현재 대기 중인 요청이나 최근 평균 대기 시간이 max_wait 이상이면 포화
+        (대기열이 비면 최근 평균과 관계없이 바로 입장 허용)
+        """
+        return self.oldest_wait() >= max_wait or (bool(self._waiters) and self.wait_ewma >= max_wait)
+
+
+class _MonitoredPoolMixin:
+    """커넥션 획득(_do_get) 시간을 측정하는 풀"""
+
+    monitor: PoolMonitor
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        # dispose() 시 풀이 재생성되므로 최신 풀을 가리키도록 갱신
+        self.monitor.pool = self
+
+    def _do_get(self):
+        ticket = self.monitor.begin_wait()
+        try:
+            return super()._do_get()
+        finally:
+            self.monitor.end_wait(ticket)
+
+
+def _on_checkout(dbapi_connection: Any, connection_record: Any, connection_proxy: Any) -> None:
+    connection_record.info["pool_checkout"] = (time.perf_counter(), current_route())
+
+
+def _on_checkin(dbapi_connection: Any, connection_record: Any) -> None:
+    checkout = connection_record.info.pop("pool_checkout", None)
+    if checkout is not None:
+        started, route = checkout
+        metrics.observe(f"db.pool.checkout_seconds.{route}", time.perf_counter() - started)
+
+
+def monitored_pool_class(name: str, is_async: bool = False) -> Type[Pool]:
+    """name으로 지표를 기록하는 풀 클래스 (create_engine의 poolclass로 전달)"""
+    monitor = _monitors.get(name) or _monitors.setdefault(name, PoolMonitor(name))
+    base = AsyncAdaptedQueuePool if is_async else QueuePool
+    pool_class = type(f"Monitored{base.__name__}", (_MonitoredPoolMixin, base), {"monitor": monitor})
+    event.listen(pool_class, "checkout", _on_checkout)
+    event.listen(pool_class, "checkin", _on_checkin)
+    return pool_class
+
+
+def get_pool_monitor(name: str) -> Optional[PoolMonitor]:
+    """이름으로 풀 모니터 조회 (해당 엔진이 없거나 SQLite면 None)"""
+    return _monitors.get(name)
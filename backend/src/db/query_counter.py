@@ -0,0 +1,62 @@
+"""
+Query Counter
+요청/코드 블록 단위로 실행된 SQL 쿼리 수 집계
+
+엔진에 리스너를 한 번 등록해 두고, count_queries() 블록 안에서 실행된 쿼리만 센다.
+컨텍스트 변수를 사용하므로 동시 요청끼리 섞이지 않으며, 스레드 풀이나
+AsyncSession.run_sync 안에서 실행된 쿼리도 요청에 합산된다.
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+class QueryCounter:
+    """블록 안에서 실행된 쿼리 목록"""
+
+    def __init__(self):
+        self.statements: List[str] = []
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+
+_current: ContextVar[Optional[QueryCounter]] = ContextVar("query_counter", default=None)
+
+
+def _on_execute(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+    counter = _current.get()
+    if counter is not None:
+        counter.statements.append(statement)
+
+
+def install_query_counter(engine: Engine) -> None:
+    """엔진에 쿼리 집계 리스너 등록 (비동기 엔진은 sync_engine을 전달)"""
+    if not event.contains(engine, "before_cursor_execute", _on_execute):
+        event.listen(engine, "before_cursor_execute", _on_execute)
+
+
+@contextmanager
+def count_queries() -> Iterator[QueryCounter]:
+    """블록 안에서 실행된 쿼리 집계"""
+    counter = QueryCounter()
+    token = _current.set(counter)
+    try:
+        yield counter
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def assert_max_queries(limit: int) -> Iterator[QueryCounter]:
+    """블록 안의 쿼리 수가 limit를 넘으면 AssertionError"""
+    with count_queries() as counter:
+        yield counter
+
+    if counter.count > limit:
+        statements = "\n".join(f"  {i}. {sql}" for i, sql in enumerate(counter.statements, 1))
+        raise AssertionError(f"쿼리 {counter.count}개 실행 (허용 {limit}개):\n{statements}")
@@ -4,26 +4,100 @@ PostgreSQL 및 MongoDB 연결 관리
 """
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.orm import sessionmaker, Session
+from fastapi.concurrency import run_in_threadpool
 from motor.motor_asyncio import AsyncIOMotorClient
-from typing import Generator, Optional
+from typing import Any, AsyncGenerator, Callable, Generator, Optional, TypeVar, Union
 from contextlib import contextmanager
 
 from src.core.config import settings
+from src.db.query_counter import install_query_counter
+from src.db.pool_monitor import monitored_pool_class
+
+T = TypeVar("T")
+
+# 요청 핸들러에서 사용하는 세션 (DB_ASYNC_MODE에 따라 동기/비동기)
+DBSession = Union[Session, AsyncSession]
+
+
+def _engine_options(url: str, pool_name: str, is_async: bool = False) -> dict:
+    """드라이버별 엔진 옵션 (서버 DB는 풀 지표를 pool_name으로 기록)"""
+    if url.startswith("sqlite"):
+        return {"connect_args": {"check_same_thread": False}}
+    return {
+        "poolclass": monitored_pool_class(pool_name, is_async),
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT_SECONDS,
+        "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS
+    }
+
+
+def _to_async_url(url: str) -> str:
+    """동기 드라이버 URL을 비동기 드라이버 URL로 변환"""
+    for sync_prefix, async_prefix in (
+        ("postgresql+psycopg2://", "postgresql+asyncpg://"),
+        ("postgresql://", "postgresql+asyncpg://"),
+        ("sqlite:///", "sqlite+aiosqlite:///"),
+    ):
+        if url.startswith(sync_prefix):
+            return async_prefix + url[len(sync_prefix):]
+    return url
 
 
 # ============== PostgreSQL ==============
 engine = create_engine(
     settings.DATABASE_URL,
-    pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
-    echo=settings.DEBUG
+    echo=settings.DEBUG,
+    **_engine_options(settings.DATABASE_URL, "primary")
 )
 
+install_query_counter(engine)
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
+# 비동기 엔진 (DB_ASYNC_MODE=True 인 경우에만 생성)
+async_engine = None
+AsyncSessionLocal = None
+
+if settings.DB_ASYNC_MODE:
+    _async_url = settings.ASYNC_DATABASE_URL or _to_async_url(settings.DATABASE_URL)
+    async_engine = create_async_engine(
+        _async_url,
+        echo=settings.DEBUG,
+        **_engine_options(_async_url, "async_primary", is_async=True)
+    )
+    install_query_counter(async_engine.sync_engine)
+    AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False)
+
+# 읽기 전용 복제본 (REPLICA_DATABASE_URL 지정 시에만 생성)
+replica_engine = None
+ReplicaSessionLocal = None
+async_replica_engine = None
+AsyncReplicaSessionLocal = None
+
+if settings.REPLICA_DATABASE_URL:
+    if settings.DB_ASYNC_MODE:
+        _async_replica_url = settings.ASYNC_REPLICA_DATABASE_URL or _to_async_url(settings.REPLICA_DATABASE_URL)
+        async_replica_engine = create_async_engine(
+            _async_replica_url,
+            echo=settings.DEBUG,
+            **_engine_options(_async_replica_url, "async_replica", is_async=True)
+        )
+        install_query_counter(async_replica_engine.sync_engine)
+        AsyncReplicaSessionLocal = async_sessionmaker(async_replica_engine, autoflush=False)
+    else:
+        replica_engine = create_engine(
+            settings.REPLICA_DATABASE_URL,
+            echo=settings.DEBUG,
+            **_engine_options(settings.REPLICA_DATABASE_URL, "replica")
+        )
+        install_query_counter(replica_engine)
+        ReplicaSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=replica_engine)
+
 
 def get_db() -> Generator[Session, None, None]:
     """PostgreSQL 세션 의존성"""
@@ -34,6 +108,43 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """PostgreSQL 비동기 세션 의존성"""
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+# 라우터에서 사용하는 세션 의존성
+get_db_session = get_async_db if settings.DB_ASYNC_MODE else get_db
+
+# 요청 세션이 사용하는 커넥션 풀 이름 (입장 제어 기준, pool_monitor 참고)
+REQUEST_POOL = "async_primary" if settings.DB_ASYNC_MODE else "primary"
+
+
+def has_replica() -> bool:
+    """읽기 전용 복제본 설정 여부"""
+    return (AsyncReplicaSessionLocal if settings.DB_ASYNC_MODE else ReplicaSessionLocal) is not None
+
+
+def read_session_factory(use_replica: bool) -> Callable[[], DBSession]:
+    """조회용 세션 팩토리 (복제본이 없으면 primary)"""
+    if settings.DB_ASYNC_MODE:
+        return AsyncReplicaSessionLocal if use_replica and AsyncReplicaSessionLocal else AsyncSessionLocal
+    return ReplicaSessionLocal if use_replica and ReplicaSessionLocal else SessionLocal
+
+
+async def run_db(db: DBSession, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    동기 ORM 코드를 세션 종류에 맞게 실행 (어느 쪽이든 이벤트 루프를 막지 않는다)
+    - AsyncSession: run_sync로 실행 (비동기 드라이버)
+    - Session: FastAPI의 동기 의존성과 같은 스레드 풀에서 실행 (블로킹 드라이버)
+    한 요청의 세션은 await로 순서대로 사용되므로 스레드가 바뀌어도 동시에 접근하지 않는다.
+    """
+    if isinstance(db, AsyncSession):
+        return await db.run_sync(fn, *args, **kwargs)
+    return await run_in_threadpool(fn, db, *args, **kwargs)
+
+
 @contextmanager
 def get_db_context() -> Generator[Session, None, None]:
     """컨텍스트 매니저로 세션 사용"""
@@ -83,5 +194,18 @@ async def get_mongodb():
 
 # ============== 초기화 함수 ==============
 def init_db():
-    """데이터베이스 테이블 생성"""
+    """데이터베이스 테이블 생성 및 마이그레이션 적용"""
+    from src.db.migrations import run_migrations
+    
     Base.metadata.create_all(bind=engine)
+    run_migrations(engine)
+
+
+async def close_db():
+    """데이터베이스 연결 풀 정리"""
+    for pool in (async_engine, async_replica_engine):
+        if pool is not None:
+            await pool.dispose()
+    if replica_engine is not None:
+        replica_engine.dispose()
+    engine.dispose()
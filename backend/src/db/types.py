@@ -0,0 +1,12 @@
+"""
+Portable Column Types
+PostgreSQL 전용 타입을 다른 DB(SQLite 등)에서도 사용할 수 있도록 정의
+"""
+from sqlalchemy import JSON, Uuid
+from sqlalchemy.dialects.postgresql import JSONB as PG_JSONB
+
+# PostgreSQL에서는 JSONB, 그 외(SQLite 등)에서는 JSON
+JSONB = JSON().with_variant(PG_JSONB(), "postgresql")
+
+# PostgreSQL에서는 네이티브 UUID, 그 외(SQLite 등)에서는 CHAR(32) (사용법: UUID(as_uuid=True))
+UUID = Uuid
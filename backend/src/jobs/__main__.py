@@ -0,0 +1,21 @@
+"""
+Job Worker CLI
+
+사용법 (backend 디렉터리에서):
+    python -m src.jobs --processes 4
+"""
+import argparse
+
+from src.core.config import settings
+from .worker import run_pool
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="BizAnalyzer job workers")
+    parser.add_argument("--processes", type=int, default=settings.JOB_WORKER_PROCESSES)
+    args = parser.parse_args()
+    run_pool(args.processes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Job Handlers
+작업 종류별 실행/최종 실패 처리 함수
+
+서비스 모듈은 함수 안에서 가져온다. 이 모듈은 API 서버(src.main)와 워커 CLI가 앱보다 먼저
+import하므로, 모듈 수준에서 src.services를 가져오면 순환 import가 생긴다.
+"""
+from typing import Callable, Dict, NamedTuple
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from src.models.job_model import Job, JobKind
+from src.core.config import settings
+from .queue import JobQueue
+
+
+class JobHandler(NamedTuple):
+    run: Callable[[Session, Job, JobQueue], None]
+    on_failure: Callable[[Session, Job], None]
+
+
+def _collect_data(db: Session, job: Job, queue: JobQueue) -> None:
+    from src.services.idea_service import IdeaService
+    IdeaService(db).collect_data(
+        job.idea_id,
+        on_progress=lambda progress: queue.update_progress(job, progress)
+    )
+
+
+def _fail_collection(db: Session, job: Job) -> None:
+    from src.services.idea_service import IdeaService
+    IdeaService(db).fail_collection(job.idea_id)
+
+
+def _run_analysis(db: Session, job: Job, queue: JobQueue) -> None:
+    from src.services.analysis_service import AnalysisService
+    AnalysisService(db).run_analysis(job.idea_id)
+
+
+def _fail_analysis(db: Session, job: Job) -> None:
+    from src.services.analysis_service import AnalysisService
+    AnalysisService(db).fail_analysis(job.idea_id)
+
+
+def _generate_report(db: Session, job: Job, queue: JobQueue) -> None:
+    from src.services.report_service import ReportService
+    ReportService(db).run_report(UUID(job.payload["report_id"]))
+
+
+def _fail_report(db: Session, job: Job) -> None:
+    from src.services.report_service import ReportService
+    ReportService(db).fail_report(UUID(job.payload["report_id"]))
+
+
+def _run_batch_item(db: Session, job: Job, queue: JobQueue) -> None:
+    from src.services.batch_service import BatchService
+    BatchService(db).run_item(UUID(job.payload["batch_id"]), job.idea_id)
+
+
+def _fail_batch_item(db: Session, job: Job) -> None:
+    from src.services.batch_service import BatchService
+    BatchService(db).fail_item(UUID(job.payload["batch_id"]), job.idea_id)
+
+
+def _purge_deleted(db: Session, job: Job, queue: JobQueue) -> None:
+    from src.services.retention_service import RetentionService, schedule_retention
+    result = RetentionService(db).purge()
+    queue.update_progress(job, {"batches": result.batches, "archived": result.archived, "deleted": result.deleted})
+    # 대상이 남아 있으면 바로 이어서, 아니면 다음 주기에 실행
+    schedule_retention(db, 0 if not result.finished else settings.RETENTION_INTERVAL_SECONDS, current_job_id=job.id)
+
+
+def _reschedule_purge(db: Session, job: Job) -> None:
+    from src.services.retention_service import schedule_retention
+    schedule_retention(db, settings.RETENTION_INTERVAL_SECONDS, current_job_id=job.id)
+
+
+HANDLERS: Dict[str, JobHandler] = {
+    JobKind.COLLECT_DATA.value: JobHandler(run=_collect_data, on_failure=_fail_collection),
+    JobKind.RUN_ANALYSIS.value: JobHandler(run=_run_analysis, on_failure=_fail_analysis),
+    JobKind.GENERATE_REPORT.value: JobHandler(run=_generate_report, on_failure=_fail_report),
+    JobKind.BATCH_ITEM.value: JobHandler(run=_run_batch_item, on_failure=_fail_batch_item),
+    JobKind.PURGE_DELETED.value: JobHandler(run=_purge_deleted, on_failure=_reschedule_purge),
+}
@@ -0,0 +1,154 @@
+"""
+Job Queue
+DB 테이블 기반 작업 큐 (외부 브로커 불필요)
+
+- PostgreSQL: SELECT ... FOR UPDATE SKIP LOCKED 로 작업 선점
+- SQLite: FOR UPDATE 미지원 → 조건부 UPDATE(status=queued)로 선점
+"""
+from sqlalchemy import and_, insert, or_, update
+from sqlalchemy.orm import Session
+from typing import Any, Dict, Iterable, List, Optional
+from uuid import UUID
+from datetime import datetime, timedelta
+
+from src.core.config import settings
+from src.core.metrics import metrics
+from src.models.job_model import Job, JobStatus
+
+
+class JobQueue:
+    """작업 큐"""
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def enqueue(
+        self,
+        kind: str,
+        idea_id: Optional[UUID] = None,
+        payload: Optional[Dict[str, Any]] = None,
+        max_attempts: Optional[int] = None,
+        run_after: Optional[datetime] = None
+    ) -> Job:
+        """
+        작업 등록 (run_after 지정 시 그 시각 이후 실행)
+        커밋하지 않으므로 호출자의 상태 변경과 같은 트랜잭션으로 저장된다.
+        """
+        job = Job(
+            kind=kind,
+            idea_id=idea_id,
+            payload=payload or {},
+            status=JobStatus.QUEUED,
+            max_attempts=max_attempts or settings.JOB_MAX_ATTEMPTS,
+            run_after=run_after or datetime.utcnow()
+        )
+        self.db.add(job)
+        metrics.inc(f"jobs.{kind}.enqueued")
+        return job
+    
+    def enqueue_many(self, kind: str, idea_ids: List[UUID], payload: Optional[Dict[str, Any]] = None) -> None:
+        """
+        아이디어별 작업 일괄 등록 (단일 executemany INSERT)
+        enqueue와 마찬가지로 커밋하지 않는다.
+        """
+        if not idea_ids:
+            return
+        
+        now = datetime.utcnow()
+        self.db.execute(insert(Job), [
+            {
+                "kind": kind,
+                "idea_id": idea_id,
+                "payload": payload or {},
+                "status": JobStatus.QUEUED,
+                "max_attempts": settings.JOB_MAX_ATTEMPTS,
+                "run_after": now
+            }
+            for idea_id in idea_ids
+        ])
+        metrics.inc(f"jobs.{kind}.enqueued", len(idea_ids))
+    
+    def claim(self, worker_id: str, kinds: Optional[Iterable[str]] = None) -> Optional[Job]:
+        """실행 가능한 작업 하나를 선점 (없으면 None)"""
+        now = datetime.utcnow()
+        stale_before = now - timedelta(seconds=settings.JOB_LOCK_TIMEOUT_SECONDS)
+        
+        claimable = or_(
+            and_(Job.status == JobStatus.QUEUED, Job.run_after <= now),
+            # 워커 장애로 방치된 작업 재선점
+            and_(Job.status == JobStatus.RUNNING, Job.locked_at < stale_before)
+        )
+        
+        query = self.db.query(Job).filter(claimable)
+        if kinds:
+            query = query.filter(Job.kind.in_(list(kinds)))
+        
+        job = query.order_by(Job.run_after).limit(1).with_for_update(skip_locked=True).first()
+        if job is None:
+            self.db.rollback()
+            return None
+        
+        # 다른 워커가 먼저 선점했다면 0건 갱신
+        result = self.db.execute(
+            update(Job)
+            .where(Job.id == job.id, Job.status == job.status, claimable)
+            .values(
+                status=JobStatus.RUNNING,
+                locked_by=worker_id,
+                locked_at=now,
+                attempts=Job.attempts + 1,
+                updated_at=now
+            )
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount != 1:
+            self.db.rollback()
+            return None
+        
+        self.db.commit()
+        self.db.refresh(job)
+        metrics.inc(f"jobs.{job.kind}.claimed")
+        return job
+    
+    def update_progress(self, job: Job, progress: Dict[str, Any]) -> None:
+        """진행 상황 저장"""
+        job.progress = progress
+        job.locked_at = datetime.utcnow()  # 장시간 작업의 재선점 방지 (heartbeat)
+        self.db.commit()
+    
+    def complete(self, job: Job) -> None:
+        """작업 성공 처리"""
+        job.status = JobStatus.SUCCEEDED
+        job.finished_at = datetime.utcnow()
+        job.locked_by = None
+        self.db.commit()
+        metrics.inc(f"jobs.{job.kind}.succeeded")
+    
+    def fail(self, job: Job, error: str) -> bool:
+        """
+        작업 실패 처리
+        재시도 횟수가 남아 있으면 지수 백오프 후 재시도하도록 되돌리고 True 반환
+        """
+        job.last_error = error[:2000]
+        job.locked_by = None
+        
+        if job.attempts < job.max_attempts:
+            delay = settings.JOB_RETRY_BACKOFF_SECONDS * (2 ** (job.attempts - 1))
+            job.status = JobStatus.QUEUED
+            job.run_after = datetime.utcnow() + timedelta(seconds=delay)
+            self.db.commit()
+            metrics.inc(f"jobs.{job.kind}.retried")
+            return True
+        
+        job.status = JobStatus.FAILED
+        job.finished_at = datetime.utcnow()
+        self.db.commit()
+        metrics.inc(f"jobs.{job.kind}.failed")
+        return False
+    
+    def get_latest(self, idea_id: UUID, kind: str) -> Optional[Job]:
+        """아이디어의 가장 최근 작업 조회"""
+        return self.db.query(Job).filter(
+            Job.idea_id == idea_id,
+            Job.kind == kind
+        ).order_by(Job.created_at.desc()).first()
@@ -0,0 +1,34 @@
+"""
+Retention CLI
+삭제된 아이디어 보관/영구 삭제를 즉시 실행 (주기 실행은 RETENTION_ENABLED로 작업 큐에서 수행)
+
+사용법 (backend 디렉터리에서):
+    python -m src.jobs.retention
+    python -m src.jobs.retention --mode delete --max-batches 10
+"""
+import argparse
+
+from src.core.config import settings
+from src.db.session import SessionLocal
+from src.services.retention_service import RETENTION_MODES, RetentionService
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Archive and purge soft-deleted ideas")
+    parser.add_argument("--mode", choices=RETENTION_MODES, default=settings.RETENTION_MODE)
+    parser.add_argument("--archive-dir", default=settings.RETENTION_ARCHIVE_DIR)
+    parser.add_argument("--batch-size", type=int, default=settings.RETENTION_BATCH_SIZE)
+    parser.add_argument("--pause", type=float, default=settings.RETENTION_BATCH_PAUSE_SECONDS)
+    parser.add_argument("--max-batches", type=int, default=settings.RETENTION_MAX_BATCHES)
+    args = parser.parse_args()
+
+    with SessionLocal() as db:
+        service = RetentionService(db, args.mode, args.archive_dir, args.batch_size, args.pause)
+        result = service.purge(args.max_batches)
+
+    print(f"batches={result.batches} archived={result.archived} deleted={result.deleted} "
+          f"resumed={result.resumed} finished={result.finished}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Job Worker
+작업 큐를 폴링하며 작업을 실행하는 워커 (프로세스 풀 / 내장 스레드)
+"""
+import logging
+import multiprocessing
+import os
+import signal
+import socket
+import threading
+import traceback
+import uuid
+from typing import List, Optional
+
+from src.core.config import settings
+from src.core.events import get_event_bus
+from src.db.session import SessionLocal
+from .handlers import HANDLERS
+from .queue import JobQueue
+
+logger = logging.getLogger(__name__)
+
+
+class Worker:
+    """작업 워커"""
+    
+    def __init__(self, worker_id: Optional[str] = None, poll_interval: Optional[float] = None):
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.poll_interval = poll_interval or settings.JOB_POLL_INTERVAL_SECONDS
+    
+    def run_once(self) -> bool:
+        """작업 하나를 처리 (처리할 작업이 없으면 False)"""
+        with SessionLocal() as db:
+            queue = JobQueue(db)
+            job = queue.claim(self.worker_id, kinds=HANDLERS.keys())
+            if job is None:
+                return False
+            
+            handler = HANDLERS[job.kind]
+            try:
+                handler.run(db, job, queue)
+            except Exception as exc:
+                db.rollback()
+                logger.warning("작업 실패 %s (%s/%s): %s", job.id, job.attempts, job.max_attempts, exc)
+                error = "".join(traceback.format_exception_only(type(exc), exc)).strip()
+                if not queue.fail(job, error):
+                    handler.on_failure(db, job)
+            else:
+                queue.complete(job)
+        
+        return True
+    
+    def run_forever(self, stop_event: threading.Event) -> None:
+        """중지 신호가 올 때까지 작업 처리"""
+        while not stop_event.is_set():
+            try:
+                processed = self.run_once()
+            except Exception as exc:
+                logger.exception("워커 오류: %s", exc)
+                processed = False
+            
+            if not processed:
+                stop_event.wait(self.poll_interval)
+
+
+def _process_main() -> None:
+    """워커 프로세스 진입점"""
+    stop_event = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop_event.set())
+    signal.signal(signal.SIGINT, lambda *_: stop_event.set())
+    Worker().run_forever(stop_event)
+    # 발행 대기 중인 상태 이벤트 전송
+    get_event_bus().close()
+
+
+def run_pool(processes: int) -> None:
+    """워커 프로세스 풀 실행 (SIGTERM/SIGINT 시 종료)"""
+    workers: List[multiprocessing.Process] = []
+    for index in range(processes):
+        process = multiprocessing.Process(target=_process_main, name=f"job-worker-{index}")
+        process.start()
+        workers.append(process)
+    
+    print(f"🛠  {processes} job worker(s) started")
+    
+    def shutdown(*_):
+        for process in workers:
+            process.terminate()
+    
+    signal.signal(signal.SIGTERM, shutdown)
+    signal.signal(signal.SIGINT, shutdown)
+    
+    for process in workers:
+        process.join()
+
+
+class EmbeddedWorkers:
+    """API 프로세스 내에서 실행되는 워커 스레드 (개발용)"""
+    
+    def __init__(self, count: int):
+        self.count = count
+        self._stop_event = threading.Event()
+        self._threads: List[threading.Thread] = []
+    
+    def start(self) -> None:
+        for index in range(self.count):
+            thread = threading.Thread(
+                target=Worker().run_forever,
+                args=(self._stop_event,),
+                name=f"embedded-job-worker-{index}",
+                daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+    
+    def stop(self) -> None:
+        self._stop_event.set()
+        for thread in self._threads:
+            thread.join(timeout=5)
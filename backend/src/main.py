@@ -4,14 +4,28 @@ AI 기반 사업 아이디어 타당성 분석 서비스 백엔드
 """
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from contextlib import asynccontextmanager
+import asyncio
 from datetime import datetime
 
 from src.core.config import settings
-from src.core.exceptions import BaseAPIException
-from src.db.session import init_db, MongoDB
-from src.api.v1.routers import auth_router, ideas_router, reports_router, search_router
+from src.core.compression import add_vary, compress_async, is_compressible, level_for, negotiate, record, set_encoded_etag
+from src.core.exceptions import BaseAPIException, ConflictException, ServiceUnavailableException, ValidationException
+from src.core.idempotency import idempotency_store
+from src.core.events import get_event_bus
+from src.core.metrics import metrics
+from src.core.principal_cache import principal_cache
+from src.core.responses import default_response_class
+from src.core.sticky_primary import sticky_primary
+from src.db.session import init_db, close_db, has_replica, REQUEST_POOL, SessionLocal, MongoDB
+from src.db.query_counter import count_queries
+from src.db.pool_monitor import bind_request_scope, get_pool_monitor, reset_request_scope
+from src.jobs.worker import EmbeddedWorkers
+from src.services.retention_service import schedule_retention
+from src.api.v1.dependencies import user_id_from_token
+from src.api.v1.routers import auth_router, ideas_router, reports_router, search_router, batches_router, exports_router
 
 
 @asynccontextmanager
@@ -28,10 +42,26 @@ async def lifespan(app: FastAPI):
     await MongoDB.connect()
     print("✅ MongoDB connected")
     
+    # 내장 작업 워커 (JOBS_EMBEDDED_WORKERS > 0 인 개발 환경에서만, 운영은 python -m src.jobs 로 별도 실행)
+    embedded_workers = EmbeddedWorkers(settings.JOBS_EMBEDDED_WORKERS)
+    embedded_workers.start()
+    
+    # 이벤트 버스를 미리 만들어 설정 경고(memory + 내장 워커 없음)를 시작 시점에 출력
+    get_event_bus()
+    
+    # 삭제된 아이디어 보관/영구 삭제 주기 작업
+    if settings.RETENTION_ENABLED:
+        with SessionLocal() as db:
+            schedule_retention(db)
+    
     yield
     
     # Shutdown
+    embedded_workers.stop()
+    get_event_bus().close()
+    principal_cache.close()
     await MongoDB.disconnect()
+    await close_db()
     print("👋 Application shutdown complete")
 
 
@@ -52,6 +82,7 @@ app = FastAPI(
     version=settings.APP_VERSION,
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=default_response_class(),
     lifespan=lifespan
 )
 
@@ -62,13 +93,12 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "Last-Modified"],
 )
 
 
-# 전역 예외 핸들러
-@app.exception_handler(BaseAPIException)
-async def api_exception_handler(request: Request, exc: BaseAPIException):
-    """API 예외 핸들러"""
+def _error_response(exc: BaseAPIException) -> JSONResponse:
+    """API 예외 응답 본문"""
     return JSONResponse(
         status_code=exc.status_code,
         content={
@@ -76,10 +106,178 @@ async def api_exception_handler(request: Request, exc: BaseAPIException):
             "error_code": exc.error_code,
             "message": exc.message,
             "details": exc.details
-        }
+        },
+        headers=exc.headers
     )
 
 
+# 입장 제어에서 제외하는 경로 (DB를 사용하지 않음)
+ADMISSION_EXEMPT_PATHS = {"/health", "/metrics"}
+
+
+@app.middleware("http")
+async def db_pool_admission(request: Request, call_next):
+    """
+    요청별 커넥션 점유 시간 집계 및 입장 제어
+    커넥션 대기가 DB_ADMISSION_MAX_WAIT_SECONDS를 넘으면 새 요청은 풀에서 기다리지 않고 바로 503
+    """
+    max_wait = settings.DB_ADMISSION_MAX_WAIT_SECONDS
+    monitor = get_pool_monitor(REQUEST_POOL)
+    if max_wait > 0 and monitor is not None and request.url.path not in ADMISSION_EXEMPT_PATHS:
+        if monitor.is_saturated(max_wait):
+            metrics.inc("db.admission.rejected")
+            return _error_response(ServiceUnavailableException(
+                "요청이 많아 잠시 후 다시 시도해주세요.",
+                retry_after=settings.DB_ADMISSION_RETRY_AFTER_SECONDS
+            ))
+
+    token = bind_request_scope(request.scope)
+    try:
+        return await call_next(request)
+    finally:
+        reset_request_scope(token)
+
+
+if settings.IDEMPOTENCY_ENABLED:
+    @app.middleware("http")
+    async def idempotency_keys(request: Request, call_next):
+        """
+        Idempotency-Key 헤더가 있는 인증된 POST 요청은 응답(5xx 제외)을 저장해 두고,
+        같은 키로 다시 요청하면 실행하지 않고 저장된 응답을 그대로 돌려준다.
+        """
+        key = request.headers.get("idempotency-key")
+        if request.method != "POST" or not key:
+            return await call_next(request)
+        if len(key) > 255:
+            return _error_response(ValidationException("Idempotency-Key는 255자 이하여야 합니다."))
+
+        scheme, _, token = request.headers.get("authorization", "").partition(" ")
+        user_id = user_id_from_token(token) if scheme.lower() == "bearer" else None
+        if user_id is None:
+            return await call_next(request)
+
+        store_key = idempotency_store.make_key(user_id, request.url.path, key)
+        entry = await asyncio.to_thread(idempotency_store.reserve, store_key)
+        if entry is not None:
+            if entry.get("status") is None:
+                metrics.inc("idempotency.conflicts")
+                return _error_response(ConflictException("같은 Idempotency-Key로 처리 중인 요청이 있습니다."))
+            metrics.inc("idempotency.replayed")
+            return Response(
+                content=entry["body"],
+                status_code=entry["status"],
+                media_type=entry["media_type"],
+                headers={"Idempotent-Replayed": "true"}
+            )
+
+        try:
+            response = await call_next(request)
+        except BaseException:
+            await asyncio.to_thread(idempotency_store.release, store_key)
+            raise
+
+        if response.status_code >= 500:
+            await asyncio.to_thread(idempotency_store.release, store_key)
+            return response
+
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        await asyncio.to_thread(
+            idempotency_store.complete, store_key, response.status_code, body, response.headers.get("content-type")
+        )
+        return Response(
+            content=body,
+            status_code=response.status_code,
+            headers=dict(response.headers),
+            background=response.background
+        )
+
+
+if settings.QUERY_COUNT_HEADER:
+    @app.middleware("http")
+    async def query_count_header(request: Request, call_next):
+        """요청 처리 중 실행된 SQL 쿼리 수를 응답 헤더로 전달"""
+        with count_queries() as counter:
+            response = await call_next(request)
+        response.headers["X-Query-Count"] = str(counter.count)
+        return response
+
+
+if has_replica():
+    @app.middleware("http")
+    async def sticky_primary_after_write(request: Request, call_next):
+        """쓰기 요청을 보낸 사용자는 REPLICA_STICKY_SECONDS 동안 primary에서 조회"""
+        response = await call_next(request)
+        if request.method in ("POST", "PUT", "PATCH", "DELETE"):
+            authorization = request.headers.get("authorization", "")
+            scheme, _, token = authorization.partition(" ")
+            user_id = user_id_from_token(token) if scheme.lower() == "bearer" else None
+            if user_id is not None:
+                sticky_primary.mark(user_id)
+        return response
+
+
+if settings.COMPRESSION_ENABLED:
+    @app.middleware("http")
+    async def compress_responses(request: Request, call_next):
+        """
+        Accept-Encoding에 따라 응답 본문 압축 (가장 바깥 미들웨어)
+        길이를 아는 COMPRESSION_MIN_BYTES 이상의 JSON/텍스트 응답만 압축하며,
+        Idempotency-Key 저장 응답 등 안쪽 미들웨어는 압축 전 본문을 본다.
+        """
+        response = await call_next(request)
+
+        length = response.headers.get("content-length")
+        if (
+            length is None
+            or int(length) < settings.COMPRESSION_MIN_BYTES
+            or "content-encoding" in response.headers
+            or not is_compressible(response.headers.get("content-type"))
+        ):
+            return response
+
+        add_vary(response.headers)
+        encoding = negotiate(request.headers.get("accept-encoding"))
+        if encoding is None:
+            return response
+
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        compressed = await compress_async(body, encoding, level_for(request.url.path, encoding))
+        if len(compressed) >= len(body):
+            compressed, encoding = body, None
+        else:
+            record(encoding, len(body), len(compressed))
+
+        headers = dict(response.headers)
+        headers.pop("content-length", None)
+        result = Response(
+            content=compressed,
+            status_code=response.status_code,
+            headers=headers,
+            background=response.background
+        )
+        if encoding is not None:
+            result.headers["Content-Encoding"] = encoding
+            set_encoded_etag(result.headers, encoding)
+        return result
+
+
+# 전역 예외 핸들러
+@app.exception_handler(BaseAPIException)
+async def api_exception_handler(request: Request, exc: BaseAPIException):
+    """API 예외 핸들러"""
+    return _error_response(exc)
+
+
+@app.exception_handler(PoolTimeoutError)
+async def pool_timeout_handler(request: Request, exc: PoolTimeoutError):
+    """커넥션 풀 대기 시간 초과 (DB_POOL_TIMEOUT_SECONDS)"""
+    metrics.inc("db.pool.timeouts")
+    return _error_response(ServiceUnavailableException(
+        "요청이 많아 잠시 후 다시 시도해주세요.",
+        retry_after=settings.DB_ADMISSION_RETRY_AFTER_SECONDS
+    ))
+
+
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     """전역 예외 핸들러"""
@@ -113,12 +311,24 @@ app.include_router(
     tags=["보고서"]
 )
 
+app.include_router(
+    batches_router,
+    prefix="/api/v1/batches",
+    tags=["일괄 작업"]
+)
+
 app.include_router(
     search_router,
     prefix="/api/v1/search",
     tags=["검색"]
 )
 
+app.include_router(
+    exports_router,
+    prefix="/api/v1/exports",
+    tags=["내보내기"]
+)
+
 
 # 헬스체크 엔드포인트
 @app.get("/health", tags=["시스템"])
@@ -131,6 +341,12 @@ async def health_check():
     }
 
 
+@app.get("/metrics", tags=["시스템"])
+async def get_metrics():
+    """운영 지표 조회 (캐시 적중률 등)"""
+    return metrics.snapshot()
+
+
 @app.get("/", tags=["시스템"])
 async def root():
     """루트 엔드포인트"""
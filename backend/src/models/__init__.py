@@ -2,6 +2,9 @@ from .user_model import User
 from .idea_model import Idea, IdeaStatus, IndustryType, RevenueModel
 from .analysis_model import Analysis, AnalysisStatus
 from .report_model import Report, ReportStatus, ReportType
+from .job_model import Job, JobStatus, JobKind
+from .batch_model import Batch, BatchStatus, BatchOperation
+from . import status_events  # noqa: F401  (상태 변경 이벤트 리스너 등록)
 
 __all__ = [
     "User",
@@ -13,5 +16,11 @@ __all__ = [
     "AnalysisStatus",
     "Report",
     "ReportStatus",
-    "ReportType"
+    "ReportType",
+    "Job",
+    "JobStatus",
+    "JobKind",
+    "Batch",
+    "BatchStatus",
+    "BatchOperation"
 ]
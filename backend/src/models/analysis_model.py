@@ -4,12 +4,12 @@ Analysis Model
 """
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, DateTime, Integer, ForeignKey, Enum as SQLEnum
-from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, DateTime, Integer, String, ForeignKey, Enum as SQLEnum
+from sqlalchemy.orm import deferred, relationship
 import enum
 
 from src.db.session import Base
+from src.db.types import JSONB, UUID
 
 
 class AnalysisStatus(str, enum.Enum):
@@ -29,6 +29,9 @@ class Analysis(Base):
     # Status
     status = Column(SQLEnum(AnalysisStatus), default=AnalysisStatus.PENDING)
     
+    # 분석 입력(아이디어 내용 + 수집 데이터)의 지문 - 입력이 같으면 결과 재사용
+    input_hash = Column(String(64), nullable=True)
+    
     # Scores (0-100)
     market_score = Column(Integer, nullable=True)
     competition_score = Column(Integer, nullable=True)
@@ -38,13 +41,13 @@ class Analysis(Base):
     risk_score = Column(Integer, nullable=True)
     overall_score = Column(Integer, nullable=True)
     
-    # Detailed Analysis (stored as JSON)
-    market_analysis = Column(JSONB, nullable=True)
-    competition_analysis = Column(JSONB, nullable=True)
-    customer_analysis = Column(JSONB, nullable=True)
-    financial_analysis = Column(JSONB, nullable=True)
-    risk_analysis = Column(JSONB, nullable=True)
-    swot_analysis = Column(JSONB, nullable=True)
+    # Detailed Analysis (stored as JSON, 상세 조회에서만 undefer_group("details")로 로드)
+    market_analysis = deferred(Column(JSONB, nullable=True), group="details")
+    competition_analysis = deferred(Column(JSONB, nullable=True), group="details")
+    customer_analysis = deferred(Column(JSONB, nullable=True), group="details")
+    financial_analysis = deferred(Column(JSONB, nullable=True), group="details")
+    risk_analysis = deferred(Column(JSONB, nullable=True), group="details")
+    swot_analysis = deferred(Column(JSONB, nullable=True), group="details")
     
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -0,0 +1,58 @@
+"""
+Batch Model
+여러 아이디어에 대한 일괄 분석/보고서 작업 ORM 모델
+"""
+import uuid
+from datetime import datetime
+from sqlalchemy import Column, DateTime, Integer, ForeignKey, Index, Enum as SQLEnum
+import enum
+
+from src.db.session import Base
+from src.db.types import JSONB, UUID
+
+
+class BatchStatus(str, enum.Enum):
+    """일괄 작업 상태"""
+    RUNNING = "running"
+    COMPLETED = "completed"
+
+
+class BatchOperation(str, enum.Enum):
+    """아이디어별로 수행할 작업"""
+    ANALYZE = "analyze"
+    REPORT = "report"
+
+
+class Batch(Base):
+    __tablename__ = "batches"
+    __table_args__ = (
+        # 사용자별 일괄 작업 조회 (최신순)
+        Index("ix_batches_user_id_created_at", "user_id", "created_at"),
+    )
+    
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    
+    # Request
+    idea_ids = Column(JSONB, nullable=False)  # 처리 순서대로 나열한 아이디어 ID (문자열)
+    operations = Column(JSONB, nullable=False)  # BatchOperation 값 목록
+    options = Column(JSONB, nullable=True)  # force, report_type
+    max_parallel = Column(Integer, nullable=False)  # 동시에 실행되는 아이디어 수 상한
+    
+    # Progress (워커가 조건부/원자적 UPDATE로 갱신)
+    status = Column(SQLEnum(BatchStatus), default=BatchStatus.RUNNING, nullable=False)
+    next_index = Column(Integer, default=0, nullable=False)  # 다음에 작업을 등록할 idea_ids 위치
+    succeeded = Column(Integer, default=0, nullable=False)
+    failed = Column(Integer, default=0, nullable=False)
+    
+    # Timestamps
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    finished_at = Column(DateTime, nullable=True)
+    
+    @property
+    def total(self) -> int:
+        return len(self.idea_ids or [])
+    
+    def __repr__(self):
+        return f"<Batch {self.id} ({self.succeeded + self.failed}/{self.total})>"
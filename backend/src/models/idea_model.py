@@ -4,12 +4,12 @@ Idea Model
 """
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, DateTime, Text, ForeignKey, Enum as SQLEnum
-from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, DateTime, Text, ForeignKey, Index, Enum as SQLEnum, text
+from sqlalchemy.orm import deferred, relationship
 import enum
 
 from src.db.session import Base
+from src.db.types import JSONB, UUID
 
 
 class IdeaStatus(str, enum.Enum):
@@ -52,6 +52,22 @@ class RevenueModel(str, enum.Enum):
 
 class Idea(Base):
     __tablename__ = "ideas"
+    __table_args__ = (
+        # 사용자별 아이디어 목록 (삭제되지 않은 것만, 최신순 / 커서 페이지네이션)
+        Index(
+            "ix_ideas_user_id_created_at_active",
+            "user_id", "created_at", "id",
+            postgresql_where=text("deleted_at IS NULL"),
+            sqlite_where=text("deleted_at IS NULL")
+        ),
+        # 보관/영구 삭제 대상 조회 (삭제된 것만, 삭제 시각순)
+        Index(
+            "ix_ideas_deleted_at_purge",
+            "deleted_at", "id",
+            postgresql_where=text("deleted_at IS NOT NULL"),
+            sqlite_where=text("deleted_at IS NOT NULL")
+        ),
+    )
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
@@ -74,8 +90,8 @@ class Idea(Base):
     # Status
     status = Column(SQLEnum(IdeaStatus), default=IdeaStatus.CREATED)
     
-    # Collected Data (stored as JSON)
-    collected_data = Column(JSONB, nullable=True)
+    # Collected Data (stored as JSON, 필요한 조회에서만 undefer로 로드)
+    collected_data = deferred(Column(JSONB, nullable=True))
     
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow)
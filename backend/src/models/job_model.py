@@ -0,0 +1,79 @@
+"""
+Job Model
+백그라운드 작업 큐 ORM 모델
+"""
+import uuid
+from datetime import datetime
+from sqlalchemy import Column, String, DateTime, Text, Integer, ForeignKey, Index, Enum as SQLEnum
+import enum
+
+from src.db.session import Base
+from src.db.types import JSONB, UUID
+
+
+class JobStatus(str, enum.Enum):
+    """작업 상태"""
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class JobKind(str, enum.Enum):
+    """작업 종류"""
+    COLLECT_DATA = "collect_data"
+    RUN_ANALYSIS = "run_analysis"
+    BATCH_ITEM = "batch_item"  # 일괄 작업의 아이디어 1건 (분석 → 보고서)
+    PURGE_DELETED = "purge_deleted"  # 삭제된 아이디어 보관/영구 삭제 (주기 실행)
+    GENERATE_REPORT = "generate_report"  # 보고서 내용 생성 (payload: report_id)
+
+
+class Job(Base):
+    __tablename__ = "jobs"
+    __table_args__ = (
+        # 워커의 작업 선점 조회
+        Index("ix_jobs_status_run_after", "status", "run_after"),
+        # 아이디어별 최근 작업 조회
+        Index("ix_jobs_idea_id_kind_created_at", "idea_id", "kind", "created_at"),
+    )
+    
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    kind = Column(String(50), nullable=False)
+    idea_id = Column(UUID(as_uuid=True), ForeignKey("ideas.id", ondelete="CASCADE"), nullable=True)
+    payload = Column(JSONB, nullable=True)
+    
+    # Status
+    status = Column(SQLEnum(JobStatus), default=JobStatus.QUEUED, nullable=False)
+    attempts = Column(Integer, default=0, nullable=False)
+    max_attempts = Column(Integer, default=3, nullable=False)
+    run_after = Column(DateTime, default=datetime.utcnow, nullable=False)  # 재시도 대기 시각
+    
+    # Lock (처리 중인 워커)
+    locked_by = Column(String(100), nullable=True)
+    locked_at = Column(DateTime, nullable=True)
+    
+    # Progress & Result
+    progress = Column(JSONB, nullable=True)
+    last_error = Column(Text, nullable=True)
+    
+    # Timestamps
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    finished_at = Column(DateTime, nullable=True)
+    
+    def __repr__(self):
+        return f"<Job {self.kind} {self.id} ({self.status})>"
+    
+    def to_dict(self):
+        return {
+            "id": str(self.id),
+            "kind": self.kind,
+            "idea_id": str(self.idea_id) if self.idea_id else None,
+            "status": self.status.value,
+            "attempts": self.attempts,
+            "max_attempts": self.max_attempts,
+            "progress": self.progress,
+            "last_error": self.last_error,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None
+        }
@@ -4,12 +4,12 @@ Report Model
 """
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, DateTime, Text, ForeignKey, Enum as SQLEnum
-from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, DateTime, Text, ForeignKey, Index, LargeBinary, Enum as SQLEnum
+from sqlalchemy.orm import deferred, relationship
 import enum
 
 from src.db.session import Base
+from src.db.types import JSONB, UUID
 
 
 class ReportStatus(str, enum.Enum):
@@ -28,6 +28,10 @@ class ReportType(str, enum.Enum):
 
 class Report(Base):
     __tablename__ = "reports"
+    __table_args__ = (
+        # 아이디어별 보고서 목록 (최신순)
+        Index("ix_reports_idea_id_created_at", "idea_id", "created_at"),
+    )
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     idea_id = Column(UUID(as_uuid=True), ForeignKey("ideas.id", ondelete="CASCADE"), nullable=False)
@@ -40,14 +44,22 @@ class Report(Base):
     executive_summary = Column(Text, nullable=True)
     recommendation = Column(String(50), nullable=True)  # Go / No-Go / Conditional
     
-    # Detailed Sections (stored as JSON)
-    swot = Column(JSONB, nullable=True)
-    market_analysis = Column(JSONB, nullable=True)
-    competition_analysis = Column(JSONB, nullable=True)
-    financial_analysis = Column(JSONB, nullable=True)
-    risk_assessment = Column(JSONB, nullable=True)
-    action_items = Column(JSONB, nullable=True)
-    key_insights = Column(JSONB, nullable=True)
+    # Detailed Sections (stored as JSON, 상세 조회에서만 undefer_group("sections")로 로드)
+    swot = deferred(Column(JSONB, nullable=True), group="sections")
+    market_analysis = deferred(Column(JSONB, nullable=True), group="sections")
+    competition_analysis = deferred(Column(JSONB, nullable=True), group="sections")
+    financial_analysis = deferred(Column(JSONB, nullable=True), group="sections")
+    risk_assessment = deferred(Column(JSONB, nullable=True), group="sections")
+    action_items = deferred(Column(JSONB, nullable=True), group="sections")
+    key_insights = deferred(Column(JSONB, nullable=True), group="sections")
+    
+    # Input fingerprint (분석 버전 + 보고서 유형 + 템플릿 버전, 같으면 보고서 재사용)
+    input_key = Column(String(64), nullable=True)
+    section_hashes = deferred(Column(JSONB, nullable=True), group="sections")  # 섹션별 입력 지문
+    
+    # Precompressed response (완료된 보고서의 gzip 응답 본문, 응답 형식이 바뀌지 않은 APP_VERSION에서만 사용)
+    body_gzip = deferred(Column(LargeBinary, nullable=True), group="compressed")
+    body_version = Column(String(32), nullable=True)
     
     # File
     pdf_url = Column(String(500), nullable=True)
@@ -0,0 +1,99 @@
+"""
+Status Events
+아이디어·분석·보고서 상태 변경과 수집 진행 상황을 이벤트 버스로 발행
+
+flush 시점에 변경 사항을 모아 두었다가 커밋이 끝난 뒤에만 발행하므로
+롤백된 변경은 전달되지 않는다. API 프로세스와 작업 워커 모두에서 동작한다.
+"""
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from src.core.events import get_event_bus
+from .idea_model import Idea
+from .analysis_model import Analysis
+from .report_model import Report
+from .job_model import Job, JobKind
+
+PENDING_KEY = "status_events"
+
+
+def idea_channel(idea_id: Any) -> str:
+    """아이디어별 이벤트 채널 이름"""
+    return f"idea:{idea_id}"
+
+
+def status_event(event_type: str, idea_id: Any, target_id: Any, status: Any, **extra: Any) -> Dict[str, Any]:
+    """상태 이벤트 페이로드"""
+    return {
+        "type": event_type,
+        "idea_id": str(idea_id),
+        "id": str(target_id),
+        "status": getattr(status, "value", status),
+        "timestamp": datetime.utcnow().isoformat(),
+        **extra
+    }
+
+
+def _changed(obj: Any, attr: str, is_new: bool) -> bool:
+    if is_new:
+        return getattr(obj, attr) is not None
+    return inspect(obj).attrs[attr].history.has_changes()
+
+
+def _to_event(obj: Any, is_new: bool) -> Optional[Dict[str, Any]]:
+    if isinstance(obj, Idea) and _changed(obj, "status", is_new):
+        return status_event("idea.status", obj.id, obj.id, obj.status)
+    if isinstance(obj, Analysis) and _changed(obj, "status", is_new):
+        return status_event("analysis.status", obj.idea_id, obj.id, obj.status)
+    if isinstance(obj, Report) and _changed(obj, "status", is_new):
+        return status_event(
+            "report.status", obj.idea_id, obj.id, obj.status,
+            report_type=getattr(obj.report_type, "value", obj.report_type)
+        )
+    if (
+        isinstance(obj, Job)
+        and obj.kind == JobKind.COLLECT_DATA.value
+        and obj.idea_id is not None
+        and _changed(obj, "progress", is_new)
+    ):
+        progress = obj.progress or {}
+        return status_event(
+            "collection.progress", obj.idea_id, obj.id, obj.status,
+            completed_tasks=progress.get("completed_tasks", []),
+            failed_tasks=progress.get("failed_tasks", [])
+        )
+    return None
+
+
+@event.listens_for(Session, "after_flush")
+def collect_status_events(session: Session, flush_context) -> None:
+    """flush된 상태 변경을 세션에 보관"""
+    pending: List[Dict[str, Any]] = session.info.setdefault(PENDING_KEY, [])
+    for obj in session.new:
+        status_change = _to_event(obj, is_new=True)
+        if status_change:
+            pending.append(status_change)
+    for obj in session.dirty:
+        status_change = _to_event(obj, is_new=False)
+        if status_change:
+            pending.append(status_change)
+
+
+@event.listens_for(Session, "after_commit")
+def publish_status_events(session: Session) -> None:
+    """커밋된 상태 변경 발행"""
+    pending = session.info.pop(PENDING_KEY, None)
+    if not pending:
+        return
+    bus = get_event_bus()
+    for status_change in pending:
+        bus.publish(idea_channel(status_change["idea_id"]), status_change)
+
+
+@event.listens_for(Session, "after_rollback")
+def discard_status_events(session: Session) -> None:
+    """롤백된 상태 변경 폐기"""
+    session.info.pop(PENDING_KEY, None)
@@ -4,17 +4,19 @@ User Model
 """
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, DateTime, Boolean, Text
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, DateTime, Boolean, Text, event
+from sqlalchemy.orm import object_session, relationship
 
 from src.db.session import Base
+from src.db.types import UUID
+from src.core.principal_cache import principal_cache
 
 
 class User(Base):
     __tablename__ = "users"
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    # 유일 인덱스(ix_users_email)가 로그인/가입 시 이메일 조회도 처리한다
     email = Column(String(255), unique=True, nullable=False, index=True)
     password = Column(Text, nullable=False)
     name = Column(String(100), nullable=True)
@@ -43,3 +45,15 @@ class User(Base):
             "is_verified": self.is_verified,
             "created_at": self.created_at.isoformat() if self.created_at else None
         }
+
+
+@event.listens_for(User, "after_update")
+def _invalidate_principal_cache(mapper, connection, target):
+    """사용자 정보 변경(비활성화, 탈퇴 등) 시 인증 캐시 무효화"""
+    user_id = target.id
+    principal_cache.invalidate_user(user_id)
+
+    # 커밋 전에 다른 요청이 이전 상태를 다시 캐시할 수 있으므로 커밋 후 한 번 더 무효화
+    session = object_session(target)
+    if session is not None:
+        event.listen(session, "after_commit", lambda _: principal_cache.invalidate_user(user_id), once=True)
@@ -0,0 +1,3 @@
+from .idea_repository import IdeaRepository
+
+__all__ = ["IdeaRepository"]
@@ -0,0 +1,341 @@
+"""
+Idea Repository
+아이디어 단위 조회 (소유권 필터 + 연관 분석/보고서를 한 번의 쿼리로)
+
+모든 조회는 SQL에서 user_id로 필터링하므로 다른 사용자의 아이디어는
+존재하지 않는 것과 같이 404로 처리된다. 대용량 JSONB 컬럼은 모델에서 지연 로드로
+선언되어 있으며, 필요한 조회에서만 같은 쿼리로 함께 로드(undefer)한다.
+
+get_*_version은 조건부 조회(ETag)용으로 버전 컬럼만 읽는 좁은 쿼리다.
+
+claim_status는 동시에 들어온 분석/보고서 시작 요청 중 하나만 진행하도록 하는
+조건부 상태 전환이다.
+"""
+from typing import Iterable, List, Optional, Sequence, Set, Tuple
+from uuid import UUID
+
+from sqlalchemy import and_, select, update
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Load, Query, Session, load_only, undefer, undefer_group
+from sqlalchemy.orm.attributes import InstrumentedAttribute
+
+from src.models.idea_model import Idea, IdeaStatus
+from src.models.analysis_model import Analysis, AnalysisStatus
+from src.models.report_model import Report
+from src.core.exceptions import NotFoundException
+
+# 분석 결과 응답에 사용하는 섹션
+ANALYSIS_RESPONSE_SECTIONS = (Analysis.swot_analysis, Analysis.market_analysis, Analysis.risk_analysis)
+
+# 보고서 목록(요약)에 필요한 컬럼
+REPORT_SUMMARY_COLUMNS = (
+    Report.id,
+    Report.idea_id,
+    Report.status,
+    Report.report_type,
+    Report.recommendation,
+    Report.created_at,
+    Report.completed_at
+)
+
+
+class IdeaRepository:
+    """소유권이 확인된 아이디어와 연관 데이터 조회"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_idea(
+        self,
+        idea_id: UUID,
+        user_id: UUID,
+        with_collected_data: bool = False,
+        columns: Optional[Sequence[InstrumentedAttribute]] = None
+    ) -> Idea:
+        """사용자의 아이디어 조회 또는 404 (columns 지정 시 해당 컬럼만 로드)"""
+        query = self._owned(self.db.query(Idea), idea_id, user_id, with_collected_data)
+        if columns:
+            query = query.options(load_only(*columns))
+        idea = query.first()
+
+        if not idea:
+            raise _idea_not_found()
+
+        return idea
+
+    def get_owned_idea_ids(self, idea_ids: Iterable[UUID], user_id: UUID) -> Set[UUID]:
+        """주어진 ID 중 사용자가 소유한(삭제되지 않은) 아이디어 ID"""
+        rows = self.db.query(Idea.id).filter(
+            Idea.id.in_(list(idea_ids)),
+            Idea.user_id == user_id,
+            Idea.deleted_at.is_(None)
+        ).all()
+        return {row[0] for row in rows}
+
+    def get_ideas_by_ids(self, idea_ids: Sequence[UUID], user_id: UUID) -> List[Idea]:
+        """주어진 ID 중 사용자가 소유한(삭제되지 않은) 아이디어 (IN 쿼리 한 번)"""
+        return self.db.query(Idea).filter(
+            Idea.id.in_(list(idea_ids)),
+            Idea.user_id == user_id,
+            Idea.deleted_at.is_(None)
+        ).all()
+
+    def get_analyses_by_idea_ids(self, idea_ids: Sequence[UUID], user_id: UUID) -> List[Tuple[UUID, Optional[Analysis]]]:
+        """
+        주어진 ID 중 사용자가 소유한 아이디어와 분석 결과 (분석이 없으면 None)
+        응답에 사용하는 섹션을 같은 쿼리로 로드한다.
+        """
+        rows = (
+            self.db.query(Idea.id, Analysis)
+            .outerjoin(Analysis, Analysis.idea_id == Idea.id)
+            .filter(
+                Idea.id.in_(list(idea_ids)),
+                Idea.user_id == user_id,
+                Idea.deleted_at.is_(None)
+            )
+            .options(*(undefer(column) for column in ANALYSIS_RESPONSE_SECTIONS))
+            .all()
+        )
+        return [(row[0], row[1]) for row in rows]
+
+    def get_idea_with_analysis(
+        self,
+        idea_id: UUID,
+        user_id: UUID,
+        completed_only: bool = False,
+        with_collected_data: bool = False,
+        with_analysis_details: bool = False
+    ) -> Tuple[Idea, Optional[Analysis]]:
+        """사용자의 아이디어와 분석 결과(없으면 None)를 함께 조회"""
+        join_on = Analysis.idea_id == Idea.id
+        if completed_only:
+            join_on = and_(join_on, Analysis.status == AnalysisStatus.COMPLETED)
+
+        query = self.db.query(Idea, Analysis).outerjoin(Analysis, join_on)
+        if with_analysis_details:
+            # 여러 엔티티 쿼리에서는 로더 옵션을 Analysis로 한정해야 한다
+            query = query.options(Load(Analysis).undefer_group("details"))
+        row = self._owned(query, idea_id, user_id, with_collected_data).first()
+
+        if not row:
+            raise _idea_not_found()
+
+        return row[0], row[1]
+
+    def get_analysis(self, idea_id: UUID, user_id: UUID) -> Optional[Analysis]:
+        """사용자 아이디어의 분석 결과 조회 (아이디어가 없으면 404, 분석이 없으면 None)"""
+        row = (
+            self.db.query(Idea.id, Analysis)
+            .outerjoin(Analysis, Analysis.idea_id == Idea.id)
+            .filter(*_owned_filter(idea_id, user_id))
+            .options(*(undefer(column) for column in ANALYSIS_RESPONSE_SECTIONS))
+            .first()
+        )
+
+        if not row:
+            raise _idea_not_found()
+
+        return row[1]
+
+    def get_reports(
+        self,
+        idea_id: UUID,
+        user_id: UUID,
+        columns: Optional[Sequence[InstrumentedAttribute]] = None
+    ) -> List[Report]:
+        """
+        사용자 아이디어의 보고서 목록 (최신순, 아이디어가 없으면 404)
+        요약 컬럼만 로드하며, columns를 지정하면 그 컬럼만 로드한다.
+        """
+        rows = (
+            self.db.query(Idea.id, Report)
+            .outerjoin(Report, Report.idea_id == Idea.id)
+            .filter(*_owned_filter(idea_id, user_id))
+            .options(load_only(*(columns or REPORT_SUMMARY_COLUMNS)))
+            .order_by(Report.created_at.desc())
+            .all()
+        )
+
+        if not rows:
+            raise _idea_not_found()
+
+        return [report for _, report in rows if report is not None]
+
+    def get_report(
+        self,
+        report_id: UUID,
+        user_id: UUID,
+        columns: Optional[Sequence[InstrumentedAttribute]] = None
+    ) -> Report:
+        """
+        사용자의 보고서 조회 또는 404 (삭제된 아이디어의 보고서 제외)
+        전체 섹션을 로드하며, columns를 지정하면 그 컬럼만 로드한다.
+        """
+        options = (load_only(*columns),) if columns else (undefer_group("sections"),)
+        report = (
+            self.db.query(Report)
+            .join(Idea, Idea.id == Report.idea_id)
+            .filter(
+                Report.id == report_id,
+                Idea.user_id == user_id,
+                Idea.deleted_at.is_(None)
+            )
+            .options(*options)
+            .first()
+        )
+
+        if not report:
+            raise NotFoundException("보고서를 찾을 수 없습니다.", "report")
+
+        return report
+
+    def get_report_body(self, report_id: UUID, user_id: UUID, body_version: str) -> Optional[bytes]:
+        """완료 시 저장한 보고서의 gzip 응답 본문 (없거나 다른 응답 형식 버전이면 None)"""
+        row = (
+            self.db.query(Report.body_gzip)
+            .join(Idea, Idea.id == Report.idea_id)
+            .filter(
+                Report.id == report_id,
+                Report.body_version == body_version,
+                Idea.user_id == user_id,
+                Idea.deleted_at.is_(None)
+            )
+            .first()
+        )
+        return row[0] if row else None
+
+    def get_idea_version(self, idea_id: UUID, user_id: UUID) -> Row:
+        """조건부 조회용 아이디어 버전 컬럼 (id, status, updated_at) 또는 404"""
+        row = (
+            self.db.query(Idea.id, Idea.status, Idea.updated_at)
+            .filter(*_owned_filter(idea_id, user_id))
+            .first()
+        )
+
+        if not row:
+            raise _idea_not_found()
+
+        return row
+
+    def get_analysis_version(self, idea_id: UUID, user_id: UUID) -> Optional[Row]:
+        """
+        조건부 조회용 분석 버전 컬럼 (id, status, updated_at, completed_at)
+        아이디어가 없으면 404, 분석이 없으면 None
+        """
+        row = (
+            self.db.query(
+                Idea.id.label("idea_id"),
+                Analysis.id,
+                Analysis.status,
+                Analysis.updated_at,
+                Analysis.completed_at
+            )
+            .outerjoin(Analysis, Analysis.idea_id == Idea.id)
+            .filter(*_owned_filter(idea_id, user_id))
+            .first()
+        )
+
+        if not row:
+            raise _idea_not_found()
+
+        return row if row.id is not None else None
+
+    def get_reports_by_ids(self, report_ids: Sequence[UUID], user_id: UUID) -> List[Report]:
+        """주어진 ID 중 사용자의 보고서 (삭제된 아이디어의 보고서 제외, 전체 섹션 포함)"""
+        return (
+            self.db.query(Report)
+            .join(Idea, Idea.id == Report.idea_id)
+            .filter(
+                Report.id.in_(list(report_ids)),
+                Idea.user_id == user_id,
+                Idea.deleted_at.is_(None)
+            )
+            .options(undefer_group("sections"))
+            .all()
+        )
+
+    def get_report_version(self, report_id: UUID, user_id: UUID) -> Row:
+        """조건부 조회용 보고서 버전 컬럼 (id, status, updated_at, completed_at) 또는 404"""
+        row = (
+            self.db.query(Report.id, Report.status, Report.updated_at, Report.completed_at)
+            .join(Idea, Idea.id == Report.idea_id)
+            .filter(
+                Report.id == report_id,
+                Idea.user_id == user_id,
+                Idea.deleted_at.is_(None)
+            )
+            .first()
+        )
+
+        if not row:
+            raise NotFoundException("보고서를 찾을 수 없습니다.", "report")
+
+        return row
+
+    def get_status_row(self, idea_id: UUID, user_id: UUID) -> Row:
+        """
+        아이디어·분석·최신 보고서의 상태 컬럼만 조회
+        (idea_id, idea_status, analysis_id, analysis_status, report_id, report_status, report_type)
+        """
+        latest_report_id = (
+            select(Report.id)
+            .where(Report.idea_id == Idea.id)
+            .order_by(Report.created_at.desc())
+            .limit(1)
+            .correlate(Idea)
+            .scalar_subquery()
+        )
+
+        row = (
+            self.db.query(
+                Idea.id.label("idea_id"),
+                Idea.status.label("idea_status"),
+                Analysis.id.label("analysis_id"),
+                Analysis.status.label("analysis_status"),
+                Report.id.label("report_id"),
+                Report.status.label("report_status"),
+                Report.report_type.label("report_type")
+            )
+            .outerjoin(Analysis, Analysis.idea_id == Idea.id)
+            .outerjoin(Report, Report.id == latest_report_id)
+            .filter(*_owned_filter(idea_id, user_id))
+            .first()
+        )
+
+        if not row:
+            raise _idea_not_found()
+
+        return row
+
+    def claim_status(self, idea: Idea, status: IdeaStatus) -> bool:
+        """
+        아이디어 상태를 조회 시점의 상태(idea.status)에서 status로 조건부 전환 (커밋하지 않음)
+        다른 요청이 먼저 전환했다면 False. Postgres에서는 행 잠금으로 먼저 전환한 트랜잭션의
+        커밋을 기다린 뒤 조건을 다시 평가한다.
+        """
+        result = self.db.execute(
+            update(Idea)
+            .where(Idea.id == idea.id, Idea.status == idea.status)
+            .values(status=status)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount == 1
+
+    @staticmethod
+    def _owned(query: Query, idea_id: UUID, user_id: UUID, with_collected_data: bool) -> Query:
+        query = query.filter(*_owned_filter(idea_id, user_id))
+        if with_collected_data:
+            query = query.options(undefer(Idea.collected_data))
+        return query
+
+
+def _owned_filter(idea_id: UUID, user_id: UUID) -> tuple:
+    return (
+        Idea.id == idea_id,
+        Idea.user_id == user_id,
+        Idea.deleted_at.is_(None)
+    )
+
+
+def _idea_not_found() -> NotFoundException:
+    return NotFoundException("아이디어를 찾을 수 없습니다.", "idea")
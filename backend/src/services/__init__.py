@@ -2,6 +2,8 @@ from .auth_service import AuthService, get_auth_service
 from .idea_service import IdeaService, get_idea_service
 from .analysis_service import AnalysisService, get_analysis_service
 from .report_service import ReportService, get_report_service
+from .batch_service import BatchService, get_batch_service
+from .retention_service import RetentionService, schedule_retention
 
 __all__ = [
     "AuthService",
@@ -11,5 +13,9 @@ __all__ = [
     "AnalysisService",
     "get_analysis_service",
     "ReportService",
-    "get_report_service"
+    "get_report_service",
+    "BatchService",
+    "get_batch_service",
+    "RetentionService",
+    "schedule_retention"
 ]
@@ -2,82 +2,165 @@
 Analysis Service
 분석 관련 비즈니스 로직
 """
-from sqlalchemy.orm import Session
-from typing import Optional
+from sqlalchemy.orm import Session, undefer
+from typing import Optional, Sequence
 from uuid import UUID
 from datetime import datetime
+import hashlib
+import json
 import random
 
+from src.db.session import DBSession
 from src.models.idea_model import Idea, IdeaStatus as ModelIdeaStatus
 from src.models.analysis_model import Analysis, AnalysisStatus
 from src.models.user_model import User
-from src.core.exceptions import NotFoundException, ForbiddenException, ValidationException
+from src.models.job_model import JobKind
+from src.jobs.queue import JobQueue
+from src.repositories import IdeaRepository
+from src.services.async_adapter import AsyncServiceAdapter
+from src.services.batch_get import batch_ids, not_found
+from src.core.metrics import metrics
+from src.core.conditional import ResourceVersion, make_version
+from src.core.exceptions import NotFoundException, ValidationException
 from src.api.v1.schemas import (
     AnalyzeResponse,
     AnalysisResultResponse,
+    AnalysisBatchResponse,
+    BatchGetError,
     AnalysisScores,
     SWOTAnalysis,
     MarketAnalysis
 )
 
 
+# _reuse_or_reset: 다른 요청이 먼저 분석 상태로 전환함
+_CLAIMED_ELSEWHERE = object()
+
+
 class AnalysisService:
     """분석 서비스"""
     
+    # 분석 로직이 바뀌면 올려서 기존 분석 결과 재사용을 막는다
+    ANALYSIS_VERSION = 1
+    
+    # 분석 입력으로 사용하는 아이디어 필드
+    FINGERPRINT_FIELDS = [
+        "title",
+        "description",
+        "problem",
+        "target_customer",
+        "value_proposition",
+        "revenue_model",
+        "differentiation",
+        "constraints",
+        "industry",
+        "collected_data"
+    ]
+    
     def __init__(self, db: Session):
         self.db = db
+        self.repository = IdeaRepository(db)
     
-    def start_analysis(self, idea_id: UUID, user: User) -> AnalyzeResponse:
-        """분석 시작"""
-        idea = self._get_idea_or_404(idea_id)
-        self._check_ownership(idea, user)
+    def start_analysis(self, idea_id: UUID, user: User, force: bool = False) -> AnalyzeResponse:
+        """
+        분석 시작
+        입력(아이디어 내용 + 수집 데이터)이 마지막 완료된 분석과 같으면
+        force=True가 아닌 한 기존 결과를 재사용한다.
+        이미 분석 중이면(중복 클릭, 재시도) 새 작업을 만들지 않고 진행 중인 작업을 알려준다.
+        """
+        # 지문 계산에 collected_data가 필요하므로 함께 로드
+        idea, existing_analysis = self.repository.get_idea_with_analysis(
+            idea_id, user.id, with_collected_data=True
+        )
         
-        # 상태 확인 (데이터 수집이 완료되어야 분석 가능)
-        # 개발 편의를 위해 CREATED 상태에서도 분석 가능하도록 함
-        valid_statuses = [ModelIdeaStatus.CREATED, ModelIdeaStatus.COLLECTED, ModelIdeaStatus.FAILED]
-        if idea.status not in valid_statuses:
-            raise ValidationException(f"현재 상태({idea.status.value})에서는 분석을 시작할 수 없습니다.")
+        if idea.status == ModelIdeaStatus.ANALYZING:
+            return self._attach_to_running(idea.id)
         
-        # 기존 분석 결과가 있는지 확인
-        existing_analysis = self.db.query(Analysis).filter(
-            Analysis.idea_id == idea_id
-        ).first()
+        self._check_can_analyze(idea)
         
-        if existing_analysis:
-            # 기존 분석 결과 초기화
-            existing_analysis.status = AnalysisStatus.IN_PROGRESS
-            existing_analysis.updated_at = datetime.utcnow()
-            analysis = existing_analysis
-        else:
-            # 새 분석 생성
-            analysis = Analysis(
-                idea_id=idea_id,
-                status=AnalysisStatus.IN_PROGRESS
+        analysis = self._reuse_or_reset(idea, existing_analysis, force)
+        if analysis is None:
+            return AnalyzeResponse(
+                idea_id=str(idea.id),
+                status="analysis_cached"
             )
-            self.db.add(analysis)
+        if analysis is _CLAIMED_ELSEWHERE:
+            return self._attach_to_running(idea.id)
         
-        # 아이디어 상태 업데이트
-        idea.status = ModelIdeaStatus.ANALYZING
-        idea.updated_at = datetime.utcnow()
+        # 아이디어 상태 업데이트 + 분석 작업 등록 (같은 트랜잭션)
+        job = JobQueue(self.db).enqueue(JobKind.RUN_ANALYSIS.value, idea.id)
         
         self.db.commit()
         
-        # TODO: 실제로는 여기서 비동기 AI 분석 태스크 실행
-        # celery_app.send_task('run_analysis', args=[str(idea.id)])
-        
-        # 개발용: 즉시 분석 완료 시뮬레이션
-        self._simulate_analysis(analysis, idea)
-        
         return AnalyzeResponse(
             idea_id=str(idea.id),
-            status="analysis_started"
+            status="analysis_started",
+            job_id=str(job.id)
         )
     
+    def analyze_now(self, idea_id: UUID, force: bool = False) -> None:
+        """
+        분석을 바로 실행 (일괄 작업 워커에서 호출, 소유권은 일괄 작업 생성 시 확인됨)
+        start_analysis와 같은 규칙으로 기존 결과를 재사용한다.
+        """
+        idea = self._get_idea_or_404(idea_id)
+        existing_analysis = self.db.query(Analysis).filter(Analysis.idea_id == idea_id).first()
+        
+        if idea.status == ModelIdeaStatus.ANALYZING:
+            metrics.inc("analysis.deduplicated")
+            return
+        self._check_can_analyze(idea)
+        
+        analysis = self._reuse_or_reset(idea, existing_analysis, force)
+        if analysis is None or analysis is _CLAIMED_ELSEWHERE:
+            return
+        
+        self.db.commit()
+        self._simulate_analysis(analysis, idea)
+    
     def get_analysis(self, idea_id: UUID, user: User) -> AnalysisResultResponse:
         """분석 결과 조회"""
-        idea = self._get_idea_or_404(idea_id)
-        self._check_ownership(idea, user)
+        analysis = self.repository.get_analysis(idea_id, user.id)
         
+        if not analysis:
+            raise NotFoundException("분석 결과를 찾을 수 없습니다.", "analysis")
+        
+        return self._to_response(analysis)
+    
+    def get_analyses_by_idea_ids(self, idea_ids: Sequence[UUID], user: User) -> AnalysisBatchResponse:
+        """
+        분석 결과 일괄 조회 (아이디어 ID 기준)
+        아이디어가 없으면 resource=idea, 분석 결과가 없으면 resource=analysis로 표시
+        """
+        idea_ids = batch_ids(idea_ids)
+        analyses = {}
+        errors = {}
+        owned = set()
+        for idea_id, analysis in self.repository.get_analyses_by_idea_ids(idea_ids, user.id):
+            owned.add(str(idea_id))
+            if analysis is None:
+                errors[str(idea_id)] = BatchGetError(resource="analysis")
+            else:
+                analyses[str(idea_id)] = self._to_response(analysis)
+        
+        errors.update(not_found(idea_ids, owned, "idea"))
+        return AnalysisBatchResponse(analyses=analyses, errors=errors)
+    
+    def get_analysis_version(self, idea_id: UUID, user: User) -> ResourceVersion:
+        """분석 결과 조건부 조회용 버전 (JSONB 섹션은 읽지 않음)"""
+        row = self.repository.get_analysis_version(idea_id, user.id)
+        
+        if row is None:
+            raise NotFoundException("분석 결과를 찾을 수 없습니다.", "analysis")
+        
+        return make_version(
+            "analysis", row.id, row.status.value, row.updated_at, row.completed_at,
+            last_modified=row.updated_at or row.completed_at
+        )
+    
+    def run_analysis(self, idea_id: UUID) -> None:
+        """분석 실행 (백그라운드 작업에서 호출)"""
+        idea = self._get_idea_or_404(idea_id)
         analysis = self.db.query(Analysis).filter(
             Analysis.idea_id == idea_id
         ).first()
@@ -85,7 +168,21 @@ class AnalysisService:
         if not analysis:
             raise NotFoundException("분석 결과를 찾을 수 없습니다.", "analysis")
         
-        return self._to_response(analysis)
+        # TODO: 실제 AI 분석으로 교체
+        self._simulate_analysis(analysis, idea)
+    
+    def fail_analysis(self, idea_id: UUID) -> None:
+        """분석 최종 실패 처리"""
+        analysis = self.db.query(Analysis).filter(Analysis.idea_id == idea_id).first()
+        if analysis:
+            analysis.status = AnalysisStatus.FAILED
+        
+        idea = self.db.query(Idea).filter(Idea.id == idea_id).first()
+        if idea and idea.status == ModelIdeaStatus.ANALYZING:
+            idea.status = ModelIdeaStatus.FAILED
+            idea.updated_at = datetime.utcnow()
+        
+        self.db.commit()
     
     def _simulate_analysis(self, analysis: Analysis, idea: Idea) -> None:
         """분석 시뮬레이션 (개발용)"""
@@ -170,6 +267,7 @@ class AnalysisService:
         
         # 상태 업데이트
         analysis.status = AnalysisStatus.COMPLETED
+        analysis.input_hash = self.fingerprint(idea)
         analysis.completed_at = datetime.utcnow()
         
         idea.status = ModelIdeaStatus.ANALYZED
@@ -177,23 +275,92 @@ class AnalysisService:
         
         self.db.commit()
     
+    @classmethod
+    def fingerprint(cls, idea: Idea) -> str:
+        """분석 입력의 지문 (SHA-256)"""
+        content = {field: getattr(idea, field) for field in cls.FINGERPRINT_FIELDS}
+        content["analysis_version"] = cls.ANALYSIS_VERSION
+        raw = json.dumps(content, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+    
+    def _check_can_analyze(self, idea: Idea) -> None:
+        """상태 확인 (데이터 수집이 완료되어야 분석 가능)"""
+        # 개발 편의를 위해 CREATED 상태에서도 분석 가능하도록 함
+        valid_statuses = [
+            ModelIdeaStatus.CREATED,
+            ModelIdeaStatus.COLLECTED,
+            ModelIdeaStatus.ANALYZED,
+            ModelIdeaStatus.COMPLETED,
+            ModelIdeaStatus.FAILED
+        ]
+        if idea.status not in valid_statuses:
+            raise ValidationException(f"현재 상태({idea.status.value})에서는 분석을 시작할 수 없습니다.")
+    
+    def _attach_to_running(self, idea_id: UUID) -> AnalyzeResponse:
+        """진행 중인 분석 작업 응답 (중복 시작 요청)"""
+        metrics.inc("analysis.deduplicated")
+        job = JobQueue(self.db).get_latest(idea_id, JobKind.RUN_ANALYSIS.value)
+        return AnalyzeResponse(
+            idea_id=str(idea_id),
+            status="analysis_in_progress",
+            job_id=str(job.id) if job else None
+        )
+    
+    def _reuse_or_reset(self, idea: Idea, existing_analysis: Optional[Analysis], force: bool) -> Optional[Analysis]:
+        """
+        입력이 바뀌지 않았으면 기존 결과를 재사용하고 None 반환,
+        다른 요청이 먼저 분석을 시작했으면 _CLAIMED_ELSEWHERE 반환,
+        아니면 분석을 진행 중 상태로 만들어 반환 (커밋은 호출자가 한다)
+        """
+        if (
+            not force
+            and existing_analysis
+            and existing_analysis.status == AnalysisStatus.COMPLETED
+            and existing_analysis.input_hash == self.fingerprint(idea)
+        ):
+            metrics.inc("analysis.cache.hits")
+            if idea.status not in [ModelIdeaStatus.ANALYZED, ModelIdeaStatus.COMPLETED]:
+                idea.status = ModelIdeaStatus.ANALYZED
+                idea.updated_at = datetime.utcnow()
+                self.db.commit()
+            return None
+        
+        metrics.inc("analysis.cache.misses")
+        
+        # 동시에 들어온 시작 요청 중 하나만 분석 상태로 전환
+        if not self.repository.claim_status(idea, ModelIdeaStatus.ANALYZING):
+            self.db.rollback()
+            return _CLAIMED_ELSEWHERE
+        
+        if existing_analysis:
+            # 기존 분석 결과 초기화
+            existing_analysis.status = AnalysisStatus.IN_PROGRESS
+            existing_analysis.updated_at = datetime.utcnow()
+            analysis = existing_analysis
+        else:
+            # 새 분석 생성
+            analysis = Analysis(
+                idea_id=idea.id,
+                status=AnalysisStatus.IN_PROGRESS
+            )
+            self.db.add(analysis)
+        
+        idea.status = ModelIdeaStatus.ANALYZING
+        idea.updated_at = datetime.utcnow()
+        return analysis
+    
     def _get_idea_or_404(self, idea_id: UUID) -> Idea:
-        """아이디어 조회 또는 404"""
+        """아이디어 조회 또는 404 (지문 계산용 collected_data 포함)"""
         idea = self.db.query(Idea).filter(
             Idea.id == idea_id,
             Idea.deleted_at.is_(None)
-        ).first()
+        ).options(undefer(Idea.collected_data)).first()
         
         if not idea:
             raise NotFoundException("아이디어를 찾을 수 없습니다.", "idea")
         
         return idea
     
-    def _check_ownership(self, idea: Idea, user: User) -> None:
-        """소유권 확인"""
-        if idea.user_id != user.id:
-            raise ForbiddenException("해당 아이디어에 대한 접근 권한이 없습니다.")
-    
     def _to_response(self, analysis: Analysis) -> AnalysisResultResponse:
         """Analysis 모델을 응답 스키마로 변환"""
         scores = None
@@ -261,6 +428,25 @@ class AnalysisService:
         )
 
 
+def _cache_hit_rate() -> float:
+    hits = metrics.get("analysis.cache.hits")
+    total = hits + metrics.get("analysis.cache.misses")
+    return round(hits / total, 4) if total else 0.0
+
+
+metrics.register_gauge("analysis.cache.hit_rate", _cache_hit_rate)
+
+
 def get_analysis_service(db: Session) -> AnalysisService:
     """AnalysisService 인스턴스 생성"""
     return AnalysisService(db)
+
+
+class AsyncAnalysisService(AsyncServiceAdapter):
+    """AnalysisService의 비동기 변형"""
+    service_class = AnalysisService
+
+
+def get_async_analysis_service(db: DBSession) -> AsyncAnalysisService:
+    """AsyncAnalysisService 인스턴스 생성"""
+    return AsyncAnalysisService(db)
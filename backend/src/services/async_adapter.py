@@ -0,0 +1,39 @@
+"""
+Async Service Adapter
+동기 서비스 클래스의 비동기 변형
+"""
+from typing import Any
+
+from src.db.session import DBSession, run_db
+
+
+class AsyncServiceAdapter:
+    """
+    동기 서비스 메서드를 코루틴으로 노출하는 어댑터
+    - AsyncSession: run_sync로 실행 (비동기 드라이버 사용, 이벤트 루프 비차단)
+    - Session: 스레드 풀에서 실행 (블로킹 드라이버, 이벤트 루프 비차단)
+    서비스 로직은 동기 클래스 한 곳에만 유지된다.
+    """
+
+    service_class: type = None
+
+    def __init__(self, db: DBSession):
+        self.db = db
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        attr = getattr(self.service_class, name)
+        if not callable(attr):
+            return attr
+
+        async def call(*args: Any, **kwargs: Any) -> Any:
+            return await run_db(
+                self.db,
+                lambda session: getattr(self.service_class(session), name)(*args, **kwargs)
+            )
+
+        call.__name__ = name
+        call.__doc__ = attr.__doc__
+        return call
@@ -6,8 +6,9 @@ from sqlalchemy.orm import Session
 from typing import Optional, Tuple
 from uuid import UUID
 
+from src.db.session import DBSession, run_db
 from src.models.user_model import User
-from src.core.security import hash_password, verify_password
+from src.core.security import hash_password_async, verify_password_async
 from src.core.jwt import create_access_token, create_refresh_token, verify_refresh_token
 from src.core.config import settings
 from src.core.exceptions import (
@@ -26,18 +27,18 @@ from src.api.v1.schemas import (
 
 
 class AuthService:
-    """인증 서비스"""
+    """
+    인증 서비스
+    DB 접근은 run_db를 거치므로 Session/AsyncSession 모두에서 동작한다.
+    """
     
-    def __init__(self, db: Session):
+    def __init__(self, db: DBSession):
         self.db = db
     
-    def register(self, request: RegisterRequest) -> AuthResponse:
+    async def register(self, request: RegisterRequest) -> AuthResponse:
         """회원가입"""
         # 이메일 중복 확인
-        existing_user = self.db.query(User).filter(
-            User.email == request.email,
-            User.deleted_at.is_(None)
-        ).first()
+        existing_user = await run_db(self.db, self._find_user_by_email, request.email)
         
         if existing_user:
             raise ConflictException("이미 등록된 이메일입니다.")
@@ -45,13 +46,11 @@ class AuthService:
         # 사용자 생성
         user = User(
             email=request.email,
-            password=hash_password(request.password),
+            password=await hash_password_async(request.password),
             name=request.name
         )
         
-        self.db.add(user)
-        self.db.commit()
-        self.db.refresh(user)
+        await run_db(self.db, self._save_user, user)
         
         # 토큰 생성
         tokens = self._create_tokens(user)
@@ -68,19 +67,16 @@ class AuthService:
             tokens=tokens
         )
     
-    def login(self, request: LoginRequest) -> AuthResponse:
+    async def login(self, request: LoginRequest) -> AuthResponse:
         """로그인"""
         # 사용자 조회
-        user = self.db.query(User).filter(
-            User.email == request.email,
-            User.deleted_at.is_(None)
-        ).first()
+        user = await run_db(self.db, self._find_user_by_email, request.email)
         
         if not user:
             raise UnauthorizedException("이메일 또는 비밀번호가 올바르지 않습니다.")
         
         # 비밀번호 검증
-        if not verify_password(request.password, user.password):
+        if not await verify_password_async(request.password, user.password):
             raise UnauthorizedException("이메일 또는 비밀번호가 올바르지 않습니다.")
         
         # 계정 활성화 확인
@@ -102,7 +98,7 @@ class AuthService:
             tokens=tokens
         )
     
-    def refresh_token(self, refresh_token: str) -> TokenResponse:
+    async def refresh_token(self, refresh_token: str) -> TokenResponse:
         """토큰 갱신"""
         # 리프레시 토큰 검증
         payload = verify_refresh_token(refresh_token)
@@ -114,10 +110,7 @@ class AuthService:
             raise UnauthorizedException("토큰에 사용자 정보가 없습니다.")
         
         # 사용자 조회
-        user = self.db.query(User).filter(
-            User.id == UUID(user_id),
-            User.deleted_at.is_(None)
-        ).first()
+        user = await run_db(self.db, self._find_user_by_id, UUID(user_id))
         
         if not user:
             raise NotFoundException("사용자를 찾을 수 없습니다.")
@@ -128,13 +121,30 @@ class AuthService:
         # 새 토큰 생성
         return self._create_tokens(user)
     
-    def get_user_by_id(self, user_id: UUID) -> Optional[User]:
+    async def get_user_by_id(self, user_id: UUID) -> Optional[User]:
         """ID로 사용자 조회"""
-        return self.db.query(User).filter(
+        return await run_db(self.db, self._find_user_by_id, user_id)
+    
+    @staticmethod
+    def _find_user_by_email(db: Session, email: str) -> Optional[User]:
+        return db.query(User).filter(
+            User.email == email,
+            User.deleted_at.is_(None)
+        ).first()
+    
+    @staticmethod
+    def _find_user_by_id(db: Session, user_id: UUID) -> Optional[User]:
+        return db.query(User).filter(
             User.id == user_id,
             User.deleted_at.is_(None)
         ).first()
     
+    @staticmethod
+    def _save_user(db: Session, user: User) -> None:
+        db.add(user)
+        db.commit()
+        db.refresh(user)
+    
     def _create_tokens(self, user: User) -> TokenResponse:
         """토큰 생성"""
         access_token = create_access_token({"sub": str(user.id)})
@@ -148,6 +158,6 @@ class AuthService:
         )
 
 
-def get_auth_service(db: Session) -> AuthService:
+def get_auth_service(db: DBSession) -> AuthService:
     """AuthService 인스턴스 생성"""
     return AuthService(db)
@@ -0,0 +1,36 @@
+"""
+Batch Get
+여러 ID 일괄 조회 공통 처리 (ID 개수 제한, 찾지 못한 항목 표시)
+
+조회는 소유권 조건이 들어간 IN 쿼리 한 번으로 처리하므로, 다른 사용자의 리소스는
+단건 조회와 마찬가지로 존재하지 않는 것(NOT_FOUND)으로 표시된다.
+"""
+from typing import Dict, Iterable, List
+from uuid import UUID
+
+from src.core.config import settings
+from src.core.exceptions import ValidationException
+from src.core.metrics import metrics
+from src.api.v1.schemas import BatchGetError
+
+
+def batch_ids(ids: Iterable[UUID]) -> List[UUID]:
+    """중복을 제거한 요청 ID (비어 있거나 BATCH_GET_MAX_IDS를 넘으면 400)"""
+    unique = list(dict.fromkeys(ids))
+    if not unique:
+        raise ValidationException("ids에 하나 이상의 ID를 지정해야 합니다.")
+    if len(unique) > settings.BATCH_GET_MAX_IDS:
+        raise ValidationException(f"한 번에 최대 {settings.BATCH_GET_MAX_IDS}개까지 조회할 수 있습니다.")
+
+    metrics.observe("batch_get.ids", len(unique), buckets=(1, 5, 10, 20, 50, 100, 200))
+    return unique
+
+
+def not_found(ids: Iterable[UUID], found: Iterable[str], resource: str) -> Dict[str, BatchGetError]:
+    """찾지 못한 ID → NOT_FOUND 표시"""
+    found = set(found)
+    return {
+        str(item_id): BatchGetError(resource=resource)
+        for item_id in ids
+        if str(item_id) not in found
+    }
@@ -0,0 +1,163 @@
+"""
+Batch Service
+여러 아이디어의 분석/보고서 일괄 처리
+
+일괄 작업은 아이디어마다 batch_item 작업 하나를 사용한다. 처음에는 max_parallel개만
+작업 큐에 등록하고, 항목 하나가 끝날 때마다 다음 아이디어를 등록하므로
+일괄 작업 하나가 동시에 차지하는 워커 수는 max_parallel을 넘지 않는다.
+"""
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+from uuid import UUID
+from datetime import datetime
+
+from src.db.session import DBSession
+from src.models.batch_model import Batch, BatchStatus, BatchOperation as ModelBatchOperation
+from src.models.report_model import ReportType as ModelReportType
+from src.models.user_model import User
+from src.models.job_model import JobKind
+from src.jobs.queue import JobQueue
+from src.repositories import IdeaRepository
+from src.core.config import settings
+from src.services.analysis_service import AnalysisService
+from src.services.report_service import ReportService
+from src.services.async_adapter import AsyncServiceAdapter
+from src.core.exceptions import NotFoundException, ValidationException
+from src.api.v1.schemas import CreateBatchRequest, BatchResponse
+
+
+class BatchService:
+    """일괄 작업 서비스"""
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.repository = IdeaRepository(db)
+
+    def create_batch(self, request: CreateBatchRequest, user: User) -> BatchResponse:
+        """일괄 작업 생성 (소유권은 한 번의 쿼리로 확인)"""
+        idea_ids = list(dict.fromkeys(request.idea_ids))
+        if len(idea_ids) > settings.BATCH_MAX_IDEAS:
+            raise ValidationException(f"한 번에 최대 {settings.BATCH_MAX_IDEAS}개의 아이디어를 처리할 수 있습니다.")
+
+        owned = self.repository.get_owned_idea_ids(idea_ids, user.id)
+        missing = [str(idea_id) for idea_id in idea_ids if idea_id not in owned]
+        if missing:
+            raise ValidationException("찾을 수 없는 아이디어가 포함되어 있습니다.", {"idea_ids": missing})
+
+        # 분석 → 보고서 순서로 정렬
+        requested = {operation.value for operation in request.operations}
+        operations = [operation.value for operation in ModelBatchOperation if operation.value in requested]
+        max_parallel = min(request.max_parallel or settings.BATCH_MAX_PARALLEL, settings.BATCH_MAX_PARALLEL)
+        window = idea_ids[:max_parallel]
+
+        batch = Batch(
+            user_id=user.id,
+            idea_ids=[str(idea_id) for idea_id in idea_ids],
+            operations=operations,
+            options={"force": request.force, "report_type": request.report_type.value},
+            max_parallel=max_parallel,
+            next_index=len(window),
+            status=BatchStatus.RUNNING
+        )
+        self.db.add(batch)
+        self.db.flush()
+
+        JobQueue(self.db).enqueue_many(JobKind.BATCH_ITEM.value, window, payload={"batch_id": str(batch.id)})
+        self.db.commit()
+
+        return self._to_response(batch)
+
+    def get_batch(self, batch_id: UUID, user: User) -> BatchResponse:
+        """일괄 작업 진행 상황 조회"""
+        batch = self.db.query(Batch).filter(
+            Batch.id == batch_id,
+            Batch.user_id == user.id
+        ).first()
+
+        if not batch:
+            raise NotFoundException("일괄 작업을 찾을 수 없습니다.", "batch")
+
+        return self._to_response(batch)
+
+    def run_item(self, batch_id: UUID, idea_id: UUID) -> None:
+        """일괄 작업의 아이디어 1건 처리 (작업 워커에서 호출)"""
+        batch = self.db.get(Batch, batch_id)
+        if batch is None:
+            return
+
+        options = batch.options or {}
+        if ModelBatchOperation.ANALYZE.value in batch.operations:
+            AnalysisService(self.db).analyze_now(idea_id, force=options.get("force", False))
+        if ModelBatchOperation.REPORT.value in batch.operations:
+            ReportService(self.db).generate_now(
+                idea_id, batch.user_id, ModelReportType(options.get("report_type", "basic"))
+            )
+
+        self._finish_item(batch_id, succeeded=True)
+
+    def fail_item(self, batch_id: UUID, idea_id: UUID) -> None:
+        """아이디어 1건 최종 실패 처리 (재시도 소진 후)"""
+        AnalysisService(self.db).fail_analysis(idea_id)
+        self._finish_item(batch_id, succeeded=False)
+
+    def _finish_item(self, batch_id: UUID, succeeded: bool) -> None:
+        """완료 집계 후 대기 중인 다음 아이디어 등록"""
+        counter = Batch.succeeded if succeeded else Batch.failed
+
+        # 집계 UPDATE로 행 잠금을 잡으므로 다른 워커의 완료 처리는 커밋까지 대기한다
+        self.db.execute(
+            update(Batch)
+            .where(Batch.id == batch_id)
+            .values({counter.key: counter + 1, "updated_at": datetime.utcnow()})
+            .execution_options(synchronize_session=False)
+        )
+        batch = self.db.get(Batch, batch_id, populate_existing=True)
+        if batch is None:
+            self.db.commit()
+            return
+
+        if batch.next_index < batch.total:
+            next_idea_id = UUID(batch.idea_ids[batch.next_index])
+            batch.next_index += 1
+            JobQueue(self.db).enqueue(
+                JobKind.BATCH_ITEM.value,
+                next_idea_id,
+                payload={"batch_id": str(batch.id)}
+            )
+        elif batch.succeeded + batch.failed >= batch.total:
+            batch.status = BatchStatus.COMPLETED
+            batch.finished_at = datetime.utcnow()
+
+        self.db.commit()
+
+    def _to_response(self, batch: Batch) -> BatchResponse:
+        done = batch.succeeded + batch.failed
+        return BatchResponse(
+            batch_id=str(batch.id),
+            status=batch.status.value,
+            operations=batch.operations,
+            max_parallel=batch.max_parallel,
+            total=batch.total,
+            pending=batch.total - batch.next_index,
+            running=batch.next_index - done,
+            succeeded=batch.succeeded,
+            failed=batch.failed,
+            progress=int(done * 100 / batch.total) if batch.total else 100,
+            created_at=batch.created_at.isoformat() if batch.created_at else None,
+            finished_at=batch.finished_at.isoformat() if batch.finished_at else None
+        )
+
+
+def get_batch_service(db: Session) -> BatchService:
+    """BatchService 인스턴스 생성"""
+    return BatchService(db)
+
+
+class AsyncBatchService(AsyncServiceAdapter):
+    """BatchService의 비동기 변형"""
+    service_class = BatchService
+
+
+def get_async_batch_service(db: DBSession) -> AsyncBatchService:
+    """AsyncBatchService 인스턴스 생성"""
+    return AsyncBatchService(db)
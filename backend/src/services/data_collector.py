@@ -0,0 +1,90 @@
+"""
+Data Collector
+여러 외부 데이터 소스를 동시에 수집하는 asyncio 수집기
+"""
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, NamedTuple, Optional
+
+from src.core.metrics import metrics
+
+# 소스 함수: 아이디어 정보(context)를 받아 수집 결과(dict)를 반환
+SourceFn = Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]
+
+
+class SourceResult(NamedTuple):
+    """소스별 수집 결과"""
+    name: str
+    ok: bool
+    data: Optional[Dict[str, Any]]
+    error: Optional[str]
+    elapsed: float
+
+
+class DataCollector:
+    """
+    소스별 타임아웃을 두고 모든 소스를 동시에 수집
+    - 한 소스의 실패/타임아웃은 다른 소스에 영향을 주지 않는다.
+    - 소스가 끝나는 즉시 on_result 콜백으로 결과를 전달한다.
+    - 전체 타임아웃 또는 취소 시 남은 소스는 취소된다.
+    """
+    
+    def __init__(
+        self,
+        sources: Dict[str, SourceFn],
+        source_timeout: float,
+        total_timeout: Optional[float] = None
+    ):
+        self.sources = sources
+        self.source_timeout = source_timeout
+        self.total_timeout = total_timeout
+    
+    async def collect(
+        self,
+        context: Dict[str, Any],
+        on_result: Optional[Callable[[SourceResult], None]] = None,
+        only: Optional[Iterable[str]] = None
+    ) -> List[SourceResult]:
+        """소스 동시 수집 (only 지정 시 해당 소스만)"""
+        names = list(only) if only is not None else list(self.sources)
+        tasks = {
+            asyncio.ensure_future(self._run(name, self.sources[name], context)): name
+            for name in names
+        }
+        results: List[SourceResult] = []
+        
+        try:
+            for future in asyncio.as_completed(tasks, timeout=self.total_timeout):
+                result = await future
+                results.append(result)
+                if on_result:
+                    on_result(result)
+        except asyncio.TimeoutError:
+            finished = {result.name for result in results}
+            for name in names:
+                if name not in finished:
+                    result = SourceResult(name, False, None, "cancelled: total timeout", 0.0)
+                    results.append(result)
+                    if on_result:
+                        on_result(result)
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        
+        return results
+    
+    async def _run(self, name: str, source: SourceFn, context: Dict[str, Any]) -> SourceResult:
+        started = time.perf_counter()
+        try:
+            data = await asyncio.wait_for(source(context), timeout=self.source_timeout)
+        except asyncio.TimeoutError:
+            metrics.inc(f"collector.{name}.timeouts")
+            return SourceResult(name, False, None, "timeout", time.perf_counter() - started)
+        except Exception as exc:
+            metrics.inc(f"collector.{name}.errors")
+            return SourceResult(name, False, None, f"{type(exc).__name__}: {exc}", time.perf_counter() - started)
+        
+        metrics.inc(f"collector.{name}.succeeded")
+        return SourceResult(name, True, data, None, time.perf_counter() - started)
@@ -0,0 +1,80 @@
+"""
+Data Sources
+데이터 수집 소스 (현재는 시뮬레이션)
+"""
+import asyncio
+from datetime import datetime
+from typing import Any, Dict
+
+from .data_collector import SourceFn
+
+
+# 외부 API 연동 전까지 시뮬레이션 데이터를 반환한다 (검색 API 연동은 search_service의 TODO 참고)
+
+def _envelope(source: str, context: Dict[str, Any], items: list) -> Dict[str, Any]:
+    return {
+        "source": source,
+        "query": context.get("title"),
+        "items": items,
+        "collected_at": datetime.utcnow().isoformat()
+    }
+
+
+async def collect_market_data(context: Dict[str, Any]) -> Dict[str, Any]:
+    """시장 데이터"""
+    await asyncio.sleep(0)
+    return _envelope("market_data", context, [
+        {"industry": context.get("industry"), "market_size": "₩15조", "growth_rate": "12.5%"}
+    ])
+
+
+async def collect_competitor_data(context: Dict[str, Any]) -> Dict[str, Any]:
+    """경쟁사 데이터"""
+    await asyncio.sleep(0)
+    return _envelope("competitor_data", context, [
+        {"name": "경쟁사 A", "market_share": "35%"},
+        {"name": "경쟁사 B", "market_share": "15%"}
+    ])
+
+
+async def collect_customer_insights(context: Dict[str, Any]) -> Dict[str, Any]:
+    """고객 인사이트"""
+    await asyncio.sleep(0)
+    return _envelope("customer_insights", context, [
+        {"segment": context.get("target_customer"), "sentiment": "positive"}
+    ])
+
+
+async def collect_regulation_data(context: Dict[str, Any]) -> Dict[str, Any]:
+    """규제 데이터"""
+    await asyncio.sleep(0)
+    return _envelope("regulation_data", context, [
+        {"title": "관련 산업 규제", "requirements": ["인허가 취득", "정기 보고"]}
+    ])
+
+
+async def collect_technology_trend(context: Dict[str, Any]) -> Dict[str, Any]:
+    """기술 트렌드"""
+    await asyncio.sleep(0)
+    return _envelope("technology_trend", context, [
+        {"technology": "AI", "adoption_rate": "35%"}
+    ])
+
+
+async def collect_profitability_benchmark(context: Dict[str, Any]) -> Dict[str, Any]:
+    """수익성 벤치마크"""
+    await asyncio.sleep(0)
+    return _envelope("profitability_benchmark", context, [
+        {"average_margin": "15-25%", "roi_benchmark": "18%"}
+    ])
+
+
+# IdeaService.COLLECT_TASKS 와 같은 이름을 사용
+DEFAULT_SOURCES: Dict[str, SourceFn] = {
+    "market_data": collect_market_data,
+    "competitor_data": collect_competitor_data,
+    "customer_insights": collect_customer_insights,
+    "regulation_data": collect_regulation_data,
+    "technology_trend": collect_technology_trend,
+    "profitability_benchmark": collect_profitability_benchmark,
+}
@@ -0,0 +1,272 @@
+"""
+Export Service
+사용자의 아이디어 / 분석 / 보고서를 NDJSON 또는 CSV로 스트리밍 내보내기
+
+- 행은 서버 측 커서(yield_per)로 EXPORT_BATCH_SIZE개씩 가져오고, 인코딩한 줄을 약 EXPORT_CHUNK_BYTES
+  단위로 모아 전송하므로 메모리 사용량은 계정의 데이터 양과 관계없이 일정하다.
+- ORM 객체 대신 필요한 컬럼만 Core select로 조회한다 (identity map에 행이 쌓이지 않음).
+- 요청 의존성의 세션은 응답 본문을 보내기 전에 닫히므로, 스트림은 세션 팩토리로 자기 세션을 열고 닫는다.
+- 내보내기는 커넥션을 오래 점유하므로 프로세스당 동시 실행 수를 EXPORT_MAX_CONCURRENT로 제한한다.
+"""
+import csv
+import io
+import json
+import threading
+from typing import Any, AsyncIterator, Callable, Iterator, List, Optional, Tuple, Union
+from uuid import UUID
+
+from sqlalchemy import Select, select
+
+from src.core.config import settings
+from src.core.exceptions import ServiceUnavailableException, ValidationException
+from src.core.fieldsets import to_json_value
+from src.core.metrics import metrics
+from src.db.session import DBSession
+from src.models import Analysis, Idea, Report
+from src.models.user_model import User
+
+EXPORT_RESOURCES = ("ideas", "analyses", "reports")
+EXPORT_FORMATS = ("ndjson", "csv")
+
+# text/* 는 StreamingResponse가 charset을 붙이므로 application/* 에만 직접 지정
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson; charset=utf-8",
+    "csv": "text/csv",
+}
+
+# 리소스별 내보내기 컬럼 (이름, 컬럼) - 응답 스키마와 같은 이름을 사용
+_COLUMNS = {
+    "ideas": (
+        ("id", Idea.id),
+        ("user_id", Idea.user_id),
+        ("title", Idea.title),
+        ("description", Idea.description),
+        ("problem", Idea.problem),
+        ("target_customer", Idea.target_customer),
+        ("value_proposition", Idea.value_proposition),
+        ("differentiation", Idea.differentiation),
+        ("constraints", Idea.constraints),
+        ("industry", Idea.industry),
+        ("revenue_model", Idea.revenue_model),
+        ("status", Idea.status),
+        ("created_at", Idea.created_at),
+        ("updated_at", Idea.updated_at),
+    ),
+    "analyses": (
+        ("idea_id", Analysis.idea_id),
+        ("status", Analysis.status),
+        ("market_score", Analysis.market_score),
+        ("competition_score", Analysis.competition_score),
+        ("customer_demand_score", Analysis.customer_demand_score),
+        ("financial_score", Analysis.financial_score),
+        ("execution_score", Analysis.execution_score),
+        ("risk_score", Analysis.risk_score),
+        ("overall_score", Analysis.overall_score),
+        ("market_analysis", Analysis.market_analysis),
+        ("competition_analysis", Analysis.competition_analysis),
+        ("customer_analysis", Analysis.customer_analysis),
+        ("financial_analysis", Analysis.financial_analysis),
+        ("risk_analysis", Analysis.risk_analysis),
+        ("swot_analysis", Analysis.swot_analysis),
+        ("created_at", Analysis.created_at),
+        ("completed_at", Analysis.completed_at),
+    ),
+    # 저장된 압축 본문(body_gzip / body_version)은 섹션에서 다시 만들 수 있으므로 제외
+    "reports": (
+        ("report_id", Report.id),
+        ("idea_id", Report.idea_id),
+        ("status", Report.status),
+        ("report_type", Report.report_type),
+        ("executive_summary", Report.executive_summary),
+        ("recommendation", Report.recommendation),
+        ("swot", Report.swot),
+        ("market_analysis", Report.market_analysis),
+        ("competition_analysis", Report.competition_analysis),
+        ("financial_analysis", Report.financial_analysis),
+        ("risk_assessment", Report.risk_assessment),
+        ("action_items", Report.action_items),
+        ("key_insights", Report.key_insights),
+        ("pdf_url", Report.pdf_url),
+        ("created_at", Report.created_at),
+        ("completed_at", Report.completed_at),
+    ),
+}
+
+
+class _ExportSlots:
+    """프로세스당 동시 내보내기 수 제한"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._active = 0
+
+    def acquire(self) -> Callable[[], None]:
+        """슬롯 확보 (초과 시 503), 반환값은 여러 번 호출해도 한 번만 반납하는 해제 함수"""
+        with self._lock:
+            if self._active >= settings.EXPORT_MAX_CONCURRENT:
+                metrics.inc("exports.rejected")
+                raise ServiceUnavailableException(
+                    "진행 중인 내보내기가 많아 잠시 후 다시 시도해주세요.",
+                    retry_after=settings.DB_ADMISSION_RETRY_AFTER_SECONDS
+                )
+            self._active += 1
+            metrics.set_gauge("exports.active", self._active)
+
+        released = False
+
+        def release() -> None:
+            nonlocal released
+            with self._lock:
+                if released:
+                    return
+                released = True
+                self._active -= 1
+                metrics.set_gauge("exports.active", self._active)
+
+        return release
+
+
+export_slots = _ExportSlots()
+
+
+class _ChunkWriter:
+    """행을 NDJSON / CSV로 인코딩해 약 EXPORT_CHUNK_BYTES 단위의 바이트 청크로 모음"""
+
+    def __init__(self, fmt: str, names: Tuple[str, ...]):
+        self.buffer = io.StringIO()
+        self.csv_writer = csv.writer(self.buffer, lineterminator="\n") if fmt == "csv" else None
+        self.bytes = 0
+        if self.csv_writer is not None:
+            self.csv_writer.writerow(names)
+
+    def write(self, values: Tuple[Any, ...], names: Tuple[str, ...]) -> Optional[bytes]:
+        """행 추가 (버퍼가 찼으면 청크 반환)"""
+        if self.csv_writer is not None:
+            self.csv_writer.writerow([_csv_value(value) for value in values])
+        else:
+            record = {name: to_json_value(value) for name, value in zip(names, values)}
+            self.buffer.write(json.dumps(record, ensure_ascii=False, default=str))
+            self.buffer.write("\n")
+
+        if self.buffer.tell() >= settings.EXPORT_CHUNK_BYTES:
+            return self.flush()
+        return None
+
+    def flush(self) -> bytes:
+        chunk = self.buffer.getvalue().encode("utf-8")
+        self.buffer.seek(0)
+        self.buffer.truncate(0)
+        self.bytes += len(chunk)
+        return chunk
+
+
+def _csv_value(value: Any) -> Any:
+    """CSV 셀 값 (중첩 값은 JSON 문자열, None은 빈 칸)"""
+    if value is None:
+        return ""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False, default=str)
+    return to_json_value(value)
+
+
+class ExportService:
+    """사용자 데이터 스트리밍 내보내기 서비스"""
+
+    def __init__(self, session_factory: Callable[[], DBSession]):
+        self.session_factory = session_factory
+
+    def stream(self, resource: str, fmt: str, user: User) -> Tuple[Union[Iterator[bytes], AsyncIterator[bytes]], Callable[[], None]]:
+        """
+        내보내기 스트림과 슬롯 해제 함수 반환
+        스트림은 끝나거나 중단되면 슬롯을 반납하며, 전송이 시작되지 않은 경우를 위해
+        호출자는 응답 종료 후 해제 함수도 호출해야 한다 (중복 호출 안전).
+        """
+        if resource not in EXPORT_RESOURCES:
+            raise ValidationException(
+                "내보낼 수 없는 리소스입니다.",
+                {"resource": resource, "supported": list(EXPORT_RESOURCES)}
+            )
+        if fmt not in EXPORT_FORMATS:
+            raise ValidationException(
+                "지원하지 않는 내보내기 형식입니다.",
+                {"format": fmt, "supported": list(EXPORT_FORMATS)}
+            )
+
+        release = export_slots.acquire()
+        metrics.inc(f"exports.{resource}.{fmt}")
+        statement = self._statement(resource, user.id)
+        names = tuple(name for name, _ in _COLUMNS[resource])
+        if settings.DB_ASYNC_MODE:
+            return self._iter_async(resource, statement, fmt, names, release), release
+        return self._iter_sync(resource, statement, fmt, names, release), release
+
+    def _statement(self, resource: str, user_id: UUID) -> Select:
+        """소유자 조건이 들어간 컬럼 조회 (아이디어 생성 순서)"""
+        statement = select(*(column for _, column in _COLUMNS[resource]))
+        if resource == "analyses":
+            statement = statement.join(Idea, Analysis.idea_id == Idea.id)
+        elif resource == "reports":
+            statement = statement.join(Idea, Report.idea_id == Idea.id)
+
+        statement = statement.where(Idea.user_id == user_id, Idea.deleted_at.is_(None))
+        order_by: List[Any] = [Idea.created_at, Idea.id]
+        if resource == "reports":
+            order_by += [Report.created_at, Report.id]
+        return statement.order_by(*order_by).execution_options(yield_per=settings.EXPORT_BATCH_SIZE)
+
+    def _iter_sync(
+        self,
+        resource: str,
+        statement: Select,
+        fmt: str,
+        names: Tuple[str, ...],
+        release: Callable[[], None]
+    ) -> Iterator[bytes]:
+        """동기 세션 스트림 (StreamingResponse가 스레드 풀에서 순회)"""
+        writer = _ChunkWriter(fmt, names)
+        rows = 0
+        try:
+            with self.session_factory() as db:
+                for row in db.execute(statement):
+                    rows += 1
+                    chunk = writer.write(tuple(row), names)
+                    if chunk is not None:
+                        yield chunk
+            chunk = writer.flush()
+            if chunk:
+                yield chunk
+        finally:
+            self._record(resource, rows, writer.bytes)
+            release()
+
+    async def _iter_async(
+        self,
+        resource: str,
+        statement: Select,
+        fmt: str,
+        names: Tuple[str, ...],
+        release: Callable[[], None]
+    ) -> AsyncIterator[bytes]:
+        """비동기 세션 스트림 (AsyncSession.stream은 서버 측 커서 사용)"""
+        writer = _ChunkWriter(fmt, names)
+        rows = 0
+        try:
+            async with self.session_factory() as db:
+                result = await db.stream(statement)
+                async for row in result:
+                    rows += 1
+                    chunk = writer.write(tuple(row), names)
+                    if chunk is not None:
+                        yield chunk
+            chunk = writer.flush()
+            if chunk:
+                yield chunk
+        finally:
+            self._record(resource, rows, writer.bytes)
+            release()
+
+    @staticmethod
+    def _record(resource: str, rows: int, size: int) -> None:
+        metrics.inc(f"exports.{resource}.rows", rows)
+        metrics.inc("exports.bytes", size)
+
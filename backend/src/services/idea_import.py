@@ -0,0 +1,248 @@
+"""
+Idea Import
+JSON 배열 / NDJSON / CSV 스트림에서 아이디어를 읽어 배치 단위로 저장
+
+요청 본문을 끝까지 버퍼링하지 않고 청크 단위로 파싱·검증하며,
+행별 오류는 모아서 반환하고 나머지 행은 계속 처리한다.
+"""
+import codecs
+import csv
+import io
+import json
+import re
+from typing import Any, AsyncIterator, Dict, List, NamedTuple, Optional, Tuple
+
+from pydantic import ValidationError
+
+from src.core.config import settings
+from src.models.user_model import User
+from src.api.v1.schemas import CreateIdeaRequest, IdeaImportResponse, IdeaImportRowError
+
+IMPORT_FORMATS = ("json", "ndjson", "csv")
+
+_WHITESPACE = re.compile(r"\s*")
+
+_CONTENT_TYPES = {
+    "application/json": "json",
+    "application/x-ndjson": "ndjson",
+    "application/ndjson": "ndjson",
+    "application/jsonlines": "ndjson",
+    "text/csv": "csv",
+}
+
+
+class ImportRow(NamedTuple):
+    """파싱된 입력 행 (파싱 실패 시 data=None, error에 사유)"""
+    number: int
+    data: Optional[Dict[str, Any]]
+    error: Optional[str]
+
+
+def detect_import_format(content_type: Optional[str]) -> Optional[str]:
+    """Content-Type 헤더로 입력 형식 판별 (알 수 없으면 None)"""
+    if not content_type:
+        return None
+    return _CONTENT_TYPES.get(content_type.split(";")[0].strip().lower())
+
+
+async def iter_import_rows(chunks: AsyncIterator[bytes], fmt: str) -> AsyncIterator[ImportRow]:
+    """바이트 청크 스트림을 입력 행으로 변환"""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    parser = {"json": _JSONArrayParser, "ndjson": _NDJSONParser, "csv": _CSVParser}[fmt]()
+    number = 0
+
+    try:
+        async for chunk in chunks:
+            for data, error in parser.feed(decoder.decode(chunk)):
+                number += 1
+                yield ImportRow(number, data, error)
+
+        for data, error in parser.feed(decoder.decode(b"", final=True), final=True):
+            number += 1
+            yield ImportRow(number, data, error)
+    except ValueError as exc:
+        # 스트림 구조 자체가 깨진 경우 (이후 행은 읽을 수 없음)
+        yield ImportRow(number + 1, None, f"입력을 해석할 수 없습니다: {exc}")
+
+
+async def import_idea_rows(
+    rows: AsyncIterator[ImportRow],
+    idea_service: Any,
+    user: User,
+    collect: bool = False
+) -> IdeaImportResponse:
+    """
+    입력 행을 검증하고 IDEA_IMPORT_BATCH_SIZE 단위로 저장
+    idea_service는 IdeaService 또는 AsyncIdeaService (import_ideas 메서드 사용)
+    """
+    batch: List[CreateIdeaRequest] = []
+    errors: List[IdeaImportRowError] = []
+    imported = 0
+    failed = 0
+    total = 0
+
+    async def flush() -> None:
+        nonlocal imported
+        if batch:
+            imported += len(await idea_service.import_ideas(list(batch), user, collect))
+            batch.clear()
+
+    async for row in rows:
+        total += 1
+        if total > settings.IDEA_IMPORT_MAX_ROWS:
+            failed += 1
+            errors.append(IdeaImportRowError(
+                row=row.number,
+                errors=[{"field": None, "message": f"최대 {settings.IDEA_IMPORT_MAX_ROWS}건까지 가져올 수 있습니다."}]
+            ))
+            break
+
+        request, row_errors = _validate(row)
+        if request is not None:
+            batch.append(request)
+            if len(batch) >= settings.IDEA_IMPORT_BATCH_SIZE:
+                await flush()
+            continue
+
+        failed += 1
+        if len(errors) < settings.IDEA_IMPORT_MAX_ERRORS:
+            errors.append(IdeaImportRowError(row=row.number, errors=row_errors))
+
+    await flush()
+
+    return IdeaImportResponse(
+        imported=imported,
+        failed=failed,
+        errors=errors,
+        collection_started=collect and imported > 0
+    )
+
+
+def _validate(row: ImportRow) -> Tuple[Optional[CreateIdeaRequest], List[Dict[str, Any]]]:
+    """(검증된 요청, 필드별 오류 목록)"""
+    if row.error:
+        return None, [{"field": None, "message": row.error}]
+    if not isinstance(row.data, dict):
+        return None, [{"field": None, "message": "각 행은 객체여야 합니다."}]
+
+    try:
+        return CreateIdeaRequest(**row.data), []
+    except ValidationError as exc:
+        return None, [
+            {"field": ".".join(str(loc) for loc in error["loc"]) or None, "message": error["msg"]}
+            for error in exc.errors()
+        ]
+
+
+class _NDJSONParser:
+    """한 줄에 JSON 객체 하나"""
+
+    def __init__(self):
+        self.buffer = ""
+
+    def feed(self, text: str, final: bool = False):
+        self.buffer += text
+        lines = self.buffer.split("\n")
+        self.buffer = "" if final else lines.pop()
+
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line), None
+            except json.JSONDecodeError as exc:
+                yield None, f"JSON 형식 오류: {exc.msg}"
+
+
+class _CSVParser:
+    """첫 행은 헤더, 빈 값은 미입력으로 처리 (따옴표 안의 줄바꿈 허용)"""
+
+    def __init__(self):
+        self.buffer = ""
+        self.record = ""
+        self.header: Optional[List[str]] = None
+
+    def feed(self, text: str, final: bool = False):
+        self.buffer += text
+        lines = self.buffer.split("\n")
+        self.buffer = "" if final else lines.pop()
+
+        for line in lines:
+            self.record += line + "\n"
+            # 따옴표 개수가 홀수면 필드 안의 줄바꿈이므로 다음 줄과 합친다
+            if self.record.count('"') % 2 and not final:
+                continue
+            yield from self._parse_record()
+
+        if final and self.record:
+            yield from self._parse_record()
+
+    def _parse_record(self):
+        record, self.record = self.record, ""
+        if not record.strip():
+            return
+
+        values = next(csv.reader(io.StringIO(record)))
+        if self.header is None:
+            self.header = [name.strip() for name in values]
+            return
+
+        if len(values) > len(self.header):
+            yield None, f"열 개수({len(values)})가 헤더({len(self.header)})보다 많습니다."
+            return
+
+        yield {name: value for name, value in zip(self.header, values) if value != ""}, None
+
+
+class _JSONArrayParser:
+    """최상위 JSON 배열의 원소를 도착하는 대로 하나씩 디코딩"""
+
+    def __init__(self):
+        self.buffer = ""
+        self.started = False
+        self.finished = False
+        self.decoder = json.JSONDecoder()
+
+    def feed(self, text: str, final: bool = False):
+        buffer = self.buffer + text
+        pos = 0
+
+        while not self.finished:
+            pos = _WHITESPACE.match(buffer, pos).end()
+            if pos == len(buffer):
+                break
+
+            if not self.started:
+                if buffer[pos] != "[":
+                    raise ValueError("JSON 배열이어야 합니다.")
+                self.started = True
+                pos += 1
+                continue
+
+            if buffer[pos] == ",":
+                pos += 1
+                continue
+            if buffer[pos] == "]":
+                self.finished = True
+                pos = len(buffer)
+                break
+
+            try:
+                item, end = self.decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError as exc:
+                if final:
+                    raise ValueError(f"JSON 형식 오류: {exc.msg}")
+                # 원소가 아직 다 도착하지 않음
+                break
+
+            # 끝에서 잘린 숫자 리터럴일 수 있으므로 다음 청크를 기다린다
+            if end == len(buffer) and not isinstance(item, (dict, list)) and not final:
+                break
+
+            pos = end
+            yield item, None
+
+        self.buffer = buffer[pos:]
+        if final and not self.finished:
+            raise ValueError("JSON 배열이 닫히지 않았습니다.")
@@ -2,24 +2,47 @@
 Idea Service
 아이디어 관련 비즈니스 로직
 """
-from sqlalchemy.orm import Session
-from typing import List, Optional, Tuple
-from uuid import UUID
+from sqlalchemy import and_, insert, or_
+from sqlalchemy.orm import Session, load_only, undefer
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+from uuid import UUID, uuid4
 from datetime import datetime
+import asyncio
+import base64
 
+from src.db.session import DBSession
 from src.models.idea_model import Idea, IdeaStatus as ModelIdeaStatus, IndustryType as ModelIndustryType, RevenueModel as ModelRevenueModel
 from src.models.user_model import User
-from src.core.exceptions import NotFoundException, ForbiddenException, ValidationException
+from src.models.job_model import JobKind
+from src.models.status_events import status_event
+from src.jobs.queue import JobQueue
+from src.repositories import IdeaRepository
+from src.core.config import settings
+from src.core.conditional import ResourceVersion, make_version
+from src.core.fieldsets import to_json_value
+from src.services.data_collector import DataCollector, SourceResult
+from src.services.data_sources import DEFAULT_SOURCES
+from src.services.async_adapter import AsyncServiceAdapter
+from src.services.batch_get import batch_ids, not_found
+from src.core.exceptions import NotFoundException, ValidationException
 from src.api.v1.schemas import (
     CreateIdeaRequest,
     UpdateIdeaRequest,
     IdeaResponse,
+    IdeaBatchResponse,
     IdeaCreateResponse,
     CollectDataResponse,
     CollectStatusResponse
 )
 
 
+class CollectionIncompleteError(Exception):
+    """일부 소스 수집 실패 (작업 재시도 대상)"""
+    def __init__(self, failed_tasks: List[str]):
+        self.failed_tasks = failed_tasks
+        super().__init__(f"수집 실패 소스: {', '.join(failed_tasks)}")
+
+
 class IdeaService:
     """아이디어 서비스"""
     
@@ -35,6 +58,7 @@ class IdeaService:
     
     def __init__(self, db: Session):
         self.db = db
+        self.repository = IdeaRepository(db)
     
     def create_idea(self, request: CreateIdeaRequest, user: User) -> IdeaCreateResponse:
         """아이디어 생성"""
@@ -71,29 +95,122 @@ class IdeaService:
             status=idea.status.value
         )
     
-    def get_idea(self, idea_id: UUID, user: User) -> IdeaResponse:
-        """아이디어 조회"""
-        idea = self._get_idea_or_404(idea_id)
-        self._check_ownership(idea, user)
+    def import_ideas(self, requests: List[CreateIdeaRequest], user: User, collect: bool = False) -> List[UUID]:
+        """
+        검증된 아이디어 일괄 저장 (단일 executemany INSERT + 커밋 1회)
+        collect=True면 수집 작업도 같은 트랜잭션으로 등록한다.
+        """
+        now = datetime.utcnow()
+        status = ModelIdeaStatus.COLLECTING if collect else ModelIdeaStatus.CREATED
+        rows = [
+            {
+                "id": uuid4(),
+                "user_id": user.id,
+                "title": request.title,
+                "description": request.description,
+                "problem": request.problem,
+                "target_customer": request.target_customer,
+                "value_proposition": request.value_proposition,
+                "differentiation": request.differentiation,
+                "constraints": request.constraints,
+                "industry": request.industry.value if request.industry else None,
+                "revenue_model": request.revenue_model,
+                "status": status,
+                "created_at": now,
+                "updated_at": now
+            }
+            for request in requests
+        ]
+        idea_ids = [row["id"] for row in rows]
+        
+        self.db.execute(insert(Idea), rows)
+        if collect:
+            JobQueue(self.db).enqueue_many(JobKind.COLLECT_DATA.value, idea_ids)
+        self.db.commit()
+        
+        return idea_ids
+    
+    def get_idea(
+        self,
+        idea_id: UUID,
+        user: User,
+        fields: Optional[Sequence[str]] = None
+    ) -> Union[IdeaResponse, Dict[str, Any]]:
+        """아이디어 조회 (fields 지정 시 해당 컬럼만 조회해 dict로 반환)"""
+        if fields:
+            idea = self.repository.get_idea(idea_id, user.id, columns=self._columns(fields))
+            return self._to_fields(idea, fields)
+        
+        idea = self.repository.get_idea(idea_id, user.id)
         
         return self._to_response(idea)
     
-    def get_ideas(self, user: User, page: int = 1, page_size: int = 20) -> Tuple[List[IdeaResponse], int]:
-        """사용자의 아이디어 목록 조회"""
-        query = self.db.query(Idea).filter(
-            Idea.user_id == user.id,
-            Idea.deleted_at.is_(None)
-        ).order_by(Idea.created_at.desc())
+    def get_ideas_by_ids(self, idea_ids: Sequence[UUID], user: User) -> IdeaBatchResponse:
+        """아이디어 일괄 조회 (찾지 못한 ID는 errors에 표시)"""
+        idea_ids = batch_ids(idea_ids)
+        ideas = {str(idea.id): self._to_response(idea) for idea in self.repository.get_ideas_by_ids(idea_ids, user.id)}
+        
+        return IdeaBatchResponse(ideas=ideas, errors=not_found(idea_ids, ideas, "idea"))
+    
+    def get_idea_version(self, idea_id: UUID, user: User) -> ResourceVersion:
+        """아이디어 조건부 조회용 버전 (본문 컬럼은 읽지 않음)"""
+        row = self.repository.get_idea_version(idea_id, user.id)
+        
+        return make_version("idea", row.id, row.status.value, row.updated_at, last_modified=row.updated_at)
+    
+    def get_ideas(
+        self,
+        user: User,
+        page: int = 1,
+        page_size: int = 20,
+        fields: Optional[Sequence[str]] = None
+    ) -> Tuple[List[Union[IdeaResponse, Dict[str, Any]]], int]:
+        """사용자의 아이디어 목록 조회 (페이지 번호 방식, fields 지정 시 해당 컬럼만 조회)"""
+        query = self._ideas_query(user, fields)
         
         total = query.count()
         ideas = query.offset((page - 1) * page_size).limit(page_size).all()
         
-        return [self._to_response(idea) for idea in ideas], total
+        return [self._present(idea, fields) for idea in ideas], total
+    
+    def get_ideas_by_cursor(
+        self,
+        user: User,
+        cursor: Optional[str] = None,
+        page_size: int = 20,
+        include_total: bool = False,
+        fields: Optional[Sequence[str]] = None
+    ) -> Tuple[List[Union[IdeaResponse, Dict[str, Any]]], Optional[int], Optional[str]]:
+        """
+        사용자의 아이디어 목록 조회 (커서 방식, fields 지정 시 해당 컬럼만 조회)
+        (created_at, id) 기준으로 다음 페이지 위치를 바로 탐색하므로
+        페이지가 뒤로 갈수록 느려지지 않는다.
+        """
+        # 다음 페이지 커서를 만들기 위해 created_at은 항상 로드
+        query = self._ideas_query(user, fields, extra_columns=(Idea.created_at,))
+        
+        total = query.count() if include_total else None
+        
+        if cursor:
+            created_at, idea_id = self.decode_cursor(cursor)
+            query = query.filter(or_(
+                Idea.created_at < created_at,
+                and_(Idea.created_at == created_at, Idea.id < idea_id)
+            ))
+        
+        # 다음 페이지 존재 여부 확인을 위해 1건 더 조회
+        ideas = query.limit(page_size + 1).all()
+        
+        next_cursor = None
+        if len(ideas) > page_size:
+            ideas = ideas[:page_size]
+            next_cursor = self.encode_cursor(ideas[-1])
+        
+        return [self._present(idea, fields) for idea in ideas], total, next_cursor
     
     def update_idea(self, idea_id: UUID, request: UpdateIdeaRequest, user: User) -> IdeaResponse:
         """아이디어 수정"""
-        idea = self._get_idea_or_404(idea_id)
-        self._check_ownership(idea, user)
+        idea = self.repository.get_idea(idea_id, user.id)
         
         # 분석이 진행 중이면 수정 불가
         if idea.status not in [ModelIdeaStatus.CREATED, ModelIdeaStatus.FAILED]:
@@ -119,29 +236,25 @@ class IdeaService:
     
     def delete_idea(self, idea_id: UUID, user: User) -> None:
         """아이디어 삭제 (Soft Delete)"""
-        idea = self._get_idea_or_404(idea_id)
-        self._check_ownership(idea, user)
+        idea = self.repository.get_idea(idea_id, user.id)
         
         idea.deleted_at = datetime.utcnow()
         self.db.commit()
     
     def start_collection(self, idea_id: UUID, user: User) -> CollectDataResponse:
         """데이터 수집 시작"""
-        idea = self._get_idea_or_404(idea_id)
-        self._check_ownership(idea, user)
+        idea = self.repository.get_idea(idea_id, user.id)
         
         # 상태 확인
         if idea.status not in [ModelIdeaStatus.CREATED, ModelIdeaStatus.FAILED]:
             raise ValidationException(f"현재 상태({idea.status.value})에서는 데이터 수집을 시작할 수 없습니다.")
         
-        # 상태 업데이트
+        # 상태 업데이트 + 수집 작업 등록 (같은 트랜잭션)
         idea.status = ModelIdeaStatus.COLLECTING
         idea.updated_at = datetime.utcnow()
+        JobQueue(self.db).enqueue(JobKind.COLLECT_DATA.value, idea.id)
         self.db.commit()
         
-        # TODO: 실제로는 여기서 비동기 태스크 큐에 작업 추가
-        # celery_app.send_task('collect_data', args=[str(idea.id)])
-        
         return CollectDataResponse(
             idea_id=str(idea.id),
             status="collecting",
@@ -149,59 +262,170 @@ class IdeaService:
         )
     
     def get_collection_status(self, idea_id: UUID, user: User) -> CollectStatusResponse:
-        """데이터 수집 상태 조회"""
-        idea = self._get_idea_or_404(idea_id)
-        self._check_ownership(idea, user)
+        """데이터 수집 상태 조회 (수집 작업의 태스크별 진행 상황 기준)"""
+        idea = self.repository.get_idea(idea_id, user.id)
         
-        # TODO: 실제로는 태스크 큐에서 진행 상황 조회
-        # 여기서는 시뮬레이션
+        job = JobQueue(self.db).get_latest(idea.id, JobKind.COLLECT_DATA.value)
+        progress = (job.progress if job else None) or {}
+        completed_tasks = progress.get("completed_tasks", [])
+        failed_tasks = progress.get("failed_tasks", [])
+        pending_tasks = [
+            task for task in self.COLLECT_TASKS
+            if task not in completed_tasks and task not in failed_tasks
+        ]
         
         if idea.status == ModelIdeaStatus.COLLECTED:
-            return CollectStatusResponse(
-                idea_id=str(idea.id),
-                status="completed",
-                progress=100,
-                completed_tasks=self.COLLECT_TASKS,
-                pending_tasks=[],
-                failed_tasks=[]
-            )
-        elif idea.status == ModelIdeaStatus.COLLECTING:
-            # 시뮬레이션: 진행 중
-            return CollectStatusResponse(
-                idea_id=str(idea.id),
-                status="collecting",
-                progress=50,
-                completed_tasks=self.COLLECT_TASKS[:3],
-                pending_tasks=self.COLLECT_TASKS[3:],
-                failed_tasks=[]
-            )
+            status = "completed"
         else:
-            return CollectStatusResponse(
-                idea_id=str(idea.id),
-                status=idea.status.value,
-                progress=0,
-                completed_tasks=[],
-                pending_tasks=self.COLLECT_TASKS,
-                failed_tasks=[]
-            )
+            status = idea.status.value
+        
+        done = len(completed_tasks) + len(failed_tasks)
+        return CollectStatusResponse(
+            idea_id=str(idea.id),
+            status=status,
+            progress=int(done * 100 / len(self.COLLECT_TASKS)),
+            completed_tasks=completed_tasks,
+            pending_tasks=pending_tasks,
+            failed_tasks=failed_tasks
+        )
+    
+    def get_status_snapshot(self, idea_id: UUID, user: User) -> List[Dict[str, Any]]:
+        """
+        현재 상태를 상태 이벤트 형식으로 반환
+        상태 스트림 연결 직후 전송해 구독 전에 일어난 변경을 놓치지 않게 한다.
+        """
+        row = self.repository.get_status_row(idea_id, user.id)
+        
+        snapshot = [status_event("idea.status", row.idea_id, row.idea_id, row.idea_status)]
+        
+        if row.analysis_id:
+            snapshot.append(status_event("analysis.status", row.idea_id, row.analysis_id, row.analysis_status))
+        
+        if row.report_id:
+            snapshot.append(status_event(
+                "report.status", row.idea_id, row.report_id, row.report_status,
+                report_type=row.report_type.value
+            ))
+        
+        return snapshot
+    
+    def collect_data(self, idea_id: UUID, on_progress=None, collector: Optional[DataCollector] = None) -> None:
+        """
+        데이터 수집 실행 (백그라운드 작업에서 호출)
+        모든 소스를 동시에 수집하며, 소스가 끝날 때마다 collected_data를 저장하고
+        on_progress(progress)를 호출한다. 재시도 시에는 이미 수집된 소스를 건너뛴다.
+        일부 소스가 실패하면 CollectionIncompleteError를 발생시켜 작업 재시도를 유도한다.
+        """
+        idea = self._get_idea_or_404(idea_id)
+        collector = collector or DataCollector(
+            DEFAULT_SOURCES,
+            source_timeout=settings.COLLECT_SOURCE_TIMEOUT_SECONDS,
+            total_timeout=settings.COLLECT_TOTAL_TIMEOUT_SECONDS
+        )
+        
+        collected = dict(idea.collected_data or {})
+        completed_tasks = [task for task in self.COLLECT_TASKS if task in collected]
+        failed_tasks: List[str] = []
+        errors = {}
+        
+        def report_progress() -> None:
+            if on_progress:
+                on_progress({
+                    "completed_tasks": list(completed_tasks),
+                    "failed_tasks": list(failed_tasks),
+                    "errors": dict(errors)
+                })
+            self.db.commit()
+        
+        def on_result(result: SourceResult) -> None:
+            if result.ok:
+                collected[result.name] = result.data
+                completed_tasks.append(result.name)
+                idea.collected_data = dict(collected)
+            else:
+                failed_tasks.append(result.name)
+                errors[result.name] = result.error
+            report_progress()
+        
+        report_progress()
+        
+        context = {
+            "title": idea.title,
+            "description": idea.description,
+            "industry": idea.industry,
+            "target_customer": idea.target_customer
+        }
+        remaining = [task for task in self.COLLECT_TASKS if task not in completed_tasks]
+        asyncio.run(collector.collect(context, on_result, only=remaining))
+        
+        if failed_tasks:
+            raise CollectionIncompleteError(failed_tasks)
+        
+        idea.status = ModelIdeaStatus.COLLECTED
+        idea.updated_at = datetime.utcnow()
+        self.db.commit()
+    
+    def fail_collection(self, idea_id: UUID) -> None:
+        """
+        데이터 수집 최종 실패 처리
+        일부라도 수집되었다면 수집 완료(부분)로, 아니면 실패로 처리한다.
+        """
+        idea = self.db.query(Idea).filter(Idea.id == idea_id).options(undefer(Idea.collected_data)).first()
+        if idea and idea.status == ModelIdeaStatus.COLLECTING:
+            idea.status = ModelIdeaStatus.COLLECTED if idea.collected_data else ModelIdeaStatus.FAILED
+            idea.updated_at = datetime.utcnow()
+            self.db.commit()
+    
+    @staticmethod
+    def encode_cursor(idea: Idea) -> str:
+        """(created_at, id)를 불투명한 커서 문자열로 인코딩"""
+        raw = f"{idea.created_at.isoformat()}|{idea.id}"
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+    
+    @staticmethod
+    def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+        """커서 문자열을 (created_at, id)로 디코딩"""
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            created_at, idea_id = base64.urlsafe_b64decode(padded.encode()).decode().split("|")
+            return datetime.fromisoformat(created_at), UUID(idea_id)
+        except (ValueError, UnicodeDecodeError):
+            raise ValidationException("유효하지 않은 커서입니다.", {"cursor": cursor})
+    
+    def _ideas_query(self, user: User, fields: Optional[Sequence[str]] = None, extra_columns: tuple = ()):
+        """사용자의 아이디어 목록 기본 쿼리 (최신순, fields 지정 시 해당 컬럼만 로드)"""
+        query = self.db.query(Idea).filter(
+            Idea.user_id == user.id,
+            Idea.deleted_at.is_(None)
+        ).order_by(Idea.created_at.desc(), Idea.id.desc())
+        if fields:
+            query = query.options(load_only(*self._columns(fields), *extra_columns))
+        return query
+    
+    @staticmethod
+    def _columns(fields: Sequence[str]) -> list:
+        """응답 필드 → 조회 컬럼 (IdeaResponse 필드는 모두 같은 이름의 컬럼)"""
+        return [getattr(Idea, field) for field in fields]
+    
+    def _present(self, idea: Idea, fields: Optional[Sequence[str]]) -> Union[IdeaResponse, Dict[str, Any]]:
+        return self._to_fields(idea, fields) if fields else self._to_response(idea)
+    
+    def _to_fields(self, idea: Idea, fields: Sequence[str]) -> Dict[str, Any]:
+        """선택 필드만 담은 응답 (로드한 컬럼만 읽음)"""
+        return {field: to_json_value(getattr(idea, field)) for field in fields}
     
     def _get_idea_or_404(self, idea_id: UUID) -> Idea:
-        """아이디어 조회 또는 404"""
+        """아이디어 조회 또는 404 (수집 작업용 collected_data 포함)"""
         idea = self.db.query(Idea).filter(
             Idea.id == idea_id,
             Idea.deleted_at.is_(None)
-        ).first()
+        ).options(undefer(Idea.collected_data)).first()
         
         if not idea:
             raise NotFoundException("아이디어를 찾을 수 없습니다.", "idea")
         
         return idea
     
-    def _check_ownership(self, idea: Idea, user: User) -> None:
-        """소유권 확인"""
-        if idea.user_id != user.id:
-            raise ForbiddenException("해당 아이디어에 대한 접근 권한이 없습니다.")
-    
     def _to_response(self, idea: Idea) -> IdeaResponse:
         """Idea 모델을 응답 스키마로 변환"""
         return IdeaResponse(
@@ -225,3 +449,13 @@ class IdeaService:
 def get_idea_service(db: Session) -> IdeaService:
     """IdeaService 인스턴스 생성"""
     return IdeaService(db)
+
+
+class AsyncIdeaService(AsyncServiceAdapter):
+    """IdeaService의 비동기 변형"""
+    service_class = IdeaService
+
+
+def get_async_idea_service(db: DBSession) -> AsyncIdeaService:
+    """AsyncIdeaService 인스턴스 생성"""
+    return AsyncIdeaService(db)
@@ -2,20 +2,37 @@
 Report Service
 보고서 관련 비즈니스 로직
 """
-from sqlalchemy.orm import Session
-from typing import List, Optional, Tuple
+from sqlalchemy.orm import Session, undefer_group
+import pydantic_core
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 from uuid import UUID
-from datetime import datetime
+from datetime import datetime, timedelta
+import hashlib
+import json
 
+from src.db.session import DBSession
 from src.models.idea_model import Idea, IdeaStatus as ModelIdeaStatus
 from src.models.analysis_model import Analysis, AnalysisStatus
 from src.models.report_model import Report, ReportStatus as ModelReportStatus, ReportType as ModelReportType
 from src.models.user_model import User
-from src.core.exceptions import NotFoundException, ForbiddenException, ValidationException
+from src.models.job_model import JobKind
+from src.jobs.queue import JobQueue
+from src.repositories import IdeaRepository
+from src.services.async_adapter import AsyncServiceAdapter
+from src.services.batch_get import batch_ids, not_found
+from src.core.metrics import metrics
+from src.core.config import settings
+from src.core.conditional import ResourceVersion, make_version
+from src.core.compression import compress
+from src.core.fieldsets import to_json_value
+from src.core.responses import FastJSONResponse
+from src.core.exceptions import ConflictException, NotFoundException, ValidationException
 from src.api.v1.schemas import (
     CreateReportRequest,
     ReportGenerateResponse,
     ReportResponse,
+    ReportSummaryResponse,
+    ReportBatchResponse,
     ActionItem,
     SWOTSection,
     MarketAnalysisSection,
@@ -29,33 +46,168 @@ from src.api.v1.schemas import (
 class ReportService:
     """보고서 서비스"""
     
+    # 보고서 템플릿(섹션 구성/문구)이 바뀌면 올려서 기존 보고서 재사용을 막는다
+    TEMPLATE_VERSION = 1
+    
+    # 섹션 → 보고서 컬럼
+    SECTIONS = {
+        "summary": ("executive_summary", "recommendation"),
+        "swot": ("swot",),
+        "market_analysis": ("market_analysis",),
+        "competition_analysis": ("competition_analysis",),
+        "financial_analysis": ("financial_analysis",),
+        "risk_assessment": ("risk_assessment",),
+        "action_items": ("action_items",),
+        "key_insights": ("key_insights",)
+    }
+    
+    # 응답 섹션 → 스키마 (완료된 보고서에서만 응답에 포함)
+    SECTION_SCHEMAS = {
+        "swot": SWOTSection,
+        "market_analysis": MarketAnalysisSection,
+        "competition_analysis": CompetitionAnalysisSection,
+        "financial_analysis": FinancialAnalysisSection,
+        "risk_assessment": RiskAssessmentSection,
+        "action_items": ActionItem
+    }
+    
     def __init__(self, db: Session):
         self.db = db
+        self.repository = IdeaRepository(db)
     
     def create_report(self, idea_id: UUID, user: User, request: CreateReportRequest = None) -> ReportGenerateResponse:
-        """보고서 생성"""
-        idea = self._get_idea_or_404(idea_id)
-        self._check_ownership(idea, user)
-        
-        # 분석이 완료되어야 보고서 생성 가능
-        analysis = self.db.query(Analysis).filter(
-            Analysis.idea_id == idea_id,
-            Analysis.status == AnalysisStatus.COMPLETED
-        ).first()
-        
-        if not analysis:
-            raise ValidationException("분석이 완료되어야 보고서를 생성할 수 있습니다.")
+        """
+        보고서 생성 시작 (내용은 작업 큐의 워커가 생성)
+        분석과 보고서 유형이 마지막으로 완료된 보고서와 같으면 그 보고서를 그대로 반환하고(cached),
+        이미 보고서를 생성 중이면(중복 클릭, 재시도) 새로 만들지 않고 생성 중인 보고서와 작업을 반환한다.
+        """
+        idea, analysis = self.repository.get_idea_with_analysis(
+            idea_id, user.id, completed_only=True, with_analysis_details=True
+        )
         
         # 보고서 타입 결정
         report_type = ModelReportType.BASIC
         if request and request.report_type:
             report_type = ModelReportType(request.report_type.value)
         
+        report, status = self._create_and_generate(idea, analysis, report_type, background=True)
+        
+        job = None
+        if report.status == ModelReportStatus.GENERATING:
+            job = JobQueue(self.db).get_latest(idea.id, JobKind.GENERATE_REPORT.value)
+        
+        return ReportGenerateResponse(
+            report_id=str(report.id),
+            idea_id=str(idea_id),
+            status=status,
+            job_id=str(job.id) if job else None
+        )
+    
+    def generate_now(
+        self,
+        idea_id: UUID,
+        user_id: UUID,
+        report_type: ModelReportType = ModelReportType.BASIC
+    ) -> Report:
+        """보고서를 바로 생성 (일괄 작업 워커에서 호출, user_id는 일괄 작업 소유자)"""
+        idea, analysis = self.repository.get_idea_with_analysis(
+            idea_id, user_id, completed_only=True, with_analysis_details=True
+        )
+        return self._create_and_generate(idea, analysis, report_type, background=False)[0]
+    
+    def run_report(self, report_id: UUID) -> None:
+        """보고서 내용 생성 (백그라운드 작업에서 호출, 이미 끝난 보고서는 건너뜀)"""
+        report = self.db.query(Report).filter(Report.id == report_id).first()
+        if not report:
+            raise NotFoundException("보고서를 찾을 수 없습니다.", "report")
+        if report.status != ModelReportStatus.GENERATING:
+            return
+        
+        idea = self.db.query(Idea).filter(Idea.id == report.idea_id).first()
+        analysis = (
+            self.db.query(Analysis)
+            .filter(Analysis.idea_id == report.idea_id, Analysis.status == AnalysisStatus.COMPLETED)
+            .options(undefer_group("details"))
+            .first()
+        )
+        if not analysis:
+            raise NotFoundException("분석 결과를 찾을 수 없습니다.", "analysis")
+        
+        previous = self._get_latest_completed(report.idea_id, report.report_type)
+        self._generate_report(report, analysis, idea, previous)
+    
+    def fail_report(self, report_id: UUID) -> None:
+        """보고서 생성 최종 실패 처리 (분석 결과는 그대로이므로 아이디어는 분석 완료 상태로 되돌림)"""
+        report = self.db.query(Report).filter(Report.id == report_id).first()
+        if not report:
+            return
+        if report.status == ModelReportStatus.GENERATING:
+            report.status = ModelReportStatus.FAILED
+        
+        idea = self.db.query(Idea).filter(Idea.id == report.idea_id).first()
+        if idea and idea.status == ModelIdeaStatus.REPORT_GENERATING:
+            idea.status = ModelIdeaStatus.ANALYZED
+            idea.updated_at = datetime.utcnow()
+        
+        self.db.commit()
+    
+    @classmethod
+    def report_key(cls, analysis: Analysis, report_type: ModelReportType) -> str:
+        """보고서 입력 키: (분석 버전, 보고서 유형, 템플릿 버전)"""
+        analysis_version = f"{analysis.id}:{analysis.completed_at.isoformat() if analysis.completed_at else ''}"
+        return _digest({
+            "analysis": analysis_version,
+            "report_type": report_type.value,
+            "template": cls.TEMPLATE_VERSION
+        })
+    
+    def _create_and_generate(
+        self,
+        idea: Idea,
+        analysis: Optional[Analysis],
+        report_type: ModelReportType,
+        background: bool
+    ) -> Tuple[Report, str]:
+        """
+        보고서 레코드 생성 후 내용 생성, (보고서, 응답 상태) 반환
+        - cached: 입력이 같은 완료된 보고서 재사용
+        - generating: 새 보고서 생성 (입력이 바뀌지 않은 섹션은 이전 보고서에서 복사)
+        - 이미 생성 중이면 그 보고서와 상태
+        background=True면 내용 생성을 작업 큐에 등록하고, False면 바로 생성한다.
+        """
+        # 분석이 완료되어야 보고서 생성 가능
+        if not analysis:
+            raise ValidationException("분석이 완료되어야 보고서를 생성할 수 있습니다.")
+        
+        key = self.report_key(analysis, report_type)
+        previous = self._get_latest_completed(idea.id, report_type)
+        if previous is not None and previous.input_key == key:
+            metrics.inc("report.cache.hits")
+            if idea.status not in (ModelIdeaStatus.COMPLETED, ModelIdeaStatus.REPORT_GENERATING):
+                idea.status = ModelIdeaStatus.COMPLETED
+                idea.updated_at = datetime.utcnow()
+                self.db.commit()
+            return previous, "cached"
+        
+        # 동시에 들어온 생성 요청 중 하나만 진행 (생성이 오래 멈춰 있으면 새로 생성)
+        if idea.status == ModelIdeaStatus.REPORT_GENERATING:
+            running = self._get_running_report(idea.id)
+            if running is not None:
+                metrics.inc("report.deduplicated")
+                return running, "generating"
+        if not self.repository.claim_status(idea, ModelIdeaStatus.REPORT_GENERATING):
+            self.db.rollback()
+            report = self._attach_to_running(idea.id, report_type)
+            return report, "generating" if report.status == ModelReportStatus.GENERATING else report.status.value
+        
+        metrics.inc("report.cache.misses")
+        
         # 보고서 생성
         report = Report(
-            idea_id=idea_id,
+            idea_id=idea.id,
             status=ModelReportStatus.GENERATING,
-            report_type=report_type
+            report_type=report_type,
+            input_key=key
         )
         
         self.db.add(report)
@@ -64,39 +216,168 @@ class ReportService:
         idea.status = ModelIdeaStatus.REPORT_GENERATING
         idea.updated_at = datetime.utcnow()
         
+        if background:
+            # 보고서 레코드와 생성 작업을 같은 트랜잭션에 등록
+            self.db.flush()
+            JobQueue(self.db).enqueue(JobKind.GENERATE_REPORT.value, idea.id, payload={"report_id": str(report.id)})
+            self.db.commit()
+            return report, "generating"
+        
         self.db.commit()
         self.db.refresh(report)
         
-        # 개발용: 즉시 보고서 생성 시뮬레이션
-        self._generate_report(report, analysis, idea)
+        self._generate_report(report, analysis, idea, previous)
         
-        return ReportGenerateResponse(
-            report_id=str(report.id),
-            idea_id=str(idea_id),
-            status="generating"
+        return report, "generating"
+    
+    def _get_latest_completed(self, idea_id: UUID, report_type: ModelReportType) -> Optional[Report]:
+        """같은 유형의 가장 최근 완료된 보고서 (섹션 재사용을 위해 섹션 포함)"""
+        return (
+            self.db.query(Report)
+            .filter(
+                Report.idea_id == idea_id,
+                Report.report_type == report_type,
+                Report.status == ModelReportStatus.COMPLETED
+            )
+            .options(undefer_group("sections"))
+            .order_by(Report.created_at.desc())
+            .first()
         )
     
-    def get_report(self, report_id: UUID, user: User) -> ReportResponse:
-        """보고서 조회"""
-        report = self._get_report_or_404(report_id)
-        idea = self._get_idea_or_404(report.idea_id)
-        self._check_ownership(idea, user)
+    def _get_running_report(self, idea_id: UUID) -> Optional[Report]:
+        """생성 중인 보고서 (JOB_LOCK_TIMEOUT_SECONDS 이상 멈춰 있으면 없는 것으로 본다)"""
+        return (
+            self.db.query(Report)
+            .filter(
+                Report.idea_id == idea_id,
+                Report.status == ModelReportStatus.GENERATING,
+                Report.created_at >= datetime.utcnow() - timedelta(seconds=settings.JOB_LOCK_TIMEOUT_SECONDS)
+            )
+            .order_by(Report.created_at.desc())
+            .first()
+        )
+    
+    def _attach_to_running(self, idea_id: UUID, report_type: ModelReportType) -> Report:
+        """다른 요청이 먼저 생성을 시작한 경우: 생성 중인 보고서, 이미 끝났으면 같은 유형의 최신 보고서"""
+        metrics.inc("report.deduplicated")
+        report = self._get_running_report(idea_id) or (
+            self.db.query(Report)
+            .filter(Report.idea_id == idea_id, Report.report_type == report_type)
+            .order_by(Report.created_at.desc())
+            .first()
+        )
+        if report is None:
+            raise ConflictException("보고서를 생성하는 중입니다. 잠시 후 다시 시도해주세요.")
+        return report
+    
+    def get_report(
+        self,
+        report_id: UUID,
+        user: User,
+        fields: Optional[Sequence[str]] = None
+    ) -> Union[ReportResponse, Dict[str, Any]]:
+        """보고서 조회 (fields 지정 시 해당 컬럼만 조회해 dict로 반환)"""
+        if fields:
+            # 섹션 포함 여부를 status로 정하므로 status는 항상 로드
+            report = self.repository.get_report(report_id, user.id, columns=self._columns(fields, Report.status))
+            return self._to_fields(report, fields)
+        
+        report = self.repository.get_report(report_id, user.id)
         
         return self._to_response(report)
     
-    def get_reports_by_idea(self, idea_id: UUID, user: User) -> Tuple[List[ReportResponse], int]:
-        """아이디어의 보고서 목록 조회"""
-        idea = self._get_idea_or_404(idea_id)
-        self._check_ownership(idea, user)
+    def get_reports_by_ids(self, report_ids: Sequence[UUID], user: User) -> ReportBatchResponse:
+        """보고서 일괄 조회 (찾지 못한 ID는 errors에 표시)"""
+        report_ids = batch_ids(report_ids)
+        reports = {str(report.id): self._to_response(report) for report in self.repository.get_reports_by_ids(report_ids, user.id)}
+        
+        return ReportBatchResponse(reports=reports, errors=not_found(report_ids, reports, "report"))
+    
+    def get_report_version(self, report_id: UUID, user: User) -> ResourceVersion:
+        """보고서 조건부 조회용 버전 (섹션 컬럼은 읽지 않음)"""
+        row = self.repository.get_report_version(report_id, user.id)
         
-        reports = self.db.query(Report).filter(
-            Report.idea_id == idea_id
-        ).order_by(Report.created_at.desc()).all()
+        return make_version(
+            "report", row.id, row.status.value, row.updated_at, row.completed_at,
+            last_modified=row.updated_at or row.completed_at
+        )
+    
+    def get_report_gzip(self, report_id: UUID, user: User) -> Optional[bytes]:
+        """완료 시 저장한 gzip 응답 본문 (현재 APP_VERSION에서 만든 것만, 없으면 None)"""
+        return self.repository.get_report_body(report_id, user.id, settings.APP_VERSION)
+    
+    def get_reports_by_idea(
+        self,
+        idea_id: UUID,
+        user: User,
+        fields: Optional[Sequence[str]] = None
+    ) -> Tuple[List[Union[ReportSummaryResponse, Dict[str, Any]]], int]:
+        """
+        아이디어의 보고서 목록 조회 (요약, 섹션 본문은 get_report로 조회)
+        fields 지정 시 해당 컬럼만 조회해 dict로 반환
+        """
+        if fields:
+            reports = self.repository.get_reports(idea_id, user.id, columns=self._columns(fields))
+            return [self._to_fields(r, fields) for r in reports], len(reports)
         
-        return [self._to_response(r) for r in reports], len(reports)
+        reports = self.repository.get_reports(idea_id, user.id)
+        
+        return [self._to_summary(r) for r in reports], len(reports)
     
-    def _generate_report(self, report: Report, analysis: Analysis, idea: Idea) -> None:
-        """보고서 생성 시뮬레이션"""
+    def _generate_report(self, report: Report, analysis: Analysis, idea: Idea, previous: Optional[Report] = None) -> None:
+        """
+        보고서 생성 시뮬레이션
+        섹션별 입력 지문이 이전 보고서와 같은 섹션은 다시 만들지 않고 복사한다.
+        """
+        section_hashes = {}
+        for section, columns in self.SECTIONS.items():
+            section_hash = self._section_hash(section, report.report_type, analysis, idea)
+            section_hashes[section] = section_hash
+            
+            if previous is not None and (previous.section_hashes or {}).get(section) == section_hash:
+                values = {column: getattr(previous, column) for column in columns}
+                metrics.inc("report.sections.reused")
+            else:
+                values = getattr(self, f"_build_{section}")(analysis, idea)
+                metrics.inc("report.sections.generated")
+            
+            for column, value in values.items():
+                setattr(report, column, value)
+        
+        report.section_hashes = section_hashes
+        report.status = ModelReportStatus.COMPLETED
+        report.completed_at = datetime.utcnow()
+        if settings.REPORT_PRECOMPRESS:
+            self._precompress(report)
+        
+        idea.status = ModelIdeaStatus.COMPLETED
+        idea.updated_at = datetime.utcnow()
+        
+        self.db.commit()
+    
+    def _precompress(self, report: Report) -> None:
+        """완료된 보고서는 바뀌지 않으므로 응답 본문을 미리 gzip으로 저장 (조회 시 직렬화/압축 생략)"""
+        body = FastJSONResponse(self._to_response(report)).body
+        report.body_gzip = compress(body, "gzip", 9)
+        report.body_version = settings.APP_VERSION
+        metrics.inc("report.precompressed.bytes", len(report.body_gzip))
+    
+    def _section_hash(self, section: str, report_type: ModelReportType, analysis: Analysis, idea: Idea) -> str:
+        """섹션 입력 지문 (입력이 없는 섹션은 템플릿 버전과 보고서 유형만 반영)"""
+        inputs = {
+            "summary": lambda: {"title": idea.title, "overall_score": analysis.overall_score},
+            "swot": lambda: analysis.swot_analysis,
+            "market_analysis": lambda: analysis.market_analysis,
+        }.get(section, lambda: None)()
+        return _digest({
+            "section": section,
+            "inputs": inputs,
+            "report_type": report_type.value,
+            "template": self.TEMPLATE_VERSION
+        })
+    
+    def _build_summary(self, analysis: Analysis, idea: Idea) -> Dict[str, Any]:
+        """요약 및 추천"""
         recommendation = "Go"
         if analysis.overall_score:
             if analysis.overall_score >= 70:
@@ -106,7 +387,7 @@ class ReportService:
             else:
                 recommendation = "No-Go"
         
-        report.executive_summary = f"""본 사업 아이디어 "{idea.title}"에 대한 타당성 분석 결과를 요약합니다.
+        executive_summary = f"""본 사업 아이디어 "{idea.title}"에 대한 타당성 분석 결과를 요약합니다.
 
 종합 평가 점수는 {analysis.overall_score}점으로, {"사업 추진을 권장합니다." if recommendation == "Go" else "신중한 검토가 필요합니다."}
 
@@ -114,25 +395,31 @@ class ReportService:
 
 다만, 초기 투자 비용과 경쟁 심화에 대한 리스크 관리가 필요하며, 고객 획득 전략에 대한 구체적인 실행 계획 수립을 권장합니다."""
         
-        report.recommendation = recommendation
-        
-        report.swot = analysis.swot_analysis or {
+        return {"executive_summary": executive_summary, "recommendation": recommendation}
+    
+    def _build_swot(self, analysis: Analysis, idea: Idea) -> Dict[str, Any]:
+        """SWOT"""
+        return {"swot": analysis.swot_analysis or {
             "strengths": ["AI 기술 기반 차별화", "명확한 타겟 시장", "확장 가능한 모델"],
             "weaknesses": ["초기 자본 필요", "기술 의존도", "신뢰 구축 시간"],
             "opportunities": ["시장 성장", "디지털 전환", "B2B 확장"],
             "threats": ["대기업 진입", "규제 변화", "기술 변화"]
-        }
-        
-        report.market_analysis = {
+        }}
+    
+    def _build_market_analysis(self, analysis: Analysis, idea: Idea) -> Dict[str, Any]:
+        """시장 분석"""
+        return {"market_analysis": {
             "tam": analysis.market_analysis.get("tam", "₩15조") if analysis.market_analysis else "₩15조",
             "sam": analysis.market_analysis.get("sam", "₩2.5조") if analysis.market_analysis else "₩2.5조",
             "som": analysis.market_analysis.get("som", "₩500억") if analysis.market_analysis else "₩500억",
             "cagr": analysis.market_analysis.get("cagr", "12.5%") if analysis.market_analysis else "12.5%",
             "market_trends": ["AI 기반 서비스 수요 증가", "디지털 전환 가속화", "스타트업 생태계 활성화"],
             "target_segments": ["예비 창업자", "스타트업 초기 팀", "기업 신사업 담당자"]
-        }
-        
-        report.competition_analysis = {
+        }}
+    
+    def _build_competition_analysis(self, analysis: Analysis, idea: Idea) -> Dict[str, Any]:
+        """경쟁 분석"""
+        return {"competition_analysis": {
             "direct_competitors": [
                 {"name": "경쟁사 A", "strength": "브랜드 인지도", "weakness": "높은 가격"},
                 {"name": "경쟁사 B", "strength": "기술력", "weakness": "낮은 사용성"}
@@ -143,9 +430,11 @@ class ReportService:
             ],
             "competitive_advantages": ["사업 분석 특화 AI", "자동화된 보고서 생성", "합리적인 가격"],
             "market_position": "도전자"
-        }
-        
-        report.financial_analysis = {
+        }}
+    
+    def _build_financial_analysis(self, analysis: Analysis, idea: Idea) -> Dict[str, Any]:
+        """재무 분석"""
+        return {"financial_analysis": {
             "initial_investment": "₩5,000만원",
             "monthly_costs": "₩1,500만원",
             "break_even_period": "18개월",
@@ -155,9 +444,11 @@ class ReportService:
                 {"year": 3, "revenue": "₩20억", "profit": "₩5억"}
             ],
             "profitability_index": 1.8
-        }
-        
-        report.risk_assessment = {
+        }}
+    
+    def _build_risk_assessment(self, analysis: Analysis, idea: Idea) -> Dict[str, Any]:
+        """리스크 평가"""
+        return {"risk_assessment": {
             "high_risks": [{"risk": "기술 변화 속도", "impact": "서비스 경쟁력 저하", "mitigation": "지속적 R&D 투자"}],
             "medium_risks": [
                 {"risk": "경쟁 심화", "impact": "시장 점유율 하락", "mitigation": "차별화 전략"},
@@ -165,53 +456,65 @@ class ReportService:
             ],
             "low_risks": [{"risk": "인력 이탈", "impact": "개발 지연", "mitigation": "핵심 인력 관리"}],
             "mitigation_strategies": ["지속적인 기술 혁신", "고객 피드백 기반 개선", "전략적 파트너십 구축"]
-        }
-        
-        report.action_items = [
+        }}
+    
+    def _build_action_items(self, analysis: Analysis, idea: Idea) -> Dict[str, Any]:
+        """실행 항목"""
+        return {"action_items": [
             {"title": "MVP 개발", "description": "핵심 기능 중심의 최소 기능 제품 개발", "timeline": "1-3개월", "priority": "high"},
             {"title": "베타 테스트", "description": "초기 사용자 피드백 수집 및 제품 개선", "timeline": "3-6개월", "priority": "high"},
             {"title": "시장 진입", "description": "마케팅 캠페인 및 본격 서비스 런칭", "timeline": "6-9개월", "priority": "medium"}
-        ]
-        
-        report.key_insights = [
+        ]}
+    
+    def _build_key_insights(self, analysis: Analysis, idea: Idea) -> Dict[str, Any]:
+        """핵심 인사이트"""
+        return {"key_insights": [
             "타겟 시장의 디지털 전환이 가속화되고 있어 진입 시점이 적절합니다.",
             "AI 기반 서비스에 대한 소비자 수용도가 빠르게 증가하고 있습니다.",
             "구독 모델은 안정적인 수익 창출에 유리한 구조입니다.",
             "초기 고객 확보를 위한 차별화된 마케팅 전략이 필요합니다."
-        ]
-        
-        report.status = ModelReportStatus.COMPLETED
-        report.completed_at = datetime.utcnow()
-        
-        idea.status = ModelIdeaStatus.COMPLETED
-        idea.updated_at = datetime.utcnow()
-        
-        self.db.commit()
+        ]}
     
-    def _get_idea_or_404(self, idea_id: UUID) -> Idea:
-        idea = self.db.query(Idea).filter(Idea.id == idea_id, Idea.deleted_at.is_(None)).first()
-        if not idea:
-            raise NotFoundException("아이디어를 찾을 수 없습니다.", "idea")
-        return idea
+    def _to_summary(self, report: Report) -> ReportSummaryResponse:
+        return ReportSummaryResponse(
+            report_id=str(report.id),
+            idea_id=str(report.idea_id),
+            status=report.status.value,
+            report_type=report.report_type.value,
+            recommendation=report.recommendation,
+            created_at=report.created_at.isoformat() if report.created_at else None,
+            completed_at=report.completed_at.isoformat() if report.completed_at else None
+        )
     
-    def _get_report_or_404(self, report_id: UUID) -> Report:
-        report = self.db.query(Report).filter(Report.id == report_id).first()
-        if not report:
-            raise NotFoundException("보고서를 찾을 수 없습니다.", "report")
-        return report
+    @staticmethod
+    def _columns(fields: Sequence[str], *extra: Any) -> list:
+        """응답 필드 → 조회 컬럼 (report_id만 이름이 다름)"""
+        return [Report.id if field == "report_id" else getattr(Report, field) for field in fields] + list(extra)
     
-    def _check_ownership(self, idea: Idea, user: User) -> None:
-        if idea.user_id != user.id:
-            raise ForbiddenException("해당 아이디어에 대한 접근 권한이 없습니다.")
+    def _section(self, report: Report, column: str) -> Any:
+        """섹션 응답 값 (완료되지 않았거나 비어 있으면 None)"""
+        value = getattr(report, column)
+        if not value or report.status != ModelReportStatus.COMPLETED:
+            return None
+        
+        schema = self.SECTION_SCHEMAS[column]
+        if column == "action_items":
+            return [schema(**item) for item in value]
+        return schema(**value)
+    
+    def _to_fields(self, report: Report, fields: Sequence[str]) -> Dict[str, Any]:
+        """선택 필드만 담은 응답 (로드한 컬럼만 읽음)"""
+        values = {}
+        for field in fields:
+            if field == "report_id":
+                values[field] = str(report.id)
+            elif field in self.SECTION_SCHEMAS:
+                values[field] = pydantic_core.to_jsonable_python(self._section(report, field))
+            else:
+                values[field] = to_json_value(getattr(report, field))
+        return values
     
     def _to_response(self, report: Report) -> ReportResponse:
-        swot = SWOTSection(**report.swot) if report.swot and report.status == ModelReportStatus.COMPLETED else None
-        market_analysis = MarketAnalysisSection(**report.market_analysis) if report.market_analysis and report.status == ModelReportStatus.COMPLETED else None
-        competition_analysis = CompetitionAnalysisSection(**report.competition_analysis) if report.competition_analysis and report.status == ModelReportStatus.COMPLETED else None
-        financial_analysis = FinancialAnalysisSection(**report.financial_analysis) if report.financial_analysis and report.status == ModelReportStatus.COMPLETED else None
-        risk_assessment = RiskAssessmentSection(**report.risk_assessment) if report.risk_assessment and report.status == ModelReportStatus.COMPLETED else None
-        action_items = [ActionItem(**item) for item in report.action_items] if report.action_items and report.status == ModelReportStatus.COMPLETED else None
-        
         return ReportResponse(
             report_id=str(report.id),
             idea_id=str(report.idea_id),
@@ -219,12 +522,12 @@ class ReportService:
             report_type=report.report_type.value,
             executive_summary=report.executive_summary,
             recommendation=report.recommendation,
-            swot=swot,
-            market_analysis=market_analysis,
-            competition_analysis=competition_analysis,
-            financial_analysis=financial_analysis,
-            risk_assessment=risk_assessment,
-            action_items=action_items,
+            swot=self._section(report, "swot"),
+            market_analysis=self._section(report, "market_analysis"),
+            competition_analysis=self._section(report, "competition_analysis"),
+            financial_analysis=self._section(report, "financial_analysis"),
+            risk_assessment=self._section(report, "risk_assessment"),
+            action_items=self._section(report, "action_items"),
             key_insights=report.key_insights,
             pdf_url=report.pdf_url,
             created_at=report.created_at.isoformat() if report.created_at else None,
@@ -232,5 +535,29 @@ class ReportService:
         )
 
 
+def _digest(content: Dict[str, Any]) -> str:
+    raw = json.dumps(content, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _cache_hit_rate() -> float:
+    hits = metrics.get("report.cache.hits")
+    total = hits + metrics.get("report.cache.misses")
+    return round(hits / total, 4) if total else 0.0
+
+
+metrics.register_gauge("report.cache.hit_rate", _cache_hit_rate)
+
+
 def get_report_service(db: Session) -> ReportService:
     return ReportService(db)
+
+
+class AsyncReportService(AsyncServiceAdapter):
+    """ReportService의 비동기 변형"""
+    service_class = ReportService
+
+
+def get_async_report_service(db: DBSession) -> AsyncReportService:
+    """AsyncReportService 인스턴스 생성"""
+    return AsyncReportService(db)
@@ -0,0 +1,273 @@
+"""
+Retention Service
+소프트 삭제된 아이디어(분석/보고서/작업 포함)의 영구 삭제 및 보관
+
+- RETENTION_DAYS가 지난 삭제 아이디어를 RETENTION_BATCH_SIZE개씩 짧은 트랜잭션으로 처리하고,
+  배치 사이에 RETENTION_BATCH_PAUSE_SECONDS만큼 쉬어 긴 잠금과 복제 지연을 피한다.
+- archive 모드에서는 삭제 전에 행을 gzip 압축 JSON Lines 파일(아이디어 1건당 1줄)에 추가한다.
+- 배치마다 처리 전 체크포인트를 남기므로 중단 후 재실행하면 중단된 배치부터 이어서 처리하며,
+  같은 아이디어가 보관 파일에 두 번 기록되거나 보관 없이 삭제되지 않는다.
+"""
+import enum
+import gzip
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+
+from src.core.config import settings
+from src.core.metrics import metrics
+from src.jobs.queue import JobQueue
+from src.models.analysis_model import Analysis
+from src.models.idea_model import Idea
+from src.models.job_model import Job, JobKind, JobStatus
+from src.models.report_model import Report
+
+logger = logging.getLogger(__name__)
+
+RETENTION_MODES = ("archive", "delete")
+
+CHECKPOINT_FILE = "retention.checkpoint.json"
+
+# 보관하지 않는 파생 컬럼 (섹션에서 다시 만들 수 있음)
+DERIVED_REPORT_COLUMNS = ("body_gzip", "body_version")
+
+
+@dataclass
+class RetentionResult:
+    """1회 실행 결과"""
+    batches: int = 0
+    archived: int = 0
+    deleted: int = 0
+    resumed: int = 0  # 체크포인트에서 이어서 삭제한 아이디어 수
+    finished: bool = False  # 대상이 남아 있지 않음
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, (UUID, Decimal)):
+        return str(value)
+    if isinstance(value, enum.Enum):
+        return value.value
+    raise TypeError(f"직렬화할 수 없는 값: {type(value).__name__}")
+
+
+class RetentionService:
+    """삭제 아이디어 보관/영구 삭제 서비스"""
+
+    def __init__(
+        self,
+        db: Session,
+        mode: Optional[str] = None,
+        archive_dir: Optional[str] = None,
+        batch_size: Optional[int] = None,
+        pause: Optional[float] = None
+    ):
+        self.db = db
+        self.mode = mode or settings.RETENTION_MODE
+        if self.mode not in RETENTION_MODES:
+            raise ValueError(f"RETENTION_MODE는 {', '.join(RETENTION_MODES)} 중 하나여야 합니다: {self.mode}")
+        self.archive_dir = Path(archive_dir or settings.RETENTION_ARCHIVE_DIR)
+        self.batch_size = batch_size or settings.RETENTION_BATCH_SIZE
+        self.pause = settings.RETENTION_BATCH_PAUSE_SECONDS if pause is None else pause
+        self.cutoff = datetime.utcnow() - timedelta(days=settings.RETENTION_DAYS)
+
+    def purge(self, max_batches: Optional[int] = None) -> RetentionResult:
+        """보관/삭제 대상이 없거나 max_batches에 도달할 때까지 배치 처리"""
+        max_batches = max_batches or settings.RETENTION_MAX_BATCHES
+        result = RetentionResult()
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+
+        checkpoint = self._load_checkpoint()
+        pending = checkpoint.get("pending")
+        if pending:
+            checkpoint = self._resume(checkpoint, pending, result)
+
+        while result.batches < max_batches:
+            idea_ids = self._next_batch()
+            if not idea_ids:
+                result.finished = True
+                break
+
+            checkpoint = self._process_batch(checkpoint, idea_ids, result)
+            if self.pause:
+                time.sleep(self.pause)
+
+        return result
+
+    def _process_batch(self, checkpoint: Dict[str, Any], idea_ids: List[UUID], result: RetentionResult) -> Dict[str, Any]:
+        """
+        배치 1개 처리: 체크포인트(pending) 기록 → 보관 파일 추가 → 삭제 → pending 해제
+        pending에는 보관 파일의 배치 이전 크기를 남겨 중단 시 되돌릴 수 있게 한다.
+        """
+        pending: Dict[str, Any] = {"ids": [str(idea_id) for idea_id in idea_ids]}
+        if self.mode == "archive":
+            path = self._archive_path()
+            pending.update(archive=path.name, offset=path.stat().st_size if path.exists() else 0)
+        checkpoint = self._save_checkpoint(checkpoint, pending=pending)
+
+        if self.mode == "archive":
+            self._archive(self.archive_dir / pending["archive"], idea_ids)
+            result.archived += len(idea_ids)
+            metrics.inc("retention.archived", len(idea_ids))
+
+        deleted = self._delete(idea_ids)
+        result.deleted += deleted
+        result.batches += 1
+        metrics.inc("retention.deleted", deleted)
+        return self._save_checkpoint(checkpoint, pending=None, deleted=deleted)
+
+    def _resume(self, checkpoint: Dict[str, Any], pending: Dict[str, Any], result: RetentionResult) -> Dict[str, Any]:
+        """
+        이전 실행이 배치 중간에 중단된 경우
+        - 아이디어가 이미 삭제됨: 보관 파일도 완료된 상태이므로 pending만 해제
+        - 아직 남아 있음: 보관 파일을 배치 이전 크기로 되돌리고 배치를 다시 처리
+        """
+        remaining = self._existing([UUID(idea_id) for idea_id in pending["ids"]])
+        if not remaining:
+            return self._save_checkpoint(checkpoint, pending=None)
+
+        archive = pending.get("archive")
+        if archive and (self.archive_dir / archive).exists():
+            with open(self.archive_dir / archive, "r+b") as raw:
+                raw.truncate(pending["offset"])
+
+        logger.info("retention: 중단된 배치 %s건 재처리", len(remaining))
+        result.resumed = len(remaining)
+        return self._process_batch(checkpoint, remaining, result)
+
+    def _next_batch(self) -> List[UUID]:
+        """보관 기간이 지난 삭제 아이디어 (오래된 순)"""
+        rows = self.db.execute(
+            select(Idea.id)
+            .where(Idea.deleted_at.is_not(None), Idea.deleted_at < self.cutoff)
+            .order_by(Idea.deleted_at, Idea.id)
+            .limit(self.batch_size)
+        ).scalars().all()
+        self.db.rollback()  # 조회 트랜잭션을 바로 종료 (스냅샷 유지 방지)
+        return list(rows)
+
+    def _existing(self, idea_ids: List[UUID]) -> List[UUID]:
+        rows = self.db.execute(select(Idea.id).where(Idea.id.in_(idea_ids))).scalars().all()
+        self.db.rollback()
+        return list(rows)
+
+    def _archive_path(self) -> Path:
+        """일자별 보관 파일"""
+        return self.archive_dir / f"ideas-{datetime.utcnow():%Y%m%d}.jsonl.gz"
+
+    def _archive(self, path: Path, idea_ids: List[UUID]) -> None:
+        """
+        아이디어와 분석/보고서를 보관 파일에 추가
+        배치마다 gzip 멤버를 덧붙이므로 파일 전체는 하나의 gzip 스트림으로 읽힌다.
+        """
+        ideas = self.db.execute(select(Idea.__table__).where(Idea.id.in_(idea_ids))).mappings().all()
+        analyses = {
+            row["idea_id"]: dict(row)
+            for row in self.db.execute(
+                select(Analysis.__table__).where(Analysis.idea_id.in_(idea_ids))
+            ).mappings()
+        }
+        reports: Dict[UUID, List[Dict[str, Any]]] = {}
+        for row in self.db.execute(
+            select(Report.__table__).where(Report.idea_id.in_(idea_ids)).order_by(Report.created_at)
+        ).mappings():
+            reports.setdefault(row["idea_id"], []).append(
+                {key: value for key, value in row.items() if key not in DERIVED_REPORT_COLUMNS}
+            )
+        self.db.rollback()
+
+        archived_at = datetime.utcnow()
+        with open(path, "ab") as raw:
+            with gzip.GzipFile(fileobj=raw, mode="wb") as archive:
+                for idea in ideas:
+                    record = {
+                        "archived_at": archived_at,
+                        "idea": dict(idea),
+                        "analysis": analyses.get(idea["id"]),
+                        "reports": reports.get(idea["id"], [])
+                    }
+                    line = json.dumps(record, ensure_ascii=False, default=_json_default)
+                    archive.write(line.encode("utf-8") + b"\n")
+            raw.flush()
+            os.fsync(raw.fileno())
+
+    def _delete(self, idea_ids: List[UUID]) -> int:
+        """
+        아이디어와 하위 행을 한 트랜잭션으로 삭제 (삭제된 아이디어 수)
+        하위 행은 여전히 삭제 대상인 아이디어에 대해서만 삭제한다.
+        """
+        targets = (
+            select(Idea.id)
+            .where(Idea.id.in_(idea_ids), Idea.deleted_at.is_not(None), Idea.deleted_at < self.cutoff)
+            .scalar_subquery()
+        )
+        for model in (Report, Analysis, Job):
+            self.db.execute(
+                delete(model).where(model.idea_id.in_(targets)).execution_options(synchronize_session=False)
+            )
+        result = self.db.execute(
+            delete(Idea)
+            .where(Idea.id.in_(idea_ids), Idea.deleted_at.is_not(None), Idea.deleted_at < self.cutoff)
+            .execution_options(synchronize_session=False)
+        )
+        self.db.commit()
+        return result.rowcount
+
+    def _load_checkpoint(self) -> Dict[str, Any]:
+        path = self.archive_dir / CHECKPOINT_FILE
+        if not path.exists():
+            return {}
+        return json.loads(path.read_text(encoding="utf-8"))
+
+    def _save_checkpoint(
+        self,
+        checkpoint: Dict[str, Any],
+        pending: Optional[Dict[str, Any]],
+        deleted: int = 0
+    ) -> Dict[str, Any]:
+        """체크포인트를 임시 파일에 쓴 뒤 교체 (중간에 중단되어도 이전 내용 유지)"""
+        checkpoint = {
+            **checkpoint,
+            "pending": pending,
+            "deleted": checkpoint.get("deleted", 0) + deleted,
+            "updated_at": datetime.utcnow().isoformat()
+        }
+        path = self.archive_dir / CHECKPOINT_FILE
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(checkpoint), encoding="utf-8")
+        os.replace(tmp, path)
+        return checkpoint
+
+
+def schedule_retention(db: Session, delay: float = 0, current_job_id: Optional[UUID] = None) -> bool:
+    """
+    보관/삭제 작업 예약 (대기 중이거나 실행 중인 작업이 이미 있으면 건너뜀)
+    실행 중인 작업은 끝날 때 current_job_id로 자신을 제외하고 다음 실행을 예약한다.
+    """
+    query = db.query(Job.id).filter(
+        Job.kind == JobKind.PURGE_DELETED.value,
+        Job.status.in_([JobStatus.QUEUED, JobStatus.RUNNING])
+    )
+    if current_job_id is not None:
+        query = query.filter(Job.id != current_job_id)
+    if query.first() is not None:
+        return False
+
+    JobQueue(db).enqueue(
+        JobKind.PURGE_DELETED.value,
+        run_after=datetime.utcnow() + timedelta(seconds=delay),
+        max_attempts=1
+    )
+    db.commit()
+    return True
@@ -23,6 +23,9 @@ export const API_ENDPOINTS = {
     COLLECT: (id: string) => `/api/v1/ideas/${id}/collect`,
     COLLECT_STATUS: (id: string) => `/api/v1/ideas/${id}/collect/status`,
 
+    // 상태 스트림 (SSE)
+    EVENTS: (id: string) => `/api/v1/ideas/${id}/events`,
+
     // 분석
     ANALYZE: (id: string) => `/api/v1/ideas/${id}/analyze`,
     ANALYSIS: (id: string) => `/api/v1/ideas/${id}/analysis`,
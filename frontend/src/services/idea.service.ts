@@ -1,5 +1,5 @@
 import { apiClient } from '@/utils/axios';
-import { API_ENDPOINTS } from '@/constants/api';
+import { API_BASE_URL, API_ENDPOINTS } from '@/constants/api';
 import type {
   Idea,
   CreateIdeaRequest,
@@ -7,8 +7,16 @@ import type {
   CollectionStatus,
   AnalysisResult,
   Report,
+  StatusEvent,
 } from '@/types';
 
+const STATUS_EVENT_TYPES: StatusEvent['type'][] = [
+  'idea.status',
+  'analysis.status',
+  'report.status',
+  'collection.progress',
+];
+
 export class IdeaService {
   /**
    * 아이디어 목록 조회
@@ -75,6 +83,21 @@ export class IdeaService {
     return response.data;
   }
 
+  /**
+   * 상태 변경 구독 (SSE)
+   * 반환된 함수를 호출하면 구독을 종료합니다.
+   */
+  subscribeStatus(id: string, onEvent: (event: StatusEvent) => void): () => void {
+    const accessToken = localStorage.getItem('access_token') ?? '';
+    const url = `${API_BASE_URL}${API_ENDPOINTS.IDEAS.EVENTS(id)}?access_token=${encodeURIComponent(accessToken)}`;
+    const source = new EventSource(url);
+
+    const handler = (message: MessageEvent) => onEvent(JSON.parse(message.data));
+    STATUS_EVENT_TYPES.forEach((type) => source.addEventListener(type, handler));
+
+    return () => source.close();
+  }
+
   /**
    * 분석 시작
    */
@@ -86,6 +86,18 @@ export interface CollectionStatus {
   progress?: number;
 }
 
+// 상태 변경 이벤트 타입 (SSE)
+export interface StatusEvent {
+  type: 'idea.status' | 'analysis.status' | 'report.status' | 'collection.progress';
+  idea_id: string;
+  id: string;
+  status: string;
+  timestamp: string;
+  report_type?: string;
+  completed_tasks?: string[];
+  failed_tasks?: string[];
+}
+
 // 분석 결과 타입
 export interface AnalysisResult {
   idea_id: string;